@@ -1,9 +1,13 @@
 import sys
 from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QPalette, QColor, QIcon
 from main_window import MainWindow
 
 if __name__ == "__main__":
+    # QtWebEngine is imported lazily by the visualization page, which Qt only
+    # allows when OpenGL contexts are shared from the start
+    QApplication.setAttribute(Qt.ApplicationAttribute.AA_ShareOpenGLContexts)
     app = QApplication(sys.argv)
     app.setStyle('Fusion')
 
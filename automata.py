@@ -0,0 +1,399 @@
+"""Headless command-line interface to the automata operations.
+
+    python -m automata check saved_automatas/
+    python -m automata list saved_automatas/ --deterministic --alphabet 0,1
+    python -m automata minimize saved_automatas/ -o minimized/ --jobs 8
+    python -m automata union A.json B.json -o union.json
+    python -m automata equivalent A.json B.json
+    python -m automata accept A.json 0101 001 --words-file words.txt
+    python -m automata convert huge.json -o huge.fab
+    python -m automata hash saved_automatas/ --jobs 8
+    python -m automata dedup saved_automatas/ --near 6 --max-difference 2
+    python -m automata export saved_automatas/ -o figures/ --format svg --format pdf --jobs 8
+
+Inputs may be automaton JSON or binary (.fab) files, or directories of them; outputs
+ending in .fab are written in the binary format. Only automata_operations is
+imported, never PyQt6, so the CLI runs in CI without a display server.
+Exit status: 0 on success, 1 when automata are not equivalent or a word is rejected,
+2 on errors.
+"""
+import argparse
+import json
+import os
+import sqlite3
+import sys
+from contextlib import contextmanager
+from typing import Optional
+
+from automata_operations import BINARY_EXTENSION, Automaton, AutomatonLike, AutomataAnalyzer, AutomataManager, CompiledAutomaton, WordProcessor
+
+
+def expand_inputs(paths):
+    """Automaton files named on the command line, with directories expanded to their .json and .fab files"""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(os.path.join(path, name) for name in sorted(os.listdir(path))
+                         if name.endswith(('.json', BINARY_EXTENSION)))
+        else:
+            files.append(path)
+    return files
+
+
+def load(path: str) -> AutomatonLike:
+    """Load an automaton file. Binary files are memory-mapped and large JSON files streamed,
+    both in compiled form."""
+    directory, filename = os.path.split(os.path.abspath(path))
+    manager = AutomataManager(automata_dir=directory)
+    if filename.endswith(BINARY_EXTENSION) or os.path.getsize(path) >= AutomataManager.STREAMING_THRESHOLD:
+        return manager.load_compiled(filename)
+    return manager.load_automaton(filename, preview=True)
+
+
+@contextmanager
+def loaded(path: str):
+    """load(path), closing a memory-mapped automaton on exit. Anything derived from it
+    must be written or printed inside the block, since it may share the mapped arrays."""
+    automaton = load(path)
+    try:
+        yield automaton
+    finally:
+        if isinstance(automaton, CompiledAutomaton):
+            automaton.close()
+
+
+def write(automaton: AutomatonLike, output: str, format: Optional[str] = None):
+    """Write the automaton to output, or as JSON to stdout when output is "-".
+    format is 'json' or 'fab' (binary); by default outputs ending in .fab are written in
+    the binary format, others as JSON."""
+    if format == 'fab' or (format is None and output.endswith(BINARY_EXTENSION)):
+        if output == '-':
+            raise ValueError("Binary automata cannot be written to stdout")
+        from binary_format import BinaryFormat
+        BinaryFormat.write(CompiledAutomaton.of(automaton), output)
+        return
+    if isinstance(automaton, CompiledAutomaton):
+        automaton = automaton.to_automaton()
+    data = AutomataManager.automaton_to_dict(automaton)
+    if output == '-':
+        json.dump(data, sys.stdout, indent=4)
+        sys.stdout.write('\n')
+        return
+    with open(output, 'w') as f:
+        json.dump(data, f, indent=4)
+
+
+def describe(automaton) -> str:
+    compiled = CompiledAutomaton.of(automaton)
+    kind = "DFA" if compiled.is_deterministic() else "NFA"
+    return (f"{compiled.name}: {compiled.num_states} states, {compiled.num_symbols} symbols, "
+            f"{kind}, {'complete' if compiled.is_complete() else 'incomplete'}")
+
+
+def complete_dfa(automaton: AutomatonLike) -> AutomatonLike:
+    """Determinize and complete an automaton when needed, keeping its representation"""
+    if not AutomataAnalyzer.is_deterministic(automaton):
+        automaton = AutomataAnalyzer.nfa_to_dfa(automaton)
+    if not AutomataAnalyzer.is_complete(automaton):
+        completed = CompiledAutomaton.of(automaton).with_sink()
+        automaton = completed if isinstance(automaton, CompiledAutomaton) else completed.to_automaton()
+    return automaton
+
+
+def complement(automaton: AutomatonLike) -> AutomatonLike:
+    """Complement of any automaton: determinize and complete it first when needed"""
+    return AutomataAnalyzer.compute_complement(complete_dfa(automaton))
+
+
+def minimize(automaton: AutomatonLike) -> AutomatonLike:
+    """Minimal DFA of any automaton"""
+    return AutomataAnalyzer.minimize_dfa(complete_dfa(automaton))
+
+
+def convert(automaton: AutomatonLike) -> AutomatonLike:
+    """The automaton itself, to be written in another format"""
+    return automaton
+
+
+UNARY_OPERATIONS = {
+    'determinize': AutomataAnalyzer.nfa_to_dfa,
+    'minimize': minimize,
+    'complement': complement,
+    'convert': convert,
+}
+
+
+def run_unary(args) -> int:
+    files = expand_inputs(args.inputs)
+    if not files:
+        raise ValueError("No automaton files found")
+    # Several inputs, or an output naming a directory, give one file per input in that directory
+    to_directory = args.output not in (None, '-') and (
+        len(files) > 1 or os.path.isdir(args.output) or args.output.endswith(('/', os.sep)))
+    if to_directory:
+        os.makedirs(args.output, exist_ok=True)
+    status = 0
+
+    def report(path, result, error):
+        nonlocal status
+        if error is not None:
+            print(f"{path}: error: {error}", file=sys.stderr)
+            status = 2
+        elif not args.output:
+            print(f"{path} -> {describe(result)}")
+        elif to_directory:
+            filename = os.path.basename(path)
+            if args.format:
+                filename = os.path.splitext(filename)[0] + ('.json' if args.format == 'json' else BINARY_EXTENSION)
+            write(result, os.path.join(args.output, filename), args.format)
+        else:
+            write(result, args.output, args.format)
+
+    if args.jobs > 1 and len(files) > 1:
+        from parallel_analyzer import ParallelAnalyzer
+        with ParallelAnalyzer(max_workers=args.jobs) as analyzer:
+            for path, result, error in analyzer.map_files(UNARY_OPERATIONS[args.command], files):
+                report(path, result, error)
+    else:
+        for path in files:
+            try:
+                with loaded(path) as automaton:
+                    result = UNARY_OPERATIONS[args.command](automaton)
+                    # Written before the input is closed: convert returns the input itself
+                    report(path, result, None)
+            except Exception as e:
+                report(path, None, str(e))
+    return status
+
+
+def run_check(args) -> int:
+    status = 0
+    for path in expand_inputs(args.inputs):
+        try:
+            with loaded(path) as automaton:
+                line = f"{path}: {describe(automaton)}"
+                if AutomataAnalyzer.is_deterministic(automaton):
+                    line += ", minimal" if AutomataAnalyzer.is_minimal_dfa(automaton)[0] else ", not minimal"
+        except ValueError as e:
+            print(f"{path}: error: {e}", file=sys.stderr)
+            status = 2
+            continue
+        print(line)
+    return status
+
+
+def run_hash(args) -> int:
+    """Print the canonical language hash of each automaton, like sha256sum"""
+    files = expand_inputs(args.inputs)
+    kwargs = {}
+    if args.alphabet is not None:
+        kwargs['alphabet'] = [symbol for symbol in args.alphabet.split(',') if symbol]
+    if args.jobs > 1 and len(files) > 1:
+        from parallel_analyzer import ParallelAnalyzer
+        with ParallelAnalyzer(max_workers=args.jobs) as analyzer:
+            results = list(analyzer.map_files('canonical_hash', files, **kwargs))
+    else:
+        results = []
+        for path in files:
+            try:
+                with loaded(path) as automaton:
+                    results.append((path, AutomataAnalyzer.canonical_hash(automaton, **kwargs), None))
+            except Exception as e:
+                results.append((path, None, str(e)))
+    status = 0
+    for path, digest, error in results:
+        if error is not None:
+            print(f"{path}: error: {error}", file=sys.stderr)
+            status = 2
+        else:
+            print(f"{digest}  {path}")
+    return status
+
+
+def run_dedup(args) -> int:
+    """Report the files of a directory accepting the same or nearly the same language"""
+    from automata_dedup import AutomataDeduplicator
+    dedup = AutomataDeduplicator(args.directory, max_workers=args.jobs)
+
+    def progress(done, pending):
+        if done % 100 == 0 or not pending:
+            print(f"\rhashed {done:,} of {done + pending:,} files", end='', file=sys.stderr, flush=True)
+
+    if dedup.refresh(length=args.near, progress=progress):
+        print(file=sys.stderr)
+    for filename, error in sorted(dedup.errors().items()):
+        print(f"{filename}: error: {error}", file=sys.stderr)
+    groups = dedup.clusters(args.near, args.max_difference) if args.near is not None else dedup.duplicates()
+    for files in groups:
+        print(' '.join(files))
+    if args.near is not None:
+        for first, second, difference in dedup.near_duplicates(args.near, args.max_difference):
+            print(f"{first} ~ {second}: {difference} word(s) of length <= {args.near} differ")
+    return 0
+
+
+def run_export(args) -> int:
+    """Render automaton files to SVG, PNG or PDF files, skipping those exported unchanged"""
+    from visualization_export import VisualizationExporter
+    exporter = VisualizationExporter(args.output, formats=args.format or ['svg'], max_workers=args.jobs,
+                                     timeout=args.timeout)
+    status = skipped = 0
+    for path, outputs, error in exporter.export(expand_inputs(args.inputs), force=args.force):
+        if error is not None:
+            print(f"{path}: error: {error}", file=sys.stderr)
+            status = 2
+        elif outputs:
+            print(f"{path} -> {' '.join(outputs)}")
+        else:
+            skipped += 1
+    if skipped:
+        print(f"{skipped} file(s) up to date", file=sys.stderr)
+    return status
+
+
+def run_list(args) -> int:
+    """List the catalogued automata of a directory matching the filters"""
+    manager = AutomataManager(automata_dir=args.directory)
+    filters = {'deterministic': args.deterministic, 'complete': args.complete, 'minimal': args.minimal,
+               'name_contains': args.name, 'max_states': args.max_states}
+    if args.alphabet is not None:
+        filters['alphabet'] = [symbol for symbol in args.alphabet.split(',') if symbol]
+    for filename in manager.list_saved_automata(**filters):
+        entry = manager.catalog.get(filename)
+        if entry['error']:
+            print(f"{filename}\terror: {entry['error']}")
+        else:
+            print(f"{filename}\t{entry['num_states']} states\t{{{','.join(entry['alphabet'])}}}")
+    return 0
+
+
+def run_binary(args) -> int:
+    with loaded(args.first) as first, loaded(args.second) as second:
+        if args.command == 'equivalent':
+            equivalent, counterexample = AutomataAnalyzer.are_equivalent(first, second)
+            if equivalent:
+                print("equivalent")
+                return 0
+            accepted_by = first.name if WordProcessor.accepts_word(first, counterexample) else second.name
+            print(f"not equivalent: {counterexample!r} is accepted only by {accepted_by}")
+            return 1
+        operation = AutomataAnalyzer.compute_union if args.command == 'union' else AutomataAnalyzer.compute_intersection
+        result = operation(first, second, minimize=args.minimize)
+        if args.output:
+            write(result, args.output)
+        else:
+            print(describe(result))
+    return 0
+
+
+def run_accept(args) -> int:
+    with loaded(args.automaton) as automaton:
+        compiled = CompiledAutomaton.of(automaton)
+        results = WordProcessor.accepts_words(compiled, args.words)
+        all_accepted = all(results)
+        for word, accepted in zip(args.words, results):
+            print(f"{'accept' if accepted else 'reject'}\t{word}")
+        if args.words_file:
+            # Streamed: only the results are held, the words are read again to print them
+            results = WordProcessor.accepts_words_from_file(compiled, args.words_file)
+            all_accepted = all_accepted and all(results)
+            with open(args.words_file, encoding='utf-8') as f:
+                for line, accepted in zip(f, results):
+                    word = line.rstrip('\r\n')
+                    print(f"{'accept' if accepted else 'reject'}\t{word}")
+    return 0 if all_accepted else 1
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='python -m automata', description="Finite automata operations without the GUI")
+    parser.add_argument('--cache', metavar='PATH',
+                        help="SQLite file caching derived automata (DFAs, minimal DFAs, products) across runs")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    check = commands.add_parser('check', help="validate automaton files and report their properties")
+    check.add_argument('inputs', nargs='+', help="automaton files or directories")
+    check.set_defaults(run=run_check)
+
+    listing = commands.add_parser('list', help="list catalogued automata of a directory, optionally filtered")
+    listing.add_argument('directory')
+    for flag in ('deterministic', 'complete', 'minimal'):
+        listing.add_argument(f'--{flag}', action=argparse.BooleanOptionalAction, default=None)
+    listing.add_argument('--alphabet', help="exact alphabet as comma-separated symbols, e.g. 0,1")
+    listing.add_argument('--name', help="substring of the automaton name")
+    listing.add_argument('--max-states', type=int)
+    listing.set_defaults(run=run_list)
+
+    for name, help_text in (('determinize', "convert NFAs to DFAs"),
+                            ('minimize', "compute minimal DFAs"),
+                            ('complement', "compute complements (determinizing and completing first)"),
+                            ('convert', "convert between JSON and binary (.fab) automaton files")):
+        command = commands.add_parser(name, help=help_text)
+        command.add_argument('inputs', nargs='+', help="automaton files or directories")
+        command.add_argument('-o', '--output', help="output file, directory for several inputs, or - for stdout")
+        command.add_argument('-j', '--jobs', type=int, default=1, help="worker processes for several inputs")
+        command.add_argument('--format', choices=('json', 'fab'),
+                             help="format of the files written (default: from the output file's extension, "
+                                  "or that of each input in an output directory)")
+        command.set_defaults(run=run_unary)
+
+    hashing = commands.add_parser('hash', help="print a hash of the language of each automaton (equal hashes mean "
+                                               "equal languages over the same alphabet)")
+    hashing.add_argument('inputs', nargs='+', help="automaton files or directories")
+    hashing.add_argument('--alphabet', help="hash the languages over this alphabet (comma-separated symbols), "
+                                            "to compare automata with different alphabets")
+    hashing.add_argument('-j', '--jobs', type=int, default=1, help="worker processes for several inputs")
+    hashing.set_defaults(run=run_hash)
+
+    dedup = commands.add_parser('dedup', help="group the automata of a directory by language (resumable)")
+    dedup.add_argument('directory')
+    dedup.add_argument('--near', type=int, metavar='N',
+                       help="also link languages differing on few words of length up to N")
+    dedup.add_argument('--max-difference', type=int, default=1,
+                       help="words in the symmetric difference allowed for --near (default: 1)")
+    dedup.add_argument('-j', '--jobs', type=int, help="worker processes (default: one per CPU)")
+    dedup.set_defaults(run=run_dedup)
+
+    export = commands.add_parser('export', help="render automata to SVG, PNG or PDF files, skipping those "
+                                                "already exported from the same content")
+    export.add_argument('inputs', nargs='+', help="automaton files or directories")
+    export.add_argument('-o', '--output', required=True, help="output directory")
+    export.add_argument('-f', '--format', action='append', choices=('svg', 'png', 'pdf'),
+                        help="output format, may be repeated (default: svg)")
+    export.add_argument('--force', action='store_true', help="render every file, even unchanged ones")
+    export.add_argument('--timeout', type=float, default=60.0, help="seconds allowed per layout (default: 60)")
+    export.add_argument('-j', '--jobs', type=int, help="worker processes (default: one per CPU)")
+    export.set_defaults(run=run_export)
+
+    for name, help_text in (('union', "compute the union of two automata"),
+                            ('intersection', "compute the intersection of two automata"),
+                            ('equivalent', "check whether two automata accept the same language")):
+        command = commands.add_parser(name, help=help_text)
+        command.add_argument('first')
+        command.add_argument('second')
+        if name != 'equivalent':
+            command.add_argument('-o', '--output', help="output file, or - for stdout")
+            command.add_argument('--minimize', action='store_true', help="minimize the result")
+        command.set_defaults(run=run_binary)
+
+    accept = commands.add_parser('accept', help="test words against an automaton")
+    accept.add_argument('automaton')
+    accept.add_argument('words', nargs='*', help="words to test (use '' for the empty word)")
+    accept.add_argument('--words-file', help="file with one word per line")
+    accept.set_defaults(run=run_accept)
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    try:
+        if args.cache:
+            from result_cache import ResultCache
+            AutomataAnalyzer.result_cache = ResultCache(args.cache)
+        return args.run(args)
+    except (ValueError, OSError, sqlite3.Error) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,130 @@
+import json
+import os
+import sqlite3
+from array import array
+from typing import Dict, Iterable, List, Optional
+
+from automata_operations import BINARY_EXTENSION, AutomataAnalyzer, AutomataManager
+
+CATALOG_FILENAME = ".catalog.sqlite"
+
+
+class AutomataCatalog:
+    """SQLite index of the automaton files in a directory.
+
+    Each .json and .fab file gets a row with its name, state/symbol/transition counts, alphabet,
+    determinism, completeness, minimality (DFAs only), structural fingerprint and the
+    modification time and size it was indexed at. refresh() only re-parses files whose
+    mtime or size changed, so listing and filtering a large library does not load it.
+    Files that fail to load are kept with their error message and NULL properties.
+    """
+    def __init__(self, automata_dir: str, db_path: Optional[str] = None):
+        self.automata_dir = automata_dir
+        self.db_path = db_path or os.path.join(automata_dir, CATALOG_FILENAME)
+        self._init_db()
+
+    def _init_db(self):
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute('''CREATE TABLE IF NOT EXISTS automata
+                         (filename TEXT PRIMARY KEY,
+                          name TEXT,
+                          num_states INTEGER,
+                          num_symbols INTEGER,
+                          num_transitions INTEGER,
+                          alphabet TEXT,
+                          is_deterministic BOOLEAN,
+                          is_complete BOOLEAN,
+                          is_minimal BOOLEAN,
+                          content_hash TEXT,
+                          mtime_ns INTEGER NOT NULL,
+                          size INTEGER NOT NULL,
+                          error TEXT)''')
+            conn.execute('CREATE INDEX IF NOT EXISTS automata_by_alphabet ON automata (alphabet, is_deterministic)')
+            conn.execute('CREATE INDEX IF NOT EXISTS automata_by_hash ON automata (content_hash)')
+            conn.commit()
+
+    @staticmethod
+    def alphabet_key(alphabet: Iterable[str]) -> str:
+        """Canonical text form of an alphabet as stored in the alphabet column"""
+        return json.dumps(sorted(alphabet))
+
+    def describe_file(self, filename: str, mtime_ns: int, size: int) -> tuple:
+        """Catalog row for a file, analyzing the automaton it contains"""
+        try:
+            compiled = AutomataManager(automata_dir=self.automata_dir).load_compiled(filename)
+        except ValueError as e:
+            return (filename, None, None, None, None, None, None, None, None, None, mtime_ns, size, str(e))
+        with compiled:
+            deterministic = compiled.is_deterministic()
+            minimal = AutomataAnalyzer.is_minimal_dfa(compiled)[0] if deterministic else None
+            if compiled.table is not None:
+                num_transitions = len(compiled.table) - array('i', compiled.table).count(-1)
+            else:
+                num_transitions = len(compiled.targets)
+            return (filename, compiled.name, compiled.num_states, compiled.num_symbols, num_transitions,
+                    self.alphabet_key(compiled.symbols), deterministic, compiled.is_complete(), minimal,
+                    compiled.fingerprint(), mtime_ns, size, None)
+
+    def refresh(self) -> int:
+        """Index new and modified files and drop deleted ones. Returns the number of files (re)indexed."""
+        on_disk = {}
+        if os.path.isdir(self.automata_dir):
+            with os.scandir(self.automata_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(('.json', BINARY_EXTENSION)) and entry.is_file():
+                        stat = entry.stat()
+                        on_disk[entry.name] = (stat.st_mtime_ns, stat.st_size)
+        with sqlite3.connect(self.db_path) as conn:
+            known = {filename: (mtime_ns, size) for filename, mtime_ns, size
+                     in conn.execute('SELECT filename, mtime_ns, size FROM automata')}
+            removed = [(filename,) for filename in known if filename not in on_disk]
+            changed = sorted(filename for filename, stamp in on_disk.items() if known.get(filename) != stamp)
+            conn.executemany('DELETE FROM automata WHERE filename = ?', removed)
+            conn.executemany('INSERT OR REPLACE INTO automata VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                             (self.describe_file(filename, *on_disk[filename]) for filename in changed))
+            conn.commit()
+        return len(changed)
+
+    def list_files(self, deterministic: Optional[bool] = None, complete: Optional[bool] = None,
+                   minimal: Optional[bool] = None, alphabet: Optional[Iterable[str]] = None,
+                   name_contains: Optional[str] = None, max_states: Optional[int] = None) -> List[str]:
+        """Filenames of the indexed automata matching every given filter, sorted by filename.
+        Call refresh() first to pick up changes on disk."""
+        clauses, params = [], []
+        for column, value in (('is_deterministic', deterministic), ('is_complete', complete),
+                              ('is_minimal', minimal)):
+            if value is not None:
+                clauses.append(f'{column} = ?')
+                params.append(value)
+        if alphabet is not None:
+            clauses.append('alphabet = ?')
+            params.append(self.alphabet_key(alphabet))
+        if name_contains:
+            clauses.append("instr(lower(name), lower(?)) > 0")
+            params.append(name_contains)
+        if max_states is not None:
+            clauses.append('num_states <= ?')
+            params.append(max_states)
+        query = 'SELECT filename FROM automata'
+        if clauses:
+            query += ' WHERE ' + ' AND '.join(clauses)
+        with sqlite3.connect(self.db_path) as conn:
+            return [row[0] for row in conn.execute(query + ' ORDER BY filename', params)]
+
+    def get(self, filename: str) -> Optional[Dict]:
+        """Catalog entry of a file as a dict, or None if it is not indexed"""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.row_factory = sqlite3.Row
+            row = conn.execute('SELECT * FROM automata WHERE filename = ?', (filename,)).fetchone()
+        if row is None:
+            return None
+        entry = dict(row)
+        if entry['alphabet'] is not None:
+            entry['alphabet'] = json.loads(entry['alphabet'])
+        return entry
+
+    def find_by_hash(self, content_hash: str) -> List[str]:
+        """Filenames of the automata with the given structural fingerprint"""
+        with sqlite3.connect(self.db_path) as conn:
+            return [row[0] for row in conn.execute(
+                'SELECT filename FROM automata WHERE content_hash = ? ORDER BY filename', (content_hash,))]
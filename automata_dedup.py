@@ -0,0 +1,271 @@
+import json
+import os
+import sqlite3
+from typing import Dict, List, Optional, Tuple
+
+from automata_operations import (BINARY_EXTENSION, AutomataAnalyzer, AutomataManager, AutomatonLike,
+                                 CompiledAutomaton)
+from automata_catalog import CATALOG_FILENAME
+from result_cache import ResultCache
+
+# Signatures cover at most this many words (8 KiB per language)
+MAX_SIGNATURE_WORDS = 1 << 16
+
+
+def language_signature(canonical: CompiledAutomaton, length: int) -> int:
+    """Acceptance bits of every word of length 0 to length over the sorted alphabet, in
+    shortlex order (bit i for the i-th word). The number of differing bits between two
+    signatures is the size of the symmetric difference of the languages up to that length."""
+    k = canonical.num_symbols
+    num_words = sum(k ** n for n in range(length + 1))
+    if num_words > MAX_SIGNATURE_WORDS:
+        raise ValueError(f"Too many words up to length {length} over {k} symbols for a signature")
+    table, finals = canonical.table, canonical.finals
+    level, bits = [canonical.initial], []
+    for n in range(length + 1):
+        bits.extend('1' if finals[state] else '0' for state in level)
+        if n < length:
+            level = [table[state * k + symbol] for state in level for symbol in range(k)]
+    return int(''.join(reversed(bits)), 2)
+
+
+def signature_bytes(canonical: CompiledAutomaton, length: int) -> bytes:
+    """language_signature as stored, empty when the alphabet has too many words up to length"""
+    num_words = sum(canonical.num_symbols ** n for n in range(length + 1))
+    if num_words > MAX_SIGNATURE_WORDS:
+        return b''
+    return language_signature(canonical, length).to_bytes((num_words + 7) // 8, 'little')
+
+
+def describe_language(automaton: AutomatonLike, length: Optional[int] = None) -> tuple:
+    """(canonical hash, alphabet, canonical states, signature bytes or None, encoded canonical
+    form) of an automaton. Module-level so that it can run in ParallelAnalyzer workers."""
+    canonical = CompiledAutomaton.of(AutomataAnalyzer.canonicalize(CompiledAutomaton.of(automaton)))
+    signature = signature_bytes(canonical, length) if length is not None else None
+    return (AutomataAnalyzer.canonical_digest(canonical), list(canonical.symbols), canonical.num_states,
+            signature, ResultCache.encode(canonical))
+
+
+class AutomataDeduplicator:
+    """Groups the automaton files of a directory by the language they accept.
+
+    refresh() computes the canonical hash (AutomataAnalyzer.canonical_hash) of every new
+    or modified file, in worker processes, and stores it in the directory's catalog
+    database. Results are committed as they arrive, so an interrupted run resumes where
+    it stopped. Files with equal hashes accept the same language (duplicates()).
+
+    Near-duplicates are languages over the same alphabet whose symmetric difference has
+    at most max_difference words of length up to n. Each language gets a signature of
+    its accepted words up to length n, computed from its canonical DFA, which is stored
+    too so that asking for another n does not load and canonicalize the files again. The
+    difference is then a Hamming distance; pairs
+    are found by splitting signatures into max_difference + 1 bands, of which two close
+    signatures must share at least one, and checking only the pairs that do.
+
+        dedup = AutomataDeduplicator("saved_automatas")
+        dedup.refresh(length=6)
+        dedup.duplicates(), dedup.near_duplicates(6, max_difference=2)
+    """
+    COMMIT_EVERY = 100
+
+    def __init__(self, automata_dir: str, db_path: Optional[str] = None, max_workers: Optional[int] = None):
+        self.automata_dir = automata_dir
+        self.db_path = db_path or os.path.join(automata_dir, CATALOG_FILENAME)
+        self.max_workers = max_workers
+        self._init_db()
+
+    def _init_db(self):
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute('''CREATE TABLE IF NOT EXISTS languages
+                         (filename TEXT PRIMARY KEY,
+                          canonical_hash TEXT,
+                          alphabet TEXT,
+                          canonical_states INTEGER,
+                          mtime_ns INTEGER NOT NULL,
+                          size INTEGER NOT NULL,
+                          error TEXT)''')
+            conn.execute('CREATE INDEX IF NOT EXISTS languages_by_hash ON languages (canonical_hash)')
+            conn.execute('''CREATE TABLE IF NOT EXISTS signatures
+                         (canonical_hash TEXT NOT NULL,
+                          length INTEGER NOT NULL,
+                          bits BLOB NOT NULL,
+                          PRIMARY KEY (canonical_hash, length))''')
+            conn.execute('''CREATE TABLE IF NOT EXISTS canonical_forms
+                         (canonical_hash TEXT PRIMARY KEY,
+                          data BLOB NOT NULL)''')
+            conn.commit()
+
+    def _files_on_disk(self) -> Dict[str, Tuple[int, int]]:
+        on_disk = {}
+        if os.path.isdir(self.automata_dir):
+            with os.scandir(self.automata_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(('.json', BINARY_EXTENSION)) and entry.is_file():
+                        stat = entry.stat()
+                        on_disk[entry.name] = (stat.st_mtime_ns, stat.st_size)
+        return on_disk
+
+    def refresh(self, length: Optional[int] = None, progress=None) -> int:
+        """Hash new and modified files and drop deleted ones; with length, also compute the
+        signatures needed by near_duplicates(length, ...). Returns the number of files loaded;
+        signatures of languages already hashed are computed from their stored canonical form.
+        progress(done, pending) is called after each file and may raise to stop; the files
+        done so far are kept."""
+        on_disk = self._files_on_disk()
+        with sqlite3.connect(self.db_path) as conn:
+            known = {filename: (mtime_ns, size, canonical_hash, signed, stored) for
+                     filename, mtime_ns, size, canonical_hash, signed, stored in conn.execute(
+                '''SELECT filename, mtime_ns, size, canonical_hash,
+                          EXISTS (SELECT 1 FROM signatures s
+                                  WHERE s.canonical_hash = languages.canonical_hash AND s.length = ?),
+                          EXISTS (SELECT 1 FROM canonical_forms c WHERE c.canonical_hash = languages.canonical_hash)
+                   FROM languages''', (length if length is not None else -1,))}
+            conn.executemany('DELETE FROM languages WHERE filename = ?',
+                             [(filename,) for filename in known if filename not in on_disk])
+            conn.commit()
+        # Files that failed (NULL hash) are retried only once modified
+        stale, unsigned = [], set()
+        for filename in sorted(on_disk):
+            if filename not in known or known[filename][:2] != on_disk[filename]:
+                stale.append(filename)
+            elif length is not None and known[filename][2] is not None and not known[filename][3]:
+                # Only the signature is missing: computed from the stored canonical form if there is one
+                if known[filename][4]:
+                    unsigned.add(known[filename][2])
+                else:
+                    stale.append(filename)
+        with sqlite3.connect(self.db_path) as conn:
+            for canonical_hash in sorted(unsigned):
+                (data,) = conn.execute('SELECT data FROM canonical_forms WHERE canonical_hash = ?',
+                                       (canonical_hash,)).fetchone()
+                conn.execute('INSERT OR REPLACE INTO signatures VALUES (?, ?, ?)',
+                             (canonical_hash, length, signature_bytes(ResultCache.decode(data), length)))
+            conn.commit()
+        done = 0
+        results = self._describe_files(stale, length)
+        with sqlite3.connect(self.db_path) as conn:
+            try:
+                for filename, result, error in results:
+                    self._store(conn, filename, on_disk[filename], length, result, error)
+                    done += 1
+                    if done % self.COMMIT_EVERY == 0:
+                        conn.commit()
+                    if progress is not None:
+                        progress(done, len(stale) - done)
+            finally:
+                results.close()
+                conn.execute('''DELETE FROM canonical_forms WHERE canonical_hash NOT IN
+                                (SELECT canonical_hash FROM languages WHERE canonical_hash IS NOT NULL)''')
+                conn.commit()
+        return done
+
+    def _describe_files(self, filenames: List[str], length: Optional[int]):
+        """Yield (filename, describe_language result, error) for each file"""
+        paths = [os.path.join(self.automata_dir, filename) for filename in filenames]
+        if len(paths) > 1 and self.max_workers != 1:
+            from parallel_analyzer import ParallelAnalyzer
+            analyzer = ParallelAnalyzer(max_workers=self.max_workers)
+            try:
+                for path, result, error in analyzer.map_files(describe_language, paths, length=length):
+                    yield os.path.basename(path), result, error
+            finally:
+                # When stopped early, drop the queued files instead of waiting for them
+                analyzer.shutdown(wait=False)
+            return
+        manager = AutomataManager(automata_dir=self.automata_dir)
+        for filename in filenames:
+            try:
+                # Described before yielding, so a mapped file is not held open by the consumer
+                with manager.load_compiled(filename) as compiled:
+                    result = describe_language(compiled, length)
+            except Exception as e:
+                yield filename, None, str(e)
+                continue
+            yield filename, result, None
+
+    @staticmethod
+    def _store(conn, filename: str, stamp: Tuple[int, int], length: Optional[int], result, error):
+        if error is not None:
+            conn.execute('INSERT OR REPLACE INTO languages VALUES (?, NULL, NULL, NULL, ?, ?, ?)',
+                         (filename, *stamp, error))
+            return
+        canonical_hash, alphabet, num_states, signature, canonical_form = result
+        conn.execute('INSERT OR REPLACE INTO languages VALUES (?, ?, ?, ?, ?, ?, NULL)',
+                     (filename, canonical_hash, json.dumps(sorted(alphabet)), num_states, *stamp))
+        conn.execute('INSERT OR IGNORE INTO canonical_forms VALUES (?, ?)', (canonical_hash, canonical_form))
+        if signature is not None:
+            conn.execute('INSERT OR REPLACE INTO signatures VALUES (?, ?, ?)', (canonical_hash, length, signature))
+
+    def languages(self) -> Dict[str, List[str]]:
+        """Filenames per canonical hash, for the files hashed without error"""
+        groups: Dict[str, List[str]] = {}
+        with sqlite3.connect(self.db_path) as conn:
+            for filename, canonical_hash in conn.execute(
+                    'SELECT filename, canonical_hash FROM languages WHERE error IS NULL ORDER BY filename'):
+                groups.setdefault(canonical_hash, []).append(filename)
+        return groups
+
+    def duplicates(self) -> List[List[str]]:
+        """Groups of files accepting the same language, each sorted, largest groups first"""
+        groups = [files for files in self.languages().values() if len(files) > 1]
+        return sorted(groups, key=lambda files: (-len(files), files[0]))
+
+    def errors(self) -> Dict[str, str]:
+        """Error message per file that could not be hashed"""
+        with sqlite3.connect(self.db_path) as conn:
+            return dict(conn.execute('SELECT filename, error FROM languages WHERE error IS NOT NULL'))
+
+    def near_duplicates(self, length: int, max_difference: int) -> List[Tuple[str, str, int]]:
+        """Pairs of distinct languages over the same alphabet differing on at most
+        max_difference words of length up to length, as (file, other file, difference)
+        with the first file of each language. Languages over alphabets with more than
+        MAX_SIGNATURE_WORDS words up to length are left out. Call refresh(length) first."""
+        with sqlite3.connect(self.db_path) as conn:
+            rows = conn.execute('''SELECT l.canonical_hash, l.alphabet, s.bits, MIN(l.filename)
+                                   FROM languages l JOIN signatures s
+                                        ON s.canonical_hash = l.canonical_hash AND s.length = ?
+                                   WHERE l.error IS NULL AND length(s.bits) > 0
+                                   GROUP BY l.canonical_hash''', (length,)).fetchall()
+        bands = max_difference + 1
+        buckets: Dict[tuple, List[int]] = {}
+        signatures = []
+        for idx, (_, alphabet, bits, _) in enumerate(rows):
+            signature = int.from_bytes(bits, 'little')
+            signatures.append(signature)
+            num_bits = len(bits) * 8
+            for band in range(bands):
+                start, end = band * num_bits // bands, (band + 1) * num_bits // bands
+                value = (signature >> start) & ((1 << (end - start)) - 1)
+                buckets.setdefault((alphabet, band, value), []).append(idx)
+        pairs = set()
+        for members in buckets.values():
+            for position, first in enumerate(members):
+                for second in members[position + 1:]:
+                    pairs.add((first, second))
+        result = []
+        for first, second in pairs:
+            difference = bin(signatures[first] ^ signatures[second]).count("1")
+            if difference <= max_difference:
+                result.append((*sorted((rows[first][3], rows[second][3])), difference))
+        return sorted(result, key=lambda pair: (pair[2], pair[0], pair[1]))
+
+    def clusters(self, length: int, max_difference: int) -> List[List[str]]:
+        """Groups of files whose languages are equal or linked by chains of near-duplicates,
+        each sorted, largest groups first. Call refresh(length) first."""
+        languages = self.languages()
+        representative_of = {files[0]: canonical_hash for canonical_hash, files in languages.items()}
+        parent = {canonical_hash: canonical_hash for canonical_hash in languages}
+
+        def find(node):
+            while parent[node] != node:
+                parent[node] = parent[parent[node]]
+                node = parent[node]
+            return node
+
+        for first, second, _ in self.near_duplicates(length, max_difference):
+            parent[find(representative_of[first])] = find(representative_of[second])
+        groups: Dict[str, List[str]] = {}
+        for canonical_hash, files in languages.items():
+            groups.setdefault(find(canonical_hash), []).extend(files)
+        clusters = [sorted(files) for files in groups.values() if len(files) > 1]
+        return sorted(clusters, key=lambda files: (-len(files), files[0]))
@@ -1,7 +1,16 @@
-from typing import Dict, List, Set, Tuple, Optional
+from typing import Dict, Iterable, Iterator, List, Set, Tuple, Optional, Sequence, Union
 from dataclasses import dataclass
+from array import array
+from fractions import Fraction
+from itertools import islice
+import hashlib
 import json
 import os
+import sqlite3
+import sys
+
+# Extension of the memory-mapped binary automaton files written by binary_format.BinaryFormat
+BINARY_EXTENSION = ".fab"
 
 @dataclass
 class Automaton:
@@ -13,11 +22,468 @@ class Automaton:
     final_states: Set[str]
     name: str = "Untitled Automaton"
 
+class CompiledAutomaton:
+    """Integer-indexed form of an automaton used by the analysis engines.
+
+    States and symbols are interned to dense ints (both in sorted name order).
+    When every (state, symbol) pair has at most one target, transitions are kept
+    in ``table``, a flat states x symbols array where -1 marks a missing
+    transition. Otherwise they are kept in CSR layout: the targets of cell
+    ``state * num_symbols + symbol`` are ``targets[offsets[cell]:offsets[cell + 1]]``.
+    """
+    # NFAs with more states than this are simulated with NumPy bool vectors when NumPy is available
+    VECTOR_STATES_THRESHOLD = 1 << 16
+
+    def __init__(self, state_names: Sequence[str], symbols: Sequence[str], initial: int,
+                 finals: bytearray, table: Optional[Sequence[int]] = None,
+                 offsets: Optional[Sequence[int]] = None, targets: Optional[Sequence[int]] = None,
+                 name: str = "Untitled Automaton"):
+        if table is None and (offsets is None or targets is None):
+            raise ValueError("A compiled automaton needs either a table or CSR offsets and targets")
+        self.state_names = state_names
+        self.symbols = symbols
+        self.initial = initial
+        self.finals = finals  # finals[state] == 1 if the state is final
+        self.table = table
+        self._offsets = offsets
+        self._targets = targets
+        self.name = name
+        self.num_states = len(state_names)
+        self.num_symbols = len(symbols)
+        self.symbol_index = {symbol: idx for idx, symbol in enumerate(symbols)}
+        self._state_index = None
+        # binary_format.MappedFile the arrays are views of, for automata mapped from .fab files
+        self.mapping = None
+
+    def __enter__(self) -> "CompiledAutomaton":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Unmap the file a memory-mapped automaton was loaded from; the automaton can no
+        longer be used afterwards. Does nothing for other automata."""
+        if self.mapping is not None:
+            self.mapping.close()
+            self.mapping = None
+
+    @staticmethod
+    def of(automaton: Union[Automaton, "CompiledAutomaton"]) -> "CompiledAutomaton":
+        """Return the compiled form of the automaton, compiling it if needed"""
+        if isinstance(automaton, CompiledAutomaton):
+            return automaton
+        return CompiledAutomaton.from_automaton(automaton)
+
+    @staticmethod
+    def from_automaton(automaton: Automaton) -> "CompiledAutomaton":
+        """Intern the states and symbols of an Automaton and pack its transitions"""
+        state_names = sorted(automaton.states)
+        state_index = {state: idx for idx, state in enumerate(state_names)}
+        symbols = sorted(automaton.alphabet)
+        symbol_index = {symbol: idx for idx, symbol in enumerate(symbols)}
+        k = len(symbols)
+        if automaton.initial_state not in state_index:
+            raise ValueError("Initial state must be in states set")
+
+        # Group target ids per (state, symbol) cell
+        cells = {}
+        deterministic = True
+        for (state, symbol), targets in automaton.transitions.items():
+            if not targets:
+                continue
+            if state not in state_index:
+                raise ValueError(f"Invalid source state in transition: {state}")
+            if symbol not in symbol_index:
+                raise ValueError(f"Invalid symbol in transition: {symbol}")
+            try:
+                cells[state_index[state] * k + symbol_index[symbol]] = sorted(state_index[t] for t in targets)
+            except KeyError:
+                raise ValueError(f"Invalid target state(s) in transition from {state} on {symbol}")
+            if len(targets) > 1:
+                deterministic = False
+
+        finals = bytearray(len(state_names))
+        for state in automaton.final_states:
+            if state not in state_index:
+                raise ValueError("Final states must be a subset of states")
+            finals[state_index[state]] = 1
+
+        compiled = CompiledAutomaton(
+            state_names=state_names,
+            symbols=symbols,
+            initial=state_index[automaton.initial_state],
+            finals=finals,
+            table=array('i', [-1]) * (len(state_names) * k) if deterministic else None,
+            offsets=None if deterministic else array('i', [0]) * (len(state_names) * k + 1),
+            targets=None if deterministic else array('i'),
+            name=automaton.name
+        )
+        compiled._state_index = state_index
+        if deterministic:
+            for cell, targets in cells.items():
+                compiled.table[cell] = targets[0]
+        else:
+            offsets, flat = compiled._offsets, compiled._targets
+            for cell in range(len(state_names) * k):
+                targets = cells.get(cell)
+                if targets:
+                    flat.extend(targets)
+                offsets[cell + 1] = len(flat)
+        return compiled
+
+    @staticmethod
+    def from_table(state_names: Sequence[str], symbols: Sequence[str], initial: int,
+                   finals: bytearray, table: Sequence[int], name: str = "Untitled Automaton") -> "CompiledAutomaton":
+        """Build a compiled DFA from a dense transition table"""
+        return CompiledAutomaton(state_names, symbols, initial, finals, table=table, name=name)
+
+    def to_automaton(self) -> Automaton:
+        """Convert back to the set-based Automaton dataclass.
+        Empty target sets are not represented and therefore not restored."""
+        names, symbols, k = self.state_names, self.symbols, self.num_symbols
+        transitions = {}
+        if self.table is not None:
+            for cell, target in enumerate(self.table):
+                if target >= 0:
+                    transitions[(names[cell // k], symbols[cell % k])] = {names[target]}
+        else:
+            offsets, targets = self._offsets, self._targets
+            for cell in range(self.num_states * k):
+                start, end = offsets[cell], offsets[cell + 1]
+                if start < end:
+                    transitions[(names[cell // k], symbols[cell % k])] = {names[t] for t in targets[start:end]}
+        return Automaton(
+            states=set(names),
+            alphabet=set(symbols),
+            transitions=transitions,
+            initial_state=names[self.initial],
+            final_states={names[q] for q in range(self.num_states) if self.finals[q]},
+            name=self.name
+        )
+
+    @property
+    def state_index(self) -> Dict[str, int]:
+        """Map from state name to state id, built on first use"""
+        if self._state_index is None:
+            self._state_index = {state: idx for idx, state in enumerate(self.state_names)}
+        return self._state_index
+
+    @property
+    def offsets(self) -> Sequence[int]:
+        if self._offsets is None:
+            self._build_csr()
+        return self._offsets
+
+    @property
+    def targets(self) -> Sequence[int]:
+        if self._targets is None:
+            self._build_csr()
+        return self._targets
+
+    def _build_csr(self):
+        """Derive the CSR layout from the dense table"""
+        offsets = array('i', [0]) * (len(self.table) + 1)
+        targets = array('i')
+        for cell, target in enumerate(self.table):
+            if target >= 0:
+                targets.append(target)
+            offsets[cell + 1] = len(targets)
+        self._offsets, self._targets = offsets, targets
+
+    def fingerprint(self) -> str:
+        """SHA-256 hex digest of the states, symbols, initial state, finals and transitions.
+        The automaton name is not part of the digest."""
+        digest = hashlib.sha256()
+        digest.update(json.dumps([list(self.state_names), list(self.symbols), self.initial]).encode())
+        digest.update(bytes(self.finals))
+        if self.table is not None:
+            digest.update(b'T' + array('i', self.table).tobytes())
+        else:
+            digest.update(b'C' + array('i', self._offsets).tobytes() + array('i', self._targets).tobytes())
+        return digest.hexdigest()
+
+    def successors(self, state: int, symbol: int) -> Sequence[int]:
+        """Target ids of the transition from state on symbol"""
+        cell = state * self.num_symbols + symbol
+        if self.table is not None:
+            target = self.table[cell]
+            return (target,) if target >= 0 else ()
+        return self._targets[self._offsets[cell]:self._offsets[cell + 1]]
+
+    def is_deterministic(self) -> bool:
+        """Exactly one target for every (state, symbol) pair"""
+        return self.table is not None and -1 not in self.table
+
+    def is_complete(self) -> bool:
+        """At least one target for every (state, symbol) pair"""
+        if self.table is not None:
+            return -1 not in self.table
+        offsets = self._offsets
+        return all(offsets[cell] < offsets[cell + 1] for cell in range(self.num_states * self.num_symbols))
+
+    def successor_masks(self) -> List[int]:
+        """Per (state, symbol) cell, the set of target states as an int bitmask (bit i = state i).
+        Built on first use and kept for later calls."""
+        if getattr(self, '_successor_masks', None) is None:
+            masks = []
+            k = self.num_symbols
+            for cell in range(self.num_states * k):
+                mask = 0
+                for target in self.successors(cell // k, cell % k):
+                    mask |= 1 << target
+                masks.append(mask)
+            self._successor_masks = masks
+        return self._successor_masks
+
+    def final_mask(self) -> int:
+        """Final states as an int bitmask"""
+        return int.from_bytes(bytes(reversed(self._packed_finals())), 'big') if self.num_states else 0
+
+    def _packed_finals(self) -> bytearray:
+        """Final flags packed little-endian, eight states per byte"""
+        packed = bytearray((self.num_states + 7) // 8)
+        for state in range(self.num_states):
+            if self.finals[state]:
+                packed[state >> 3] |= 1 << (state & 7)
+        return packed
+
+    def with_sink(self, sink_name: str = "trap") -> "CompiledAutomaton":
+        """Complete DFA obtained by sending every missing transition to a new sink state.
+        Returns the automaton itself when it is already complete."""
+        if self.table is None:
+            raise ValueError("Completion with a sink requires a deterministic automaton")
+        if -1 not in self.table:
+            return self
+        sink = self.num_states
+        while sink_name in self.state_index:
+            sink_name += "'"
+        table = array('i', (sink if target < 0 else target for target in self.table))
+        table.extend([sink] * self.num_symbols)
+        return CompiledAutomaton.from_table(
+            state_names=list(self.state_names) + [sink_name],
+            symbols=self.symbols,
+            initial=self.initial,
+            finals=self.finals + bytearray(1),
+            table=table,
+            name=self.name
+        )
+
+    def encode(self, word: str) -> Optional[List[int]]:
+        """Translate a word into symbol ids, or None if it uses a symbol outside the alphabet"""
+        symbol_index = self.symbol_index
+        try:
+            return [symbol_index[symbol] for symbol in word]
+        except KeyError:
+            return None
+
+    def accepts(self, word: str) -> bool:
+        """Run the automaton on a word"""
+        codes = self.encode(word)
+        if codes is None:
+            return False
+        k = self.num_symbols
+        if self.table is not None:
+            table = self.table
+            state = self.initial
+            for symbol in codes:
+                state = table[state * k + symbol]
+                if state < 0:
+                    return False
+            return bool(self.finals[state])
+        np = _numpy() if self.num_states > self.VECTOR_STATES_THRESHOLD else None
+        if np is not None:
+            # Very large NFAs: state sets as NumPy bool vectors stepped through the CSR arrays
+            current = np.zeros(self.num_states, dtype=bool)
+            current[self.initial] = True
+            for symbol in codes:
+                current = self._step_vector(current, symbol, np)
+                if not current.any():
+                    return False
+            return bool(current[np.frombuffer(bytes(self.finals), dtype=np.uint8).astype(bool)].any())
+        current = 1 << self.initial
+        for symbol in codes:
+            current = self.step_mask(current, symbol)
+            if not current:
+                return False
+        return bool(current & self.final_mask())
+
+    def step_mask(self, mask: int, symbol: int) -> int:
+        """Successors of a set of states (int bitmask) on a symbol.
+
+        Sparse sets are stepped state by state using the per-cell successor masks. Dense sets
+        are stepped a byte (eight states) at a time: the union of successors for each
+        (byte position, byte value) met is computed once and cached per symbol.
+        """
+        if not mask:
+            return 0
+        masks, k = self.successor_masks(), self.num_symbols
+        data = mask.to_bytes((mask.bit_length() + 7) // 8, 'little')
+        result = 0
+        if bin(mask).count("1") * 8 < len(data):
+            while mask:
+                low = mask & -mask
+                result |= masks[(low.bit_length() - 1) * k + symbol]
+                mask ^= low
+            return result
+        if getattr(self, '_byte_step_cache', None) is None:
+            self._byte_step_cache = [{} for _ in range(k)]
+        cache = self._byte_step_cache[symbol]
+        for position, byte in enumerate(data):
+            if not byte:
+                continue
+            key = (position << 8) | byte
+            union = cache.get(key)
+            if union is None:
+                union, base = 0, position * 8
+                for bit in range(8):
+                    if byte >> bit & 1:
+                        union |= masks[(base + bit) * k + symbol]
+                cache[key] = union
+            result |= union
+        return result
+
+    def _step_vector(self, current, symbol: int, np):
+        """Successors of a set of states held as a NumPy bool vector"""
+        if getattr(self, '_csr_arrays', None) is None:
+            self._csr_arrays = (np.frombuffer(self.offsets, dtype=np.int32).astype(np.int64),
+                                np.frombuffer(self.targets, dtype=np.int32))
+        offsets, targets = self._csr_arrays
+        cells = np.flatnonzero(current) * self.num_symbols + symbol
+        starts, lengths = offsets[cells], offsets[cells + 1] - offsets[cells]
+        # Concatenate targets[start:start + length] for every active state without a Python loop
+        positions = np.repeat(starts - np.cumsum(lengths) + lengths, lengths) + np.arange(lengths.sum())
+        following = np.zeros(self.num_states, dtype=bool)
+        following[targets[positions]] = True
+        return following
+
+AutomatonLike = Union[Automaton, CompiledAutomaton]
+
+def _numpy():
+    """Return the numpy module if it is installed, otherwise None (NumPy is an optional speedup)"""
+    try:
+        import numpy
+        return numpy
+    except ImportError:
+        return None
+
+class StateLimitExceeded(ValueError):
+    """Raised when a construction would create more states than the configured limit"""
+
+class SubsetConstruction:
+    """Incremental subset construction over a compiled NFA.
+
+    DFA states are sets of NFA states held as int bitmasks and interned to dense ids in the
+    order they are discovered; successors are computed once per (id, symbol) and cached in a
+    transition table, so lazy users and full determinization of the same NFA share the work.
+    The empty set is never interned: a missing successor is recorded as -1.
+    """
+    UNKNOWN = -2
+
+    def __init__(self, nfa: CompiledAutomaton):
+        self.nfa = nfa
+        self.final_mask = nfa.final_mask()
+        self.ids: Dict[int, int] = {}
+        self.subsets: List[int] = []
+        self.finals = bytearray()
+        self.table = array('i')
+        self.intern(1 << nfa.initial)
+
+    @staticmethod
+    def for_nfa(nfa: CompiledAutomaton) -> "SubsetConstruction":
+        """The construction cached on the compiled NFA, created on first use"""
+        if getattr(nfa, '_subset_construction', None) is None:
+            nfa._subset_construction = SubsetConstruction(nfa)
+        return nfa._subset_construction
+
+    def intern(self, subset: int, max_states: Optional[int] = None) -> int:
+        """Id of a non-empty subset, allocating a new DFA state if it has not been seen"""
+        state = self.ids.get(subset)
+        if state is None:
+            if max_states is not None and len(self.subsets) >= max_states:
+                raise StateLimitExceeded(f"Subset construction exceeded the limit of {max_states} DFA states")
+            state = self.ids[subset] = len(self.subsets)
+            self.subsets.append(subset)
+            self.finals.append(1 if subset & self.final_mask else 0)
+            self.table.extend([self.UNKNOWN] * self.nfa.num_symbols)
+        return state
+
+    def successor(self, state: int, symbol: int, max_states: Optional[int] = None) -> int:
+        """Id of the successor of a DFA state on a symbol, or -1 if it is the empty set"""
+        cell = state * self.nfa.num_symbols + symbol
+        target = self.table[cell]
+        if target == self.UNKNOWN:
+            following = self.nfa.step_mask(self.subsets[state], symbol)
+            target = self.intern(following, max_states) if following else -1
+            self.table[cell] = target
+        return target
+
+    def run(self, max_states: Optional[int] = None, progress=None,
+            progress_interval: int = 1024) -> CompiledAutomaton:
+        """Determinize the whole NFA and return the DFA with states S0, S1, ... in BFS order.
+
+        Raises StateLimitExceeded as soon as more than max_states DFA states would be needed.
+        progress(num_states, num_pending) is called every progress_interval expanded states;
+        it may raise to cancel the construction.
+        """
+        from collections import deque
+        k = self.nfa.num_symbols
+        number = {0: 0}
+        order = [0]
+        queue = deque(order)
+        table = array('i')
+        expanded = 0
+        while queue:
+            state = queue.popleft()
+            for symbol in range(k):
+                target = self.successor(state, symbol, max_states)
+                if target >= 0 and target not in number:
+                    number[target] = len(order)
+                    order.append(target)
+                    queue.append(target)
+                table.append(number[target] if target >= 0 else -1)
+            expanded += 1
+            if progress is not None and expanded % progress_interval == 0:
+                progress(len(order), len(queue))
+        if progress is not None:
+            progress(len(order), 0)
+        return CompiledAutomaton.from_table(
+            state_names=[f'S{idx}' for idx in range(len(order))],
+            symbols=self.nfa.symbols,
+            initial=0,
+            finals=bytearray(self.finals[state] for state in order),
+            table=table,
+            name=self.nfa.name + '_dfa'
+        )
+
+class _PairStateNames(Sequence):
+    """State names of a product automaton, formatted as "(q1,q2)" only when requested.
+    Components past the end of a name list denote the implicit sink, shown as ∅."""
+    def __init__(self, names1: Sequence[str], names2: Sequence[str], left: array, right: array):
+        self.names1, self.names2 = names1, names2
+        self.left, self.right = left, right
+
+    def __len__(self) -> int:
+        return len(self.left)
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(len(self)))]
+        q1, q2 = self.left[idx], self.right[idx]
+        name1 = self.names1[q1] if q1 < len(self.names1) else '∅'
+        name2 = self.names2[q2] if q2 < len(self.names2) else '∅'
+        return f"({name1},{name2})"
+
 class AutomataManager:
-    """Handles basic automata management operations"""
-    def __init__(self):
+    """Handles basic automata management operations.
+    Automata are kept in automata_dir, by default the AUTOMATA_DIR environment variable
+    or saved_automatas in the working directory."""
+    # JSON files of at least this many bytes are parsed incrementally by load_compiled
+    STREAMING_THRESHOLD = 16 << 20
+
+    def __init__(self, automata_dir: Optional[str] = None):
         self.current_automaton: Optional[Automaton] = None
-        self.automata_dir = "saved_automatas"
+        self.automata_dir = automata_dir or os.environ.get("AUTOMATA_DIR", "saved_automatas")
         # Ensure the directory exists
         if not os.path.exists(self.automata_dir):
             os.makedirs(self.automata_dir)
@@ -62,7 +528,8 @@ class AutomataManager:
             raise ValueError(f"Failed to create automaton: {str(e)}")
     
     def save_automaton(self, filename: str = None) -> bool:
-        """Save the current automaton to a file in the saved_automatas directory"""
+        """Save the current automaton to a file in the saved_automatas directory.
+        Filenames ending in .fab are written in the binary format, anything else as JSON."""
         if not self.current_automaton:
             return False
             
@@ -70,24 +537,22 @@ class AutomataManager:
             filename = f"{self.current_automaton.name}.json"
             
         # Ensure the filename has .json extension
-        if not filename.endswith('.json'):
+        if not filename.endswith(('.json', BINARY_EXTENSION)):
             filename += '.json'
             
         # Create full path in saved_automatas directory
         filepath = os.path.join(self.automata_dir, filename)
+
+        if filename.endswith(BINARY_EXTENSION):
+            from binary_format import BinaryFormat
+            try:
+                BinaryFormat.write(CompiledAutomaton.from_automaton(self.current_automaton), filepath)
+                return True
+            except Exception:
+                return False
         
         # Convert automaton to serializable format
-        data = {
-            "name": self.current_automaton.name,
-            "states": list(self.current_automaton.states),
-            "alphabet": list(self.current_automaton.alphabet),
-            "transitions": {
-                f"{state},{symbol}": list(targets)
-                for (state, symbol), targets in self.current_automaton.transitions.items()
-            },
-            "initial_state": self.current_automaton.initial_state,
-            "final_states": list(self.current_automaton.final_states)
-        }
+        data = self.automaton_to_dict(self.current_automaton)
         
         try:
             with open(filepath, 'w') as f:
@@ -96,12 +561,34 @@ class AutomataManager:
         except Exception:
             return False
     
+    @staticmethod
+    def automaton_to_dict(automaton: Automaton) -> dict:
+        """JSON-serializable form of an automaton, as written to the saved files"""
+        return {
+            "name": automaton.name,
+            "states": list(automaton.states),
+            "alphabet": list(automaton.alphabet),
+            "transitions": {
+                f"{state},{symbol}": list(targets)
+                for (state, symbol), targets in automaton.transitions.items()
+            },
+            "initial_state": automaton.initial_state,
+            "final_states": list(automaton.final_states)
+        }
+
     def load_automaton(self, filename: str, preview: bool = False) -> Optional[Automaton]:
         """Load an automaton from the saved_automatas directory.
         If preview=True, returns a new Automaton instance without setting it as current_automaton"""
         try:
             # Create full path in saved_automatas directory
             filepath = os.path.join(self.automata_dir, filename)
+
+            if filename.endswith(BINARY_EXTENSION):
+                with self.load_compiled(filename) as compiled:
+                    automaton = compiled.to_automaton()
+                if not preview:
+                    self.current_automaton = automaton
+                return automaton
             
             with open(filepath, 'r') as f:
                 data = json.load(f)
@@ -175,12 +662,57 @@ class AutomataManager:
         except Exception as e:
             raise ValueError(f"Failed to load automaton: {str(e)}")
 
-    def list_saved_automata(self) -> List[str]:
-        """List all saved automata files from the saved_automatas directory"""
+    def load_compiled(self, filename: str, progress=None) -> CompiledAutomaton:
+        """Load a saved automaton in compiled form.
+
+        Binary (.fab) files are memory-mapped without parsing. JSON files of at least
+        STREAMING_THRESHOLD bytes, or any JSON file when a progress(bytes_read, total_bytes)
+        callback is given, are parsed incrementally by streaming_loader.StreamingLoader
+        without holding the document in memory; smaller ones are loaded and compiled.
+        progress may raise to cancel the load.
+        """
+        filepath = os.path.join(self.automata_dir, filename)
+        try:
+            if filename.endswith(BINARY_EXTENSION):
+                from binary_format import BinaryFormat
+                return BinaryFormat.load(filepath)
+            if progress is not None or os.path.getsize(filepath) >= self.STREAMING_THRESHOLD:
+                from streaming_loader import StreamingLoader
+                return StreamingLoader.load(filepath, progress=progress)
+        except (OSError, ValueError) as e:
+            raise ValueError(f"Failed to load automaton: {str(e)}")
+        return CompiledAutomaton.from_automaton(self.load_automaton(filename, preview=True))
+
+    @property
+    def catalog(self):
+        """SQLite catalog of the automata directory, opened on first use"""
+        if getattr(self, '_catalog', None) is None:
+            from automata_catalog import AutomataCatalog
+            self._catalog = AutomataCatalog(self.automata_dir)
+        return self._catalog
+
+    def list_saved_automata(self, refresh: bool = True, **filters) -> List[str]:
+        """List the saved automata files, sorted by name.
+        Keyword filters are those of AutomataCatalog.list_files, e.g. deterministic=True, alphabet={'0', '1'}.
+        With refresh False changed files are not re-analyzed: filters use the index as it stands
+        and an unfiltered listing only reads the directory."""
         if not os.path.exists(self.automata_dir):
             return []
-        return [f for f in os.listdir(self.automata_dir) if f.endswith('.json')]
-    
+        try:
+            if refresh:
+                self.catalog.refresh()
+            elif not filters:
+                return self._list_files()
+            return self.catalog.list_files(**filters)
+        except sqlite3.Error:
+            # Read-only directory: fall back to listing the files without metadata
+            if filters:
+                raise
+            return self._list_files()
+
+    def _list_files(self) -> List[str]:
+        return sorted(f for f in os.listdir(self.automata_dir) if f.endswith(('.json', BINARY_EXTENSION)))
+
     def delete_automaton(self, filename: str) -> bool:
         """Delete a saved automaton file from the saved_automatas directory"""
         try:
@@ -193,10 +725,46 @@ class AutomataManager:
             return False
 
 class AutomataAnalyzer:
-    """Handles analysis operations on automata"""
+    """Handles analysis operations on automata.
+    Operations accept either an Automaton or a CompiledAutomaton and return
+    results of the same kind as their input."""
+    # Optional persistent cache of derived automata (a result_cache.ResultCache), used by
+    # nfa_to_dfa, minimize_dfa, compute_union, compute_intersection and compute_complement
+    result_cache = None
+
+    @staticmethod
+    def _cached(operation: str, inputs: Sequence[CompiledAutomaton], params: tuple, compute) -> CompiledAutomaton:
+        """Result of compute() looked up in and stored to the result cache, if one is configured.
+        The cache is best-effort: a failing lookup counts as a miss and a failing store is
+        skipped (a locked, full or corrupt database never fails the operation itself)."""
+        cache = AutomataAnalyzer.result_cache
+        if cache is None:
+            return compute()
+        key = cache.key(operation, inputs, params)
+        try:
+            result = cache.get(key)
+        except (sqlite3.Error, OSError, ValueError):
+            result = None
+        if result is None:
+            result = compute()
+            try:
+                cache.put(key, operation, result)
+            except (sqlite3.Error, OSError):
+                pass
+        return result
+
+    @staticmethod
+    def _as_input_kind(result: CompiledAutomaton, original: AutomatonLike) -> AutomatonLike:
+        """Return a compiled result in the same representation as the original input"""
+        if isinstance(original, CompiledAutomaton):
+            return result
+        return result.to_automaton()
+
     @staticmethod
-    def is_deterministic(automaton: Automaton) -> bool:
+    def is_deterministic(automaton: AutomatonLike) -> bool:
         """Check if the automaton is deterministic"""
+        if isinstance(automaton, CompiledAutomaton):
+            return automaton.is_deterministic()
         # Check if there's exactly one initial state
         if not automaton.initial_state:
             return False
@@ -210,8 +778,10 @@ class AutomataAnalyzer:
         return True
     
     @staticmethod
-    def is_complete(automaton: Automaton) -> bool:
+    def is_complete(automaton: AutomatonLike) -> bool:
         """Check if the automaton is complete"""
+        if isinstance(automaton, CompiledAutomaton):
+            return automaton.is_complete()
         for state in automaton.states:
             for symbol in automaton.alphabet:
                 if not automaton.transitions.get((state, symbol)):
@@ -245,317 +815,629 @@ class AutomataAnalyzer:
         )
     
     @staticmethod
-    def nfa_to_dfa(automaton: Automaton) -> Automaton:
-        """Convert an NFA to an equivalent DFA using subset construction."""
-        from collections import deque
-        # Each DFA state is a frozenset of NFA states
-        dfa_states = set()
-        dfa_transitions = dict()
-        dfa_final_states = set()
-        state_name_map = dict()  # frozenset -> string name
-        queue = deque()
-
-        # Start state is the set containing only the NFA initial state
-        start_set = frozenset([automaton.initial_state])
-        queue.append(start_set)
-        dfa_states.add(start_set)
-        state_name_map[start_set] = 'S0'
-        name_counter = 1
-
-        # If any NFA state in a DFA state is final, the DFA state is final
-        if automaton.final_states & start_set:
-            dfa_final_states.add('S0')
+    def nfa_to_dfa(automaton: AutomatonLike, max_states: Optional[int] = None, progress=None) -> AutomatonLike:
+        """Convert an NFA to an equivalent DFA using subset construction.
+        Raises StateLimitExceeded when more than max_states DFA states would be needed;
+        progress(num_states, num_pending) is called periodically and may raise to cancel."""
+        nfa = CompiledAutomaton.of(automaton)
+        dfa = AutomataAnalyzer._cached('nfa_to_dfa', [nfa], (), lambda: SubsetConstruction.for_nfa(nfa).run(
+            max_states=max_states, progress=progress))
+        # The cached DFA does not depend on the limit, which still applies to it
+        if max_states is not None and dfa.num_states > max_states:
+            raise StateLimitExceeded(f"Subset construction exceeded the limit of {max_states} DFA states")
+        dfa.name = nfa.name + '_dfa'
+        return AutomataAnalyzer._as_input_kind(dfa, automaton)
 
+    @staticmethod
+    def _reachable_states(dfa: CompiledAutomaton) -> List[int]:
+        """State ids reachable from the initial state, in BFS order over sorted symbols"""
+        from collections import deque
+        table, k = dfa.table, dfa.num_symbols
+        seen = bytearray(dfa.num_states)
+        seen[dfa.initial] = 1
+        order = [dfa.initial]
+        queue = deque(order)
         while queue:
-            current = queue.popleft()
-            current_name = state_name_map[current]
-            for symbol in automaton.alphabet:
-                # Compute the set of NFA states reachable from any state in current on symbol
-                next_set = set()
-                for nfa_state in current:
-                    next_set.update(automaton.transitions.get((nfa_state, symbol), set()))
-                next_frozen = frozenset(next_set)
-                if not next_frozen:
-                    continue  # No transition for this symbol
-                if next_frozen not in dfa_states:
-                    dfa_states.add(next_frozen)
-                    state_name_map[next_frozen] = f'S{name_counter}'
-                    if automaton.final_states & next_frozen:
-                        dfa_final_states.add(state_name_map[next_frozen])
-                    queue.append(next_frozen)
-                    name_counter += 1
-                dfa_transitions[(current_name, symbol)] = {state_name_map[next_frozen]}
-
-        # Build DFA state names
-        dfa_state_names = set(state_name_map.values())
-        dfa_initial_state = 'S0'
-        dfa = Automaton(
-            states=dfa_state_names,
-            alphabet=automaton.alphabet,
-            transitions=dfa_transitions,
-            initial_state=dfa_initial_state,
-            final_states=dfa_final_states,
-            name=automaton.name + '_dfa'
-        )
-        return dfa
+            base = queue.popleft() * k
+            for symbol in range(k):
+                target = table[base + symbol]
+                if target >= 0 and not seen[target]:
+                    seen[target] = 1
+                    order.append(target)
+                    queue.append(target)
+        return order
+
+    @staticmethod
+    def _hopcroft_partition(dfa: CompiledAutomaton, progress=None,
+                            progress_interval: int = 1024) -> Tuple[List[int], array, int]:
+        """Hopcroft's partition refinement over the reachable part of a complete DFA.
+
+        Returns (reachable, block_of, num_blocks) where reachable lists the reachable
+        state ids in BFS order and block_of[i] is the block id of reachable[i].
+        Predecessors are looked up in an inverse-transition index built once, so the
+        refinement runs in O(n * k * log n). progress(num_blocks, num_pending) is called
+        every progress_interval splitters and may raise to cancel.
+        """
+        table, k = dfa.table, dfa.num_symbols
+        reachable = AutomataAnalyzer._reachable_states(dfa)
+        m = len(reachable)
+        local = array('i', [-1]) * dfa.num_states
+        for idx, state in enumerate(reachable):
+            local[state] = idx
+
+        # Inverse-transition index in CSR layout: the a-predecessors of local state t
+        # are inv_sources[inv_offsets[a * m + t]:inv_offsets[a * m + t + 1]]
+        inv_offsets = array('i', [0]) * (k * m + 1)
+        for idx, state in enumerate(reachable):
+            base = state * k
+            for symbol in range(k):
+                inv_offsets[symbol * m + local[table[base + symbol]] + 1] += 1
+        for cell in range(k * m):
+            inv_offsets[cell + 1] += inv_offsets[cell]
+        fill = array('i', inv_offsets[:-1])
+        inv_sources = array('i', [0]) * (k * m)
+        for idx, state in enumerate(reachable):
+            base = state * k
+            for symbol in range(k):
+                cell = symbol * m + local[table[base + symbol]]
+                inv_sources[fill[cell]] = idx
+                fill[cell] += 1
+
+        # Initial partition: final and non-final reachable states
+        finals = dfa.finals
+        final_block = {idx for idx, state in enumerate(reachable) if finals[state]}
+        other_block = set(range(m)) - final_block
+        blocks = [block for block in (final_block, other_block) if block]
+        block_of = array('i', [0]) * m
+        for block_id, block in enumerate(blocks):
+            for idx in block:
+                block_of[idx] = block_id
+        if len(blocks) < 2:
+            return reachable, block_of, len(blocks)
+
+        smaller = 0 if len(blocks[0]) <= len(blocks[1]) else 1
+        worklist = [(smaller, symbol) for symbol in range(k)]
+        pending = set(worklist)
+        processed = 0
+        while worklist:
+            splitter, symbol = worklist.pop()
+            pending.discard((splitter, symbol))
+            processed += 1
+            if progress is not None and processed % progress_interval == 0:
+                progress(len(blocks), len(worklist))
+            # Group the predecessors of the splitter by the block they belong to
+            touched = {}
+            base = symbol * m
+            for target in blocks[splitter]:
+                for pos in range(inv_offsets[base + target], inv_offsets[base + target + 1]):
+                    source = inv_sources[pos]
+                    touched.setdefault(block_of[source], []).append(source)
+            for block_id, members in touched.items():
+                block = blocks[block_id]
+                if len(members) == len(block):
+                    continue
+                # Split the predecessors off into a new block
+                new_id = len(blocks)
+                new_block = set(members)
+                block -= new_block
+                blocks.append(new_block)
+                for idx in members:
+                    block_of[idx] = new_id
+                for c in range(k):
+                    if (block_id, c) in pending:
+                        item = (new_id, c)
+                    else:
+                        item = (new_id, c) if len(new_block) <= len(block) else (block_id, c)
+                    worklist.append(item)
+                    pending.add(item)
+        return reachable, block_of, len(blocks)
 
     @staticmethod
-    def is_minimal_dfa(automaton: Automaton) -> Tuple[bool, Optional[Set[frozenset]]]:
+    def is_minimal_dfa(automaton: AutomatonLike) -> Tuple[bool, Optional[Set[frozenset]]]:
         """Check if a DFA is minimal. Returns (is_minimal, partition) where partition is the set of state groups."""
         # Only works for DFA
-        if not AutomataAnalyzer.is_deterministic(automaton):
+        dfa = CompiledAutomaton.of(automaton)
+        if not dfa.is_deterministic():
             return False, None
-        # Remove unreachable states
-        reachable = set()
-        queue = [automaton.initial_state]
-        while queue:
-            state = queue.pop()
-            if state in reachable:
-                continue
-            reachable.add(state)
-            for symbol in automaton.alphabet:
-                targets = automaton.transitions.get((state, symbol), set())
-                for t in targets:
-                    if t not in reachable:
-                        queue.append(t)
-        # Hopcroft's partition refinement
-        F = automaton.final_states & reachable
-        NF = reachable - F
-        if not F or not NF:
-            # Trivial DFA (all states final or all non-final)
-            return True, {frozenset(reachable)}
-        partition = [set(F), set(NF)]
-        worklist = [set(F), set(NF)]
-        while worklist:
-            A = worklist.pop()
-            for symbol in automaton.alphabet:
-                pre = set()
-                for (state, sym), targets in automaton.transitions.items():
-                    if sym == symbol and any(t in A for t in targets):
-                        pre.add(state)
-                new_partition = []
-                for Y in partition:
-                    inter = Y & pre
-                    diff = Y - pre
-                    if inter and diff:
-                        new_partition.extend([inter, diff])
-                        if Y in worklist:
-                            worklist.remove(Y)
-                            worklist.extend([inter, diff])
-                        else:
-                            if len(inter) <= len(diff):
-                                worklist.append(inter)
-                            else:
-                                worklist.append(diff)
-                    else:
-                        new_partition.append(Y)
-                partition = new_partition
+        reachable, block_of, num_blocks = AutomataAnalyzer._hopcroft_partition(dfa)
+        groups = [[] for _ in range(num_blocks)]
+        for idx, state in enumerate(reachable):
+            groups[block_of[idx]].append(dfa.state_names[state])
         # If number of groups == number of reachable states, DFA is minimal
-        num_groups = len(partition)
-        if num_groups == len(reachable):
-            return True, {frozenset(g) for g in partition}
-        else:
-            return False, {frozenset(g) for g in partition}
+        return num_blocks == len(reachable), {frozenset(g) for g in groups}
 
     @staticmethod
-    def minimize_dfa(automaton: Automaton) -> Automaton:
-        """Minimize a DFA using partition refinement (Hopcroft's algorithm). Returns a new minimized DFA."""
-        if not AutomataAnalyzer.is_deterministic(automaton):
+    def minimize_dfa(automaton: AutomatonLike, progress=None) -> AutomatonLike:
+        """Minimize a DFA using partition refinement (Hopcroft's algorithm). Returns a new minimized DFA.
+        States of the result are named M0, M1, ... in breadth-first order from the initial state.
+        progress(num_blocks, num_pending) is called periodically and may raise to cancel."""
+        dfa = CompiledAutomaton.of(automaton)
+        if not dfa.is_deterministic():
             raise ValueError("Minimization requires a deterministic automaton (DFA).")
-        # Remove unreachable states
-        reachable = set()
-        queue = [automaton.initial_state]
-        while queue:
-            state = queue.pop()
-            if state in reachable:
-                continue
-            reachable.add(state)
-            for symbol in automaton.alphabet:
-                targets = automaton.transitions.get((state, symbol), set())
-                for t in targets:
-                    if t not in reachable:
-                        queue.append(t)
-        F = automaton.final_states & reachable
-        NF = reachable - F
-        if not F or not NF:
-            # Trivial DFA (all states final or all non-final)
-            return Automaton(
-                states=set(reachable),
-                alphabet=automaton.alphabet,
-                transitions={k: v for k, v in automaton.transitions.items() if k[0] in reachable},
-                initial_state=automaton.initial_state,
-                final_states=F,
-                name=automaton.name + '_minimized'
-            )
-        partition = [set(F), set(NF)]
-        worklist = [set(F), set(NF)]
-        while worklist:
-            A = worklist.pop()
-            for symbol in automaton.alphabet:
-                pre = set()
-                for (state, sym), targets in automaton.transitions.items():
-                    if sym == symbol and any(t in A for t in targets):
-                        pre.add(state)
-                new_partition = []
-                for Y in partition:
-                    inter = Y & pre
-                    diff = Y - pre
-                    if inter and diff:
-                        new_partition.extend([inter, diff])
-                        if Y in worklist:
-                            worklist.remove(Y)
-                            worklist.extend([inter, diff])
-                        else:
-                            if len(inter) <= len(diff):
-                                worklist.append(inter)
-                            else:
-                                worklist.append(diff)
-                    else:
-                        new_partition.append(Y)
-                partition = new_partition
-        # Build state name mapping: frozenset -> new state name
-        group_names = {}
-        for idx, group in enumerate(partition):
-            group_names[frozenset(group)] = f'M{idx}'
-        # Find which group contains the initial state
-        for group in partition:
-            if automaton.initial_state in group:
-                new_initial = group_names[frozenset(group)]
-                break
-        # New final states
-        new_finals = set()
-        for group in partition:
-            if group & automaton.final_states:
-                new_finals.add(group_names[frozenset(group)])
-        # Build new transitions
-        new_transitions = {}
-        for group in partition:
-            rep = next(iter(group))
-            for symbol in automaton.alphabet:
-                target = next(iter(automaton.transitions.get((rep, symbol), set())), None)
-                if target is not None:
-                    # Find the group containing the target
-                    for g2 in partition:
-                        if target in g2:
-                            new_transitions[(group_names[frozenset(group)], symbol)] = {group_names[frozenset(g2)]}
-                            break
-        return Automaton(
-            states=set(group_names.values()),
-            alphabet=automaton.alphabet,
-            transitions=new_transitions,
-            initial_state=new_initial,
-            final_states=new_finals,
-            name=automaton.name + '_minimized'
+        minimized = AutomataAnalyzer._cached('minimize_dfa', [dfa], (),
+                                             lambda: AutomataAnalyzer._minimize(dfa, progress))
+        minimized.name = dfa.name + '_minimized'
+        return AutomataAnalyzer._as_input_kind(minimized, automaton)
+
+    @staticmethod
+    def _minimize(dfa: CompiledAutomaton, progress=None) -> CompiledAutomaton:
+        """Quotient of a complete DFA by Hopcroft's partition, renumbered in BFS order"""
+        reachable, block_of, num_blocks = AutomataAnalyzer._hopcroft_partition(dfa, progress=progress)
+        table, k = dfa.table, dfa.num_symbols
+        local = {state: idx for idx, state in enumerate(reachable)}
+        # Pick one representative per block
+        representative = [0] * num_blocks
+        for idx in range(len(reachable) - 1, -1, -1):
+            representative[block_of[idx]] = reachable[idx]
+        # Number blocks in BFS order of the quotient automaton
+        number = array('i', [-1]) * num_blocks
+        order = [block_of[0]]
+        number[block_of[0]] = 0
+        new_table = array('i')
+        for block_id in order:
+            base = representative[block_id] * k
+            for symbol in range(k):
+                target_block = block_of[local[table[base + symbol]]]
+                if number[target_block] < 0:
+                    number[target_block] = len(order)
+                    order.append(target_block)
+                new_table.append(number[target_block])
+        new_finals = bytearray(dfa.finals[representative[block_id]] for block_id in order)
+        return CompiledAutomaton.from_table(
+            state_names=[f'M{idx}' for idx in range(num_blocks)],
+            symbols=dfa.symbols,
+            initial=0,
+            finals=new_finals,
+            table=new_table,
+            name=dfa.name + '_minimized'
         )
 
     @staticmethod
-    def compute_union(automaton1: Automaton, automaton2: Automaton) -> Automaton:
-        """Compute the union of two automata. The resulting automaton accepts strings accepted by either automaton."""
-        # Verify alphabets match
-        if automaton1.alphabet != automaton2.alphabet:
-            raise ValueError("Both automata must have the same alphabet")
+    def canonicalize(automaton: AutomatonLike, alphabet: Optional[Iterable[str]] = None,
+                     max_states: Optional[int] = None, progress=None) -> AutomatonLike:
+        """Canonical form of the language of an automaton.
 
-        # Convert to DFAs if needed
-        if not AutomataAnalyzer.is_deterministic(automaton1):
-            automaton1 = AutomataAnalyzer.nfa_to_dfa(automaton1)
-        if not AutomataAnalyzer.is_deterministic(automaton2):
-            automaton2 = AutomataAnalyzer.nfa_to_dfa(automaton2)
+        The result is the minimal complete DFA of the language, with symbols in sorted order
+        and states named M0, M1, ... in breadth-first order from the initial state, taking
+        symbols in that order (so states are numbered by the shortlex-least word reaching
+        them). Two automata over the same alphabet accept the same language exactly when
+        their canonical forms are identical; canonical_hash digests this form.
 
-        # Create states as pairs
-        states = {f"({q1},{q2})" for q1 in automaton1.states for q2 in automaton2.states}
-        
-        # Initial state is pair of initial states
-        initial_state = f"({automaton1.initial_state},{automaton2.initial_state})"
-        
-        # Final states are pairs where at least one state is final
-        final_states = {
-            f"({q1},{q2})" 
-            for q1 in automaton1.states 
-            for q2 in automaton2.states 
-            if q1 in automaton1.final_states or q2 in automaton2.final_states
-        }
+        alphabet, a superset of the automaton's alphabet, takes the language over that
+        alphabet instead, so that automata over different alphabets can be compared.
+        max_states and progress are passed on to the subset construction and minimization.
+        """
+        dfa = AutomataAnalyzer._as_dfa(automaton, max_states=max_states, progress=progress)
+        dfa = AutomataAnalyzer._with_alphabet(dfa, dfa.symbols if alphabet is None else alphabet)
+        canonical = AutomataAnalyzer.minimize_dfa(dfa.with_sink(), progress=progress)
+        canonical.name = f"{CompiledAutomaton.of(automaton).name}_canonical"
+        return AutomataAnalyzer._as_input_kind(canonical, automaton)
 
-        # Build transitions for the product automaton
-        transitions = {}
-        for q1 in automaton1.states:
-            for q2 in automaton2.states:
-                for symbol in automaton1.alphabet:
-                    # Get next states from both automata
-                    next_q1 = next(iter(automaton1.transitions.get((q1, symbol), set())))
-                    next_q2 = next(iter(automaton2.transitions.get((q2, symbol), set())))
-                    current_state = f"({q1},{q2})"
-                    next_state = f"({next_q1},{next_q2})"
-                    transitions[(current_state, symbol)] = {next_state}
+    @staticmethod
+    def canonical_hash(automaton: AutomatonLike, alphabet: Optional[Iterable[str]] = None,
+                       max_states: Optional[int] = None, progress=None) -> str:
+        """SHA-256 hex digest of the canonical form of the language of an automaton.
+
+        Equal digests mean equal languages over the same alphabet. The digest covers the
+        symbols, final flags and transition table of the canonical DFA, serialized
+        independently of the platform, so it can be stored and compared across machines.
+        """
+        canonical = AutomataAnalyzer.canonicalize(CompiledAutomaton.of(automaton), alphabet=alphabet,
+                                                  max_states=max_states, progress=progress)
+        return AutomataAnalyzer.canonical_digest(canonical)
 
-        return Automaton(
-            states=states,
-            alphabet=automaton1.alphabet,
-            transitions=transitions,
-            initial_state=initial_state,
-            final_states=final_states,
-            name=f"{automaton1.name}_{automaton2.name}_union"
-        )
-    
     @staticmethod
-    def compute_intersection(automaton1: Automaton, automaton2: Automaton) -> Automaton:
-        """Compute the intersection of two automata. The resulting automaton accepts only strings accepted by both automata."""
-        # Verify alphabets match
-        if automaton1.alphabet != automaton2.alphabet:
-            raise ValueError("Both automata must have the same alphabet")
+    def canonical_digest(canonical: CompiledAutomaton) -> str:
+        """canonical_hash of an automaton already in canonical form"""
+        table = array('i', canonical.table)
+        if sys.byteorder != 'little':
+            table.byteswap()
+        digest = hashlib.sha256(b'canonical-dfa-1')
+        digest.update(json.dumps(list(canonical.symbols)).encode())
+        digest.update(bytes(canonical.finals))
+        digest.update(table.tobytes())
+        return digest.hexdigest()
 
-        # Convert to DFAs if needed
-        if not AutomataAnalyzer.is_deterministic(automaton1):
-            automaton1 = AutomataAnalyzer.nfa_to_dfa(automaton1)
-        if not AutomataAnalyzer.is_deterministic(automaton2):
-            automaton2 = AutomataAnalyzer.nfa_to_dfa(automaton2)
+    @staticmethod
+    def _with_alphabet(dfa: CompiledAutomaton, alphabet: Iterable[str]) -> CompiledAutomaton:
+        """The DFA over the sorted alphabet, a superset of its own; new symbols have no transitions"""
+        alphabet = set(alphabet)
+        missing = [symbol for symbol in dfa.symbols if symbol not in alphabet]
+        if missing:
+            raise ValueError(f"Symbol {missing[0]!r} of the automaton is not in the alphabet")
+        symbols = sorted(alphabet)
+        if symbols == list(dfa.symbols):
+            return dfa
+        columns = [dfa.symbol_index.get(symbol, -1) for symbol in symbols]
+        table, k = dfa.table, dfa.num_symbols
+        new_table = array('i')
+        for state in range(dfa.num_states):
+            base = state * k
+            new_table.extend(table[base + column] if column >= 0 else -1 for column in columns)
+        return CompiledAutomaton.from_table(dfa.state_names, symbols, dfa.initial, dfa.finals, new_table,
+                                            name=dfa.name)
 
-        # Create states as pairs
-        states = {f"({q1},{q2})" for q1 in automaton1.states for q2 in automaton2.states}
-        
-        # Initial state is pair of initial states
-        initial_state = f"({automaton1.initial_state},{automaton2.initial_state})"
-        
-        # Final states are pairs where BOTH states are final (unlike union where we use 'or')
-        final_states = {
-            f"({q1},{q2})" 
-            for q1 in automaton1.states 
-            for q2 in automaton2.states 
-            if q1 in automaton1.final_states and q2 in automaton2.final_states
-        }
+    @staticmethod
+    def _as_dfa(automaton: AutomatonLike, max_states: Optional[int] = None, progress=None) -> CompiledAutomaton:
+        """Compiled DFA (possibly partial) for the automaton, determinizing it if needed"""
+        compiled = CompiledAutomaton.of(automaton)
+        if compiled.table is None:
+            compiled = AutomataAnalyzer.nfa_to_dfa(compiled, max_states=max_states, progress=progress)
+        return compiled
 
-        # Build transitions for the product automaton
-        transitions = {}
-        for q1 in automaton1.states:
-            for q2 in automaton2.states:
-                for symbol in automaton1.alphabet:
-                    # Get next states from both automata
-                    next_q1 = next(iter(automaton1.transitions.get((q1, symbol), set())))
-                    next_q2 = next(iter(automaton2.transitions.get((q2, symbol), set())))
-                    current_state = f"({q1},{q2})"
-                    next_state = f"({next_q1},{next_q2})"
-                    transitions[(current_state, symbol)] = {next_state}
+    @staticmethod
+    def _product(dfa1: CompiledAutomaton, dfa2: CompiledAutomaton, accept_both: bool,
+                 name: str, minimize: bool = False, progress=None,
+                 progress_interval: int = 1024) -> CompiledAutomaton:
+        """Build the reachable part of the product of two DFAs by BFS from the initial pair.
 
-        return Automaton(
-            states=states,
-            alphabet=automaton1.alphabet,
-            transitions=transitions,
-            initial_state=initial_state,
-            final_states=final_states,
-            name=f"intersection_{automaton1.name}_{automaton2.name}"
+        Pairs are interned as integer ids; a missing transition on either side leads to an
+        implicit sink. With accept_both a pair is final when both components are final
+        (intersection), otherwise when either is (union). The result is complete.
+        progress(num_pairs, num_pending) is called every progress_interval expanded pairs
+        and may raise to cancel.
+        """
+        from collections import deque
+        if list(dfa1.symbols) != list(dfa2.symbols):
+            raise ValueError("Both automata must have the same alphabet")
+        table1, table2, k = dfa1.table, dfa2.table, dfa1.num_symbols
+        finals1, finals2 = dfa1.finals, dfa2.finals
+        sink1, sink2 = dfa1.num_states, dfa2.num_states
+        width = sink2 + 1
+        dead = sink1 * width + sink2  # both sides in the sink
+
+        def is_final(q1: int, q2: int) -> bool:
+            f1 = q1 != sink1 and finals1[q1]
+            f2 = q2 != sink2 and finals2[q2]
+            return bool(f1 and f2) if accept_both else bool(f1 or f2)
+
+        pair_ids = {dfa1.initial * width + dfa2.initial: 0}
+        left, right = array('i', [dfa1.initial]), array('i', [dfa2.initial])
+        finals = bytearray([is_final(dfa1.initial, dfa2.initial)])
+        table = array('i')
+        queue = deque([0])
+        expanded = 0
+        while queue:
+            pair = queue.popleft()
+            q1, q2 = left[pair], right[pair]
+            expanded += 1
+            if progress is not None and expanded % progress_interval == 0:
+                progress(len(left), len(queue))
+            for symbol in range(k):
+                t1 = table1[q1 * k + symbol] if q1 != sink1 else -1
+                t2 = table2[q2 * k + symbol] if q2 != sink2 else -1
+                t1 = sink1 if t1 < 0 else t1
+                t2 = sink2 if t2 < 0 else t2
+                key = t1 * width + t2
+                if accept_both and (t1 == sink1 or t2 == sink2):
+                    # Such pairs can never accept again: share a single dead state
+                    key, t1, t2 = dead, sink1, sink2
+                target = pair_ids.get(key)
+                if target is None:
+                    target = pair_ids[key] = len(left)
+                    left.append(t1)
+                    right.append(t2)
+                    finals.append(is_final(t1, t2))
+                    queue.append(target)
+                table.append(target)
+
+        product = CompiledAutomaton.from_table(
+            state_names=_PairStateNames(dfa1.state_names, dfa2.state_names, left, right),
+            symbols=dfa1.symbols,
+            initial=0,
+            finals=finals,
+            table=table,
+            name=name
         )
+        if minimize:
+            product = AutomataAnalyzer.minimize_dfa(product, progress=progress)
+            product.name = name
+        return product
+
+    @staticmethod
+    def _dfa_name(compiled: CompiledAutomaton) -> str:
+        """Name of the DFA _as_dfa returns for a compiled automaton"""
+        return compiled.name if compiled.table is not None else compiled.name + '_dfa'
+
+    @staticmethod
+    def compute_union(automaton1: AutomatonLike, automaton2: AutomatonLike, minimize: bool = False,
+                      progress=None) -> AutomatonLike:
+        """Compute the union of two automata. The resulting automaton accepts strings accepted by either automaton.
+        Only product states reachable from the initial pair are built; pass minimize=True to also minimize the result.
+        progress(num_states, num_pending) is called periodically and may raise to cancel."""
+        compiled1, compiled2 = CompiledAutomaton.of(automaton1), CompiledAutomaton.of(automaton2)
+
+        def compute():
+            dfa1 = AutomataAnalyzer._as_dfa(compiled1, progress=progress)
+            dfa2 = AutomataAnalyzer._as_dfa(compiled2, progress=progress)
+            return AutomataAnalyzer._product(dfa1, dfa2, accept_both=False, name="union",
+                                             minimize=minimize, progress=progress)
+
+        union = AutomataAnalyzer._cached('compute_union', [compiled1, compiled2], (minimize,), compute)
+        union.name = f"{AutomataAnalyzer._dfa_name(compiled1)}_{AutomataAnalyzer._dfa_name(compiled2)}_union"
+        return AutomataAnalyzer._as_input_kind(union, automaton1)
+    
+    @staticmethod
+    def compute_intersection(automaton1: AutomatonLike, automaton2: AutomatonLike, minimize: bool = False,
+                             progress=None) -> AutomatonLike:
+        """Compute the intersection of two automata. The resulting automaton accepts only strings accepted by both automata.
+        Only product states reachable from the initial pair are built; pass minimize=True to also minimize the result.
+        progress(num_states, num_pending) is called periodically and may raise to cancel."""
+        compiled1, compiled2 = CompiledAutomaton.of(automaton1), CompiledAutomaton.of(automaton2)
+
+        def compute():
+            dfa1 = AutomataAnalyzer._as_dfa(compiled1, progress=progress)
+            dfa2 = AutomataAnalyzer._as_dfa(compiled2, progress=progress)
+            return AutomataAnalyzer._product(dfa1, dfa2, accept_both=True, name="intersection",
+                                             minimize=minimize, progress=progress)
+
+        intersection = AutomataAnalyzer._cached('compute_intersection', [compiled1, compiled2], (minimize,), compute)
+        intersection.name = f"intersection_{AutomataAnalyzer._dfa_name(compiled1)}_{AutomataAnalyzer._dfa_name(compiled2)}"
+        return AutomataAnalyzer._as_input_kind(intersection, automaton1)
     
     @staticmethod
-    def compute_complement(automaton: Automaton) -> Automaton:
+    def _lazy_dfa(automaton: CompiledAutomaton, symbols: Sequence[str]):
+        """Deterministic view of an automaton over the given symbols, computed on demand.
+        Returns (start, step, is_final) over integer states where -1 is the dead state.
+        NFAs are viewed through their cached SubsetConstruction, so only the subsets
+        actually reached are determinized."""
+        local = [automaton.symbol_index.get(symbol) for symbol in symbols]
+        if automaton.table is not None:
+            table, k, finals = automaton.table, automaton.num_symbols, automaton.finals
+
+            def step(state, symbol):
+                if state < 0 or local[symbol] is None:
+                    return -1
+                return table[state * k + local[symbol]]
+
+            return automaton.initial, step, lambda state: state >= 0 and bool(finals[state])
+
+        construction = SubsetConstruction.for_nfa(automaton)
+
+        def step(state, symbol):
+            if state < 0 or local[symbol] is None:
+                return -1
+            return construction.successor(state, local[symbol])
+
+        return 0, step, lambda state: state >= 0 and bool(construction.finals[state])
+
+    @staticmethod
+    def are_equivalent(automaton1: AutomatonLike, automaton2: AutomatonLike, progress=None,
+                       progress_interval: int = 1024) -> Tuple[bool, Optional[str]]:
+        """Check whether two automata accept the same language.
+
+        Runs the Hopcroft-Karp union-find algorithm on both automata simultaneously,
+        determinizing NFAs lazily. Pairs are explored breadth-first and the search stops
+        at the first conflict, so the returned counterexample is a shortest word accepted
+        by exactly one of the automata. Returns (True, None) when they are equivalent.
+        Symbols missing from one alphabet lead to its dead state.
+        progress(num_pairs, num_pending) is called periodically and may raise to cancel.
+        """
+        from collections import deque
+        compiled1 = CompiledAutomaton.of(automaton1)
+        compiled2 = CompiledAutomaton.of(automaton2)
+        symbols = sorted(set(compiled1.symbols) | set(compiled2.symbols))
+        start1, step1, final1 = AutomataAnalyzer._lazy_dfa(compiled1, symbols)
+        start2, step2, final2 = AutomataAnalyzer._lazy_dfa(compiled2, symbols)
+        if final1(start1) != final2(start2):
+            return False, ""
+
+        parent = {}
+
+        def find(node):
+            root = node
+            while parent.get(root, root) != root:
+                root = parent[root]
+            # Path compression
+            while node != root:
+                parent[node], node = root, parent[node]
+            return root
+
+        parent[(1, start2)] = (0, start1)
+        # Explored pairs with back pointers, used to rebuild the counterexample
+        pairs = [(start1, start2, -1, -1)]
+        queue = deque([0])
+        while queue:
+            idx = queue.popleft()
+            state1, state2 = pairs[idx][0], pairs[idx][1]
+            if progress is not None and idx % progress_interval == 0:
+                progress(len(pairs), len(queue))
+            for symbol in range(len(symbols)):
+                next1, next2 = step1(state1, symbol), step2(state2, symbol)
+                root1, root2 = find((0, next1)), find((1, next2))
+                if root1 == root2:
+                    continue
+                if final1(next1) != final2(next2):
+                    word = [symbols[symbol]]
+                    while idx > 0:
+                        word.append(symbols[pairs[idx][3]])
+                        idx = pairs[idx][2]
+                    return False, "".join(reversed(word))
+                parent[root2] = root1
+                pairs.append((next1, next2, idx, symbol))
+                queue.append(len(pairs) - 1)
+        return True, None
+
+    @staticmethod
+    def count_words(automaton: AutomatonLike, max_length: int) -> List[int]:
+        """Number of distinct accepted words of each length 0..max_length.
+        Propagates a vector of path counts through the determinized transition table,
+        so the cost is O(max_length * transitions) regardless of how many words there are."""
+        dfa = AutomataAnalyzer._as_dfa(automaton)
+        table, k, finals = dfa.table, dfa.num_symbols, dfa.finals
+        final_states = [q for q in range(dfa.num_states) if finals[q]]
+        vector = [0] * dfa.num_states
+        vector[dfa.initial] = 1
+        counts = [sum(vector[q] for q in final_states)]
+        for _ in range(max_length):
+            next_vector = [0] * dfa.num_states
+            for state, ways in enumerate(vector):
+                if ways:
+                    for target in table[state * k:(state + 1) * k]:
+                        if target >= 0:
+                            next_vector[target] += ways
+            vector = next_vector
+            counts.append(sum(vector[q] for q in final_states))
+        return counts
+
+    @staticmethod
+    def _strongly_connected_components(successors: List[List[int]]) -> List[List[int]]:
+        """Tarjan's algorithm without recursion. Components are returned in reverse topological order."""
+        index = [-1] * len(successors)
+        lowlink = [0] * len(successors)
+        on_stack = [False] * len(successors)
+        stack, components, counter = [], [], 0
+        for root in range(len(successors)):
+            if index[root] >= 0:
+                continue
+            work = [(root, 0)]
+            while work:
+                node, child = work.pop()
+                if child == 0:
+                    index[node] = lowlink[node] = counter
+                    counter += 1
+                    stack.append(node)
+                    on_stack[node] = True
+                elif child <= len(successors[node]):
+                    lowlink[node] = min(lowlink[node], lowlink[successors[node][child - 1]])
+                while child < len(successors[node]):
+                    target = successors[node][child]
+                    child += 1
+                    if index[target] < 0:
+                        work.append((node, child))
+                        work.append((target, 0))
+                        break
+                    if on_stack[target]:
+                        lowlink[node] = min(lowlink[node], index[target])
+                else:
+                    if lowlink[node] == index[node]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack[member] = False
+                            component.append(member)
+                            if member == node:
+                                break
+                        components.append(component)
+        return components
+
+    @staticmethod
+    def _trim_graph(dfa: CompiledAutomaton) -> List[List[int]]:
+        """Adjacency lists (with one entry per symbol) restricted to useful states:
+        states both reachable from the initial state and co-reachable to a final state."""
+        table, k = dfa.table, dfa.num_symbols
+        reachable = AutomataAnalyzer._reachable_states(dfa)
+        predecessors = [[] for _ in range(dfa.num_states)]
+        for state in reachable:
+            for target in table[state * k:(state + 1) * k]:
+                if target >= 0:
+                    predecessors[target].append(state)
+        useful = bytearray(dfa.num_states)
+        stack = [q for q in reachable if dfa.finals[q]]
+        for state in stack:
+            useful[state] = 1
+        while stack:
+            for source in predecessors[stack.pop()]:
+                if not useful[source]:
+                    useful[source] = 1
+                    stack.append(source)
+        states = [q for q in reachable if useful[q]]
+        local = {state: idx for idx, state in enumerate(states)}
+        return [[local[t] for t in table[q * k:(q + 1) * k] if t >= 0 and useful[t]] for q in states]
+
+    @staticmethod
+    def _berlekamp_massey(sequence: List[int]) -> List[Fraction]:
+        """Shortest connection polynomial C (C[0] == 1) with sum(C[i] * s[n - i]) == 0 for n >= len(C) - 1"""
+        current, previous = [Fraction(1)], [Fraction(1)]
+        length, shift, last_discrepancy = 0, 1, Fraction(1)
+        for n, value in enumerate(sequence):
+            discrepancy = value + sum(current[i] * sequence[n - i] for i in range(1, length + 1))
+            if discrepancy == 0:
+                shift += 1
+                continue
+            factor = discrepancy / last_discrepancy
+            candidate = current + [Fraction(0)] * max(0, len(previous) + shift - len(current))
+            for i, coefficient in enumerate(previous):
+                candidate[i + shift] -= factor * coefficient
+            if 2 * length <= n:
+                previous, length, last_discrepancy, shift = current, n + 1 - length, discrepancy, 1
+            else:
+                shift += 1
+            current = candidate
+        return current[:length + 1]
+
+    @staticmethod
+    def growth_summary(automaton: AutomatonLike, max_states_for_series: int = 300) -> Dict[str, object]:
+        """Summarize the size of the accepted language.
+
+        Returns a dict with:
+          finite               whether the language is finite
+          size                 number of accepted words when finite, otherwise None
+          longest_word_length  length of the longest accepted word when finite, otherwise None
+          growth_rate          spectral radius of the trimmed DFA: 0 for finite languages, 1 for
+                               polynomial growth, above 1 for exponential growth in the word length
+          generating_function  (numerator, denominator) integer coefficient lists of the rational
+                               generating function sum(count_n * z**n), or None when the trimmed DFA
+                               has more than max_states_for_series states
+        """
+        dfa = AutomataAnalyzer._as_dfa(automaton)
+        graph = AutomataAnalyzer._trim_graph(dfa)
+        components = AutomataAnalyzer._strongly_connected_components(graph)
+        cyclic = [c for c in components if len(c) > 1 or c[0] in graph[c[0]]]
+        summary = {"finite": not cyclic, "size": None, "longest_word_length": None,
+                   "growth_rate": 0.0, "generating_function": None}
+
+        if not cyclic:
+            # Longest path in the acyclic trimmed graph bounds the word length
+            depth = [0] * len(graph)
+            for component in components:  # reverse topological order
+                node = component[0]
+                depth[node] = max((depth[t] + 1 for t in graph[node]), default=0)
+            longest = depth[0] if graph else 0
+            summary["longest_word_length"] = longest if graph else None
+            summary["size"] = sum(AutomataAnalyzer.count_words(dfa, longest)) if graph else 0
+        else:
+            # The spectral radius is the largest one over the cyclic components; power
+            # iteration on A + I converges on each of them since they are irreducible.
+            rate = 0.0
+            for component in cyclic:
+                members = set(component)
+                local = {node: idx for idx, node in enumerate(component)}
+                edges = [[local[t] for t in graph[node] if t in members] for node in component]
+                vector = [1.0] * len(component)
+                estimate = 0.0
+                for _ in range(1000):
+                    product = [vector[i] + sum(vector[j] for j in edges[i]) for i in range(len(edges))]
+                    norm = max(product)
+                    vector = [value / norm for value in product]
+                    if abs(norm - estimate) < 1e-12 * norm:
+                        break
+                    estimate = norm
+                rate = max(rate, norm - 1.0)
+            summary["growth_rate"] = rate
+
+        if len(graph) <= max_states_for_series:
+            counts = AutomataAnalyzer.count_words(dfa, 2 * len(graph) + 2)
+            denominator = AutomataAnalyzer._berlekamp_massey(counts)
+            numerator = [sum(denominator[j] * counts[i - j] for j in range(min(i, len(denominator) - 1) + 1))
+                         for i in range(len(denominator) - 1)]
+            while numerator and numerator[-1] == 0:
+                numerator.pop()
+            summary["generating_function"] = ([int(c) for c in numerator], [int(c) for c in denominator])
+        return summary
+
+    @staticmethod
+    def compute_complement(automaton: AutomatonLike) -> AutomatonLike:
         """Compute the complement of a DFA. The resulting automaton accepts strings rejected by the input automaton and rejects strings accepted by it.
         
         The input automaton must be deterministic and complete.
         The complement operation simply swaps the final and non-final states while keeping everything else the same.
         
         Args:
-            automaton (Automaton): A deterministic and complete automaton to complement.
+            automaton (Automaton or CompiledAutomaton): A deterministic and complete automaton to complement.
             
         Returns:
-            Automaton: A new automaton that is the complement of the input automaton.
+            A new automaton of the same kind that is the complement of the input automaton.
             
         Raises:
             ValueError: If the input automaton is not deterministic or not complete.
@@ -568,6 +1450,18 @@ class AutomataAnalyzer:
         if not AutomataAnalyzer.is_complete(automaton):
             raise ValueError("The automaton must be complete")
             
+        if isinstance(automaton, CompiledAutomaton) or AutomataAnalyzer.result_cache is not None:
+            compiled = CompiledAutomaton.of(automaton)
+
+            def compute():
+                finals = bytearray(1 - final for final in compiled.finals)
+                return CompiledAutomaton(state_names=compiled.state_names, symbols=compiled.symbols,
+                                         initial=compiled.initial, finals=finals, table=compiled.table)
+
+            complement = AutomataAnalyzer._cached('compute_complement', [compiled], (), compute)
+            complement.name = f"{compiled.name}_complement"
+            return AutomataAnalyzer._as_input_kind(complement, automaton)
+
         # Create the complement automaton by swapping final and non-final states
         complement_final_states = automaton.states - automaton.final_states
         
@@ -583,44 +1477,187 @@ class AutomataAnalyzer:
 class WordProcessor:
     """Handles word and language operations"""
     @staticmethod
-    def accepts_word(automaton: Automaton, word: str) -> bool:
-        """Check if the automaton accepts a given word"""
-        current_states = {automaton.initial_state}
-        
-        for symbol in word:
-            if symbol not in automaton.alphabet:
-                return False
-                
-            next_states = set()
-            for state in current_states:
-                targets = automaton.transitions.get((state, symbol), set())
-                next_states.update(targets)
-            
-            if not next_states:
-                return False
-                
-            current_states = next_states
-        
-        # Check if any current state is final
-        return bool(current_states & automaton.final_states)
+    def accepts_word(automaton: AutomatonLike, word: str) -> bool:
+        """Check if the automaton accepts a given word.
+        Compile the automaton once with CompiledAutomaton.of when testing many words."""
+        return CompiledAutomaton.of(automaton).accepts(word)
     
     @staticmethod
-    def generate_words(automaton: Automaton, max_length: int = 5) -> List[str]:
+    def _shortlex_words(dfa: CompiledAutomaton, accepting: Sequence[int], max_length: int,
+                        offset: int = 0) -> Iterator[str]:
+        """Yield the words of length <= max_length leading the DFA to an accepting state, in shortlex order.
+
+        live[r][q] is non-zero when some word of length exactly r is accepted from state q,
+        so the depth-first walk for each length only enters branches that produce a word and
+        memory stays proportional to max_length. When an offset is given, live holds the number
+        of such words instead and whole subtrees before the offset are skipped without being walked.
+        """
+        table, k, symbols = dfa.table, dfa.num_symbols, dfa.symbols
+        if offset:
+            live = [[1 if accepting[q] else 0 for q in range(dfa.num_states)]]
+            for _ in range(max_length):
+                previous = live[-1]
+                live.append([sum(previous[target] for target in table[state * k:(state + 1) * k] if target >= 0)
+                             for state in range(dfa.num_states)])
+        else:
+            live = [bytearray(1 if accepting[q] else 0 for q in range(dfa.num_states))]
+            for _ in range(max_length):
+                previous = live[-1]
+                current = bytearray(dfa.num_states)
+                for state in range(dfa.num_states):
+                    base = state * k
+                    for symbol in range(k):
+                        target = table[base + symbol]
+                        if target >= 0 and previous[target]:
+                            current[state] = 1
+                            break
+                live.append(current)
+
+        for length in range(max_length + 1):
+            if not live[length][dfa.initial]:
+                continue
+            if offset >= live[length][dfa.initial]:
+                offset -= live[length][dfa.initial]
+                continue
+            path, next_symbol, word = [dfa.initial], [0], []
+            while path:
+                remaining = length - len(word)
+                if remaining == 0:
+                    yield "".join(word)
+                    path.pop()
+                    next_symbol.pop()
+                    if word:
+                        word.pop()
+                    continue
+                base, wanted = path[-1] * k, live[remaining - 1]
+                symbol = next_symbol[-1]
+                while symbol < k:
+                    target = table[base + symbol]
+                    if target >= 0 and wanted[target]:
+                        if offset < wanted[target]:
+                            break
+                        offset -= wanted[target]
+                    symbol += 1
+                if symbol < k:
+                    next_symbol[-1] = symbol + 1
+                    path.append(table[base + symbol])
+                    next_symbol.append(0)
+                    word.append(symbols[symbol])
+                else:
+                    path.pop()
+                    next_symbol.pop()
+                    if word:
+                        word.pop()
+
+    @staticmethod
+    def iter_words(automaton: AutomatonLike, max_length: int = 5, limit: Optional[int] = None,
+                   offset: int = 0) -> Iterator[str]:
+        """Lazily yield the distinct words accepted by the automaton up to max_length in shortlex order
+        (by length, then alphabetically). NFAs are determinized first. offset and limit select a page."""
+        dfa = AutomataAnalyzer._as_dfa(automaton)
+        words = WordProcessor._shortlex_words(dfa, dfa.finals, max_length, offset)
+        return islice(words, limit)
+
+    @staticmethod
+    def generate_rejected_words(automaton: AutomatonLike, max_length: int = 5,
+                                limit: Optional[int] = None, offset: int = 0) -> Iterator[str]:
+        """Lazily yield the distinct words up to max_length rejected by the automaton in shortlex order.
+        Walks the completed DFA and keeps the words ending in non-final states, including the
+        implicit trap state, instead of enumerating every word over the alphabet."""
+        dfa = AutomataAnalyzer._as_dfa(automaton).with_sink()
+        rejecting = bytearray(1 - final for final in dfa.finals)
+        words = WordProcessor._shortlex_words(dfa, rejecting, max_length, offset)
+        return islice(words, limit)
+
+    @staticmethod
+    def accepts_words(automaton: AutomatonLike, words: Iterable[str], chunk_size: int = 1 << 16) -> Sequence[bool]:
+        """Test many words at once. Returns a NumPy bool array when NumPy is installed, otherwise a list of bools.
+
+        Words are consumed in chunks. For DFAs each chunk is grouped by word length and, with
+        NumPy, simulated with one table gather per position across the whole group; NFAs are
+        simulated with state sets held as int bitmasks.
+        """
+        compiled = CompiledAutomaton.of(automaton)
+        np = _numpy()
+        results = []
+        words = iter(words)
+        while True:
+            chunk = list(islice(words, chunk_size))
+            if not chunk:
+                break
+            if compiled.table is None:
+                results.append(WordProcessor._accepts_chunk_bitset(compiled, chunk))
+            elif np is not None:
+                results.append(WordProcessor._accepts_chunk_numpy(compiled, chunk, np))
+            else:
+                results.append([compiled.accepts(word) for word in chunk])
+        if np is not None:
+            return np.concatenate([np.asarray(part, dtype=bool) for part in results]) if results else np.zeros(0, dtype=bool)
+        return [accepted for part in results for accepted in part]
+
+    @staticmethod
+    def accepts_words_from_file(automaton: AutomatonLike, filepath: str, chunk_size: int = 1 << 16) -> Sequence[bool]:
+        """Test every line of a text file as a word (line endings are stripped), streaming the file"""
+        with open(filepath, 'r', encoding='utf-8') as f:
+            return WordProcessor.accepts_words(automaton, (line.rstrip('\r\n') for line in f), chunk_size)
+
+    @staticmethod
+    def _accepts_chunk_numpy(dfa: CompiledAutomaton, words: List[str], np) -> "np.ndarray":
+        """Vectorized DFA simulation of a chunk of words, one gather per position for each word length"""
+        complete = dfa.with_sink()
+        k = complete.num_symbols
+        # Extra column k sends symbols outside the alphabet to a rejecting state
+        reject = complete.num_states
+        table = np.full((complete.num_states + 1, k + 1), reject, dtype=np.int32)
+        table[:complete.num_states, :k] = np.frombuffer(complete.table, dtype=np.int32).reshape(-1, k) if k else 0
+        finals = np.zeros(complete.num_states + 1, dtype=bool)
+        finals[:complete.num_states] = np.frombuffer(bytes(complete.finals), dtype=np.uint8).astype(bool)
+        # Symbols are matched character by character, like accepts_word
+        codepoints = np.array([ord(symbol) if len(symbol) == 1 else -1 for symbol in complete.symbols], dtype=np.int64)
+        order = np.argsort(codepoints)
+        sorted_codepoints = codepoints[order]
+
+        accepted = np.zeros(len(words), dtype=bool)
+        by_length = {}
+        for idx, word in enumerate(words):
+            by_length.setdefault(len(word), []).append(idx)
+        for length, indices in by_length.items():
+            indices = np.array(indices)
+            states = np.full(len(indices), complete.initial, dtype=np.int32)
+            if length:
+                text = "".join(words[i] for i in indices)
+                chars = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32).astype(np.int64).reshape(len(indices), length)
+                position = np.searchsorted(sorted_codepoints, chars)
+                position[position >= len(sorted_codepoints)] = 0
+                known = sorted_codepoints[position] == chars if len(sorted_codepoints) else np.zeros_like(chars, dtype=bool)
+                codes = np.where(known, order[position] if len(order) else 0, k)
+                for column in range(length):
+                    states = table[states, codes[:, column]]
+            accepted[indices] = finals[states]
+        return accepted
+
+    @staticmethod
+    def _accepts_chunk_bitset(nfa: CompiledAutomaton, words: List[str]) -> List[bool]:
+        """NFA simulation of a chunk of words with state sets held as int bitmasks"""
+        final_mask, start = nfa.final_mask(), 1 << nfa.initial
+        results = []
+        for word in words:
+            codes = nfa.encode(word)
+            if codes is None:
+                results.append(False)
+                continue
+            current = start
+            for symbol in codes:
+                current = nfa.step_mask(current, symbol)
+                if not current:
+                    break
+            results.append(bool(current & final_mask))
+        return results
+
+    @staticmethod
+    def generate_words(automaton: AutomatonLike, max_length: int = 5) -> List[str]:
         """Generate words accepted by the automaton up to max_length"""
-        accepted_words = []
-        
-        def explore(current_state: str, current_word: str):
-            if len(current_word) > max_length:
-                return
-            if current_state in automaton.final_states:
-                accepted_words.append(current_word)
-                
-            for symbol in automaton.alphabet:
-                for next_state in automaton.transitions.get((current_state, symbol), set()):
-                    explore(next_state, current_word + symbol)
-        
-        explore(automaton.initial_state, "")
-        return sorted(accepted_words, key=len)
+        return list(WordProcessor.iter_words(automaton, max_length))
 
     @staticmethod
     def generate_all_words(alphabet: Set[str], length: int) -> List[str]:
@@ -638,56 +1675,102 @@ class WordProcessor:
 
 class Visualizer:
     """Handles automaton visualization using Graphviz"""
+    # Optional cache of renderings keyed by DOT text (an svg_cache.SvgCache)
+    svg_cache = None
+    # Optional render_service.RenderService keeping Graphviz loaded between renders (with
+    # pygraphviz); without it every render runs a dot process
+    render_service = None
+
+    # Automata with more states are drawn as a graph_summary.GraphSummary of this many nodes
+    MAX_RENDERED_NODES = 200
+    # Graphs with more nodes are laid out with sfdp, which scales far better than dot
+    SFDP_THRESHOLD = 100
+
     @staticmethod
-    def to_dot(automaton: Automaton) -> str:
-        """Convert automaton to DOT format for visualization"""
+    def to_dot(automaton: AutomatonLike, summarize: bool = True, focus: Optional[str] = None,
+               radius: int = 1) -> str:
+        """Convert automaton to DOT format for visualization.
+        The output only depends on the automaton, so it can key a cache of renderings.
+
+        Transitions between the same two states are drawn as one edge labelled "a,b". With
+        summarize, an automaton of more than MAX_RENDERED_NODES states, or any automaton
+        when a focus state is given, is drawn as a GraphSummary around the focus state."""
+        from graph_summary import dot_id
+        num_states = automaton.num_states if isinstance(automaton, CompiledAutomaton) else len(automaton.states)
+        if summarize and (num_states > Visualizer.MAX_RENDERED_NODES or focus is not None):
+            return Visualizer.summary(automaton, focus, radius).to_dot(Visualizer.SFDP_THRESHOLD)
+        if isinstance(automaton, CompiledAutomaton):
+            automaton = automaton.to_automaton()
+
         dot = ["digraph {", 
                "  rankdir=LR;",
                "  node [shape=circle fontname=\"Arial\" fontsize=12];",
-               "  edge [fontname=\"Arial\" fontsize=10];",
-               
-               "  # Add invisible start node",
-               "  start [shape=none label=\"\"];"]
+               "  edge [fontname=\"Arial\" fontsize=10];"]
+        if num_states > Visualizer.SFDP_THRESHOLD:
+            dot.append("  layout=sfdp; overlap=prism; outputorder=edgesfirst;")
+        
+        # Add invisible start node
+        dot.append("  start [shape=none label=\"\"];")
         
         # Style for final states (double circle)
-        for state in automaton.final_states:
-            dot.append(f'  "{state}" [shape=doublecircle];')
+        for state in sorted(automaton.final_states):
+            dot.append(f'  {dot_id(state)} [shape=doublecircle];')
             
         # Style for non-final states (single circle)
-        for state in automaton.states - automaton.final_states:
-            dot.append(f'  "{state}" [shape=circle];')
+        for state in sorted(automaton.states - automaton.final_states):
+            dot.append(f'  {dot_id(state)} [shape=circle];')
         
         # Add initial state transition
-        dot.append(f'  start -> "{automaton.initial_state}";')
+        dot.append(f'  start -> {dot_id(automaton.initial_state)};')
         
-        # Add all other transitions
-        for (state, symbol), targets in automaton.transitions.items():
+        # Add all other transitions, one edge per pair of states
+        labels: Dict[Tuple[str, str], List[str]] = {}
+        for (state, symbol), targets in sorted(automaton.transitions.items()):
             for target in targets:
-                dot.append(f'  "{state}" -> "{target}" [label="{symbol}"];')
+                labels.setdefault((state, target), []).append(symbol)
+        for (state, target), symbols in sorted(labels.items()):
+            dot.append(f'  {dot_id(state)} -> {dot_id(target)} [label={dot_id(",".join(symbols))}];')
         
         dot.append("}")
         return "\n".join(dot)
         
+    @staticmethod
+    def summary(automaton: AutomatonLike, focus: Optional[str] = None, radius: int = 1):
+        """The graph_summary.GraphSummary of the automaton as drawn by to_dot: every state
+        individually when there are at most MAX_RENDERED_NODES of them and no focus is given"""
+        from graph_summary import GraphSummary
+        num_states = automaton.num_states if isinstance(automaton, CompiledAutomaton) else len(automaton.states)
+        if num_states <= Visualizer.MAX_RENDERED_NODES and focus is None:
+            return GraphSummary(automaton, None)
+        return GraphSummary(automaton, Visualizer.MAX_RENDERED_NODES, focus, radius)
+
+    @staticmethod
+    def drawing(automaton: AutomatonLike, focus: Optional[str] = None, radius: int = 1) -> tuple:
+        """(summary, to_dot text) of the automaton, building the summary only once for both"""
+        summary = Visualizer.summary(automaton, focus, radius)
+        if summary.max_nodes is None:
+            return summary, Visualizer.to_dot(automaton, summarize=False)
+        return summary, summary.to_dot(Visualizer.SFDP_THRESHOLD)
+
     @staticmethod
     def render_automaton(automaton: Automaton, output_path: str = None, format: str = 'png') -> str:
         """
         Render the automaton visualization using Graphviz.
         Returns the path to the generated file.
         """
-        import graphviz
         if not automaton:
             raise ValueError("No automaton provided for visualization")
             
-        # Create a graphviz.Source object from the DOT representation
-        dot = graphviz.Source(Visualizer.to_dot(automaton))
-        
         # If no output path specified, use a default name based on the automaton name
         if not output_path:
             output_path = f"automaton_{automaton.name}"
             
         # Render the graph
         try:
-            rendered_path = dot.render(output_path, format=format, cleanup=True)
+            data = Visualizer.render(Visualizer.to_dot(automaton), format)
+            rendered_path = f"{output_path}.{format}"
+            with open(rendered_path, 'wb') as f:
+                f.write(data)
             return rendered_path
         except Exception as e:
             raise Exception(f"Failed to render automaton: {str(e)}")
@@ -698,14 +1781,32 @@ class Visualizer:
         Generate SVG content for the automaton.
         Useful for displaying in the GUI without saving to file.
         """
-        import graphviz
         if not automaton:
             return ""
-            
-        dot = graphviz.Source(Visualizer.to_dot(automaton))
+        return Visualizer.dot_to_svg(Visualizer.to_dot(automaton))
+
+    @staticmethod
+    def dot_to_svg(dot_text: str) -> str:
+        """SVG rendering of DOT text, taken from svg_cache when the same text was rendered before"""
+        cache = Visualizer.svg_cache
+        key = cache.key(dot_text) if cache is not None else None
+        if key is not None:
+            cached = cache.get(key)
+            if cached is not None:
+                return cached.decode('utf-8')
         try:
             # Generate SVG content directly
-            svg_content = dot.pipe(format='svg').decode('utf-8')
-            return svg_content
+            svg_data = Visualizer.render(dot_text, 'svg')
         except Exception as e:
             raise Exception(f"Failed to generate SVG: {str(e)}")
+        if key is not None:
+            cache.put(key, svg_data)
+        return svg_data.decode('utf-8')
+
+    @staticmethod
+    def render(dot_text: str, format: str = 'svg') -> bytes:
+        """Render DOT text with Graphviz, through render_service when one is set"""
+        if Visualizer.render_service is not None:
+            return Visualizer.render_service.render(dot_text, format)
+        from render_service import render_dot
+        return render_dot(dot_text, format)
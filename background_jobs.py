@@ -0,0 +1,207 @@
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+import copy
+import threading
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, QCoreApplication, pyqtSignal, pyqtSlot
+
+
+class JobCancelled(Exception):
+    """Raised from a job's progress callback once the job has been cancelled"""
+
+
+class MemoryResultCache:
+    """Thread-safe LRU cache of the results of the jobs of a session, of any type (reports,
+    HTML, automata). Lookups return shallow copies so that callers renaming a result do not
+    alter the cached object. Derived automata are also kept across sessions by
+    result_cache.ResultCache, underneath the analyzer operations themselves."""
+    def __init__(self, max_entries: int = 32):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, object]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Tuple[bool, object]:
+        """Return (found, result)"""
+        with self._lock:
+            if key not in self._entries:
+                return False, None
+            self._entries.move_to_end(key)
+            return True, copy.copy(self._entries[key])
+
+    def put(self, key: Hashable, result: object):
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class JobSignals(QObject):
+    """Signals emitted by a Job from its worker thread. Every signal carries the job itself."""
+    progress = pyqtSignal(object, int, int)
+    finished = pyqtSignal(object, object)
+    failed = pyqtSignal(object, object)
+
+
+class Job(QRunnable):
+    """A single call of an automata operation executed on a worker thread.
+
+    With with_progress=True the operation receives a progress(done, pending) callback
+    as its progress keyword argument. The callback forwards the numbers to the GUI
+    thread and raises JobCancelled once cancel() was called, which stops the operation
+    at its next progress report.
+
+    key is the cache key of the result, or a callable computing it on the worker thread
+    (fingerprinting a large automaton is itself too slow for the GUI thread).
+
+    progress_format, if set, is a str.format template with done, pending and total
+    (done + pending) for showing the progress of jobs whose amount of work is known.
+    """
+    def __init__(self, description: str, fn: Callable, args: tuple, kwargs: dict,
+                 with_progress: bool = False, key=None, cache: Optional[MemoryResultCache] = None):
+        super().__init__()
+        # The manager keeps the Python object alive until the job is done
+        self.setAutoDelete(False)
+        self.description = description
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.with_progress = with_progress
+        self.key = key
+        self.cache = cache
+        self.on_result: Optional[Callable] = None
+        self.on_error: Optional[Callable] = None
+        self.on_cancel: Optional[Callable] = None
+        self.progress_format: Optional[str] = None
+        self.signals = JobSignals()
+        self.cancelled = False
+
+    def cancel(self):
+        """Request cancellation. The result of a cancelled job is never delivered."""
+        self.cancelled = True
+
+    def report_progress(self, done: int, pending: int):
+        if self.cancelled:
+            raise JobCancelled(f"{self.description} was cancelled")
+        self.signals.progress.emit(self, done, pending)
+
+    def run(self):
+        try:
+            if self.cancelled:
+                raise JobCancelled(f"{self.description} was cancelled")
+            if callable(self.key):
+                self.key = self.key()
+            if self.key is not None and self.cache is not None:
+                found, result = self.cache.get(self.key)
+                if found:
+                    self.signals.finished.emit(self, result)
+                    return
+            kwargs = dict(self.kwargs)
+            if self.with_progress:
+                kwargs['progress'] = self.report_progress
+            result = self.fn(*self.args, **kwargs)
+        except Exception as e:
+            self.signals.failed.emit(self, e)
+        else:
+            self.signals.finished.emit(self, result)
+
+
+class JobManager(QObject):
+    """Runs automata operations on a thread pool and delivers their results on the GUI thread.
+
+    Results of jobs submitted with a key are kept in an LRU cache of cache_size entries
+    and reused by later jobs with the same key.
+    """
+    job_started = pyqtSignal(object)
+    job_progress = pyqtSignal(object, int, int)
+    job_done = pyqtSignal(object)
+
+    def __init__(self, parent: Optional[QObject] = None, max_threads: Optional[int] = None,
+                 cache_size: int = 32):
+        super().__init__(parent)
+        self.pool = QThreadPool(self)
+        if max_threads:
+            self.pool.setMaxThreadCount(max_threads)
+        self.cache = MemoryResultCache(cache_size)
+        self._jobs: Dict[int, Job] = {}
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.shutdown)
+
+    @property
+    def active_jobs(self) -> List[Job]:
+        """Jobs queued or running that have not been cancelled, oldest first"""
+        return [job for job in self._jobs.values() if not job.cancelled]
+
+    def submit(self, description: str, fn: Callable, *args, key=None,
+               on_result: Optional[Callable] = None, on_error: Optional[Callable] = None,
+               on_cancel: Optional[Callable] = None, with_progress: bool = False,
+               progress_format: Optional[str] = None, **kwargs) -> Job:
+        """Run fn(*args, **kwargs) in the background.
+
+        on_result(result) or on_error(exception) is called on the GUI thread when the job
+        ends; on_cancel() instead once a cancelled job has stopped.
+        """
+        job = Job(description, fn, args, kwargs, with_progress=with_progress, key=key, cache=self.cache)
+        job.on_result, job.on_error, job.on_cancel = on_result, on_error, on_cancel
+        job.progress_format = progress_format
+        job.signals.progress.connect(self._on_progress)
+        job.signals.finished.connect(self._on_finished)
+        job.signals.failed.connect(self._on_failed)
+        self._jobs[id(job)] = job
+        self.job_started.emit(job)
+        self.pool.start(job)
+        return job
+
+    def cancel(self, job: Job):
+        """Cancel a job; a job still waiting in the queue is removed without running"""
+        job.cancel()
+        if self.pool.tryTake(job):
+            self._finish(job)
+
+    def cancel_all(self):
+        for job in list(self._jobs.values()):
+            self.cancel(job)
+
+    def clear_cache(self):
+        self.cache.clear()
+
+    @pyqtSlot()
+    def shutdown(self):
+        """Cancel every job and wait for the worker threads to stop"""
+        self.cancel_all()
+        self.pool.waitForDone()
+
+    def _finish(self, job: Job):
+        if self._jobs.pop(id(job), None) is not None:
+            self.job_done.emit(job)
+            if job.cancelled and job.on_cancel is not None:
+                job.on_cancel()
+
+    @pyqtSlot(object, int, int)
+    def _on_progress(self, job: Job, done: int, pending: int):
+        if not job.cancelled:
+            self.job_progress.emit(job, done, pending)
+
+    @pyqtSlot(object, object)
+    def _on_finished(self, job: Job, result: object):
+        self._finish(job)
+        if job.cancelled:
+            return
+        if job.key is not None:
+            self.cache.put(job.key, result)
+            result = copy.copy(result)
+        if job.on_result is not None:
+            job.on_result(result)
+
+    @pyqtSlot(object, object)
+    def _on_failed(self, job: Job, error: Exception):
+        self._finish(job)
+        if job.cancelled or isinstance(error, JobCancelled):
+            return
+        if job.on_error is not None:
+            job.on_error(error)
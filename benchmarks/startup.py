@@ -0,0 +1,70 @@
+"""Startup-time benchmark of the GUI.
+
+Measures, each in a fresh interpreter, the time to import the main window modules, to
+construct the ContentWidget shown after login, and to open the visualization page
+(the first use of QtWebEngine). Run from the repository root:
+
+    python benchmarks/startup.py [--runs 5]
+
+Set QT_QPA_PLATFORM=offscreen to run it without a display.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = r'''
+import json, sys, time
+start = time.perf_counter()
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QApplication
+QApplication.setAttribute(Qt.ApplicationAttribute.AA_ShareOpenGLContexts)
+app = QApplication(sys.argv)
+from main_window import MainWindow
+from content import ContentWidget
+imported = time.perf_counter()
+widget = ContentWidget()
+constructed = time.perf_counter()
+webengine_at_startup = "PyQt6.QtWebEngineWidgets" in sys.modules
+try:
+    widget.update_content("Automaton", "Visualize Current Automaton")
+    app.processEvents()
+    visualized = time.perf_counter() - constructed
+except ImportError:
+    visualized = None
+print(json.dumps({
+    "import": imported - start,
+    "content_widget": constructed - imported,
+    "first_visualization": visualized,
+    "webengine_loaded_at_startup": webengine_at_startup,
+}))
+'''
+
+
+def run_once() -> dict:
+    env = dict(os.environ)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    output = subprocess.run([sys.executable, "-c", PROBE], cwd=ROOT, env=env,
+                            capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    runs = [run_once() for _ in range(parser.parse_args().runs)]
+    print(f"QtWebEngine loaded at startup: {any(run['webengine_loaded_at_startup'] for run in runs)}")
+    for key in ("import", "content_widget", "first_visualization"):
+        values = sorted(run[key] for run in runs if run[key] is not None)
+        if not values:
+            print(f"{key:>20}: unavailable (QtWebEngine could not be loaded)")
+            continue
+        print(f"{key:>20}: median {values[len(values) // 2] * 1000:8.1f} ms"
+              f"   min {values[0] * 1000:8.1f} ms   max {values[-1] * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,236 @@
+from array import array
+from typing import Iterator, Sequence
+import mmap
+import os
+import struct
+import sys
+
+from automata_operations import CompiledAutomaton, _numpy
+
+MAGIC = b"FAB\0"
+VERSION = 1
+FLAG_CSR = 1
+
+# magic, version, flags, num_states, num_symbols, initial, num_targets, strings_size
+HEADER = struct.Struct('<4sHHIIIII')
+
+
+class StringTable(Sequence):
+    """Read-only sequence of strings stored as UTF-8 in a buffer, decoded on access"""
+    def __init__(self, offsets: Sequence[int], data: memoryview, start: int, count: int):
+        self._offsets = offsets
+        self._data = data
+        self._start = start
+        self._count = count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("string table index out of range")
+        index += self._start
+        return str(self._data[self._offsets[index]:self._offsets[index + 1]], 'utf-8')
+
+    def __iter__(self) -> Iterator[str]:
+        offsets, data = self._offsets, self._data
+        for index in range(self._start, self._start + self._count):
+            yield str(data[offsets[index]:offsets[index + 1]], 'utf-8')
+
+
+class MappedFile:
+    """A read-only memory mapping of a file and the views taken of it. close() releases
+    the views and unmaps the file, which Windows requires before the file can be deleted
+    or replaced."""
+    def __init__(self, f):
+        self._mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._views = []
+        self.buffer = self.track(memoryview(self._mapped))
+
+    def track(self, view: memoryview) -> memoryview:
+        self._views.append(view)
+        return view
+
+    def close(self):
+        # Views derived from others are released first
+        for view in reversed(self._views):
+            view.release()
+        self._views.clear()
+        self._mapped.close()
+
+
+class BinaryFormat:
+    """Compact binary automaton files (.fab) that are memory-mapped instead of parsed.
+
+    Layout, little-endian, every section starting on a 4-byte boundary:
+        header          HEADER
+        string offsets  uint32[2 + num_states + num_symbols]; strings are the name, the
+                        state names and the symbols, in that order
+        finals          uint8[num_states], padded
+        transitions     int32[num_states * num_symbols] table (-1 = no transition), or with
+                        FLAG_CSR int32[num_states * num_symbols + 1] offsets then
+                        int32[num_targets] targets
+        strings         UTF-8 bytes of all strings
+
+    load() maps files of at least MAP_THRESHOLD bytes and hands the transition sections to
+    CompiledAutomaton as memoryviews, so opening costs the same whatever the size of the
+    automaton; the mapping stays open until the automaton is closed. Smaller files are
+    read into memory and keep no hold on the file. JSON stays the interchange format;
+    .fab files are a cache-friendly local representation.
+    """
+    MAP_THRESHOLD = 16 << 20
+    @staticmethod
+    def _padded(size: int) -> int:
+        return (size + 3) & ~3
+
+    @staticmethod
+    def _int_array(values) -> array:
+        """Values as a little-endian int32 array"""
+        data = array('i', values)
+        if sys.byteorder != 'little':
+            data.byteswap()
+        return data
+
+    @staticmethod
+    def write(automaton: CompiledAutomaton, path: str):
+        """Write a compiled automaton. The file is replaced atomically."""
+        strings = [automaton.name, *automaton.state_names, *automaton.symbols]
+        encoded = [string.encode('utf-8') for string in strings]
+        string_offsets = array('I', [0])
+        for data in encoded:
+            string_offsets.append(string_offsets[-1] + len(data))
+        if automaton.table is not None:
+            flags, parts = 0, [BinaryFormat._int_array(automaton.table)]
+        else:
+            flags = FLAG_CSR
+            parts = [BinaryFormat._int_array(automaton.offsets), BinaryFormat._int_array(automaton.targets)]
+        header = HEADER.pack(MAGIC, VERSION, flags, automaton.num_states, automaton.num_symbols,
+                             automaton.initial, len(parts[-1]) if flags & FLAG_CSR else 0, string_offsets[-1])
+        if sys.byteorder != 'little':
+            string_offsets.byteswap()
+        finals = bytes(automaton.finals)
+        temporary = path + '.tmp'
+        with open(temporary, 'wb') as f:
+            f.write(header)
+            f.write(string_offsets.tobytes())
+            f.write(finals)
+            f.write(bytes(BinaryFormat._padded(len(finals)) - len(finals)))
+            for part in parts:
+                f.write(part.tobytes())
+            for data in encoded:
+                f.write(data)
+        os.replace(temporary, path)
+
+    @staticmethod
+    def is_binary(path: str) -> bool:
+        """Whether a file starts with the .fab magic number"""
+        with open(path, 'rb') as f:
+            return f.read(len(MAGIC)) == MAGIC
+
+    @staticmethod
+    def load(path: str) -> CompiledAutomaton:
+        """Open a .fab file as a compiled automaton, memory-mapped when large (see close()).
+        Raises ValueError if the file is not a valid automaton file."""
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size < BinaryFormat.MAP_THRESHOLD:
+                mapping, buffer = None, memoryview(f.read())
+            else:
+                mapping = MappedFile(f)
+                buffer = mapping.buffer
+        try:
+            automaton = BinaryFormat._parse(buffer, mapping.track if mapping else lambda view: view)
+        except BaseException:
+            if mapping is not None:
+                mapping.close()
+            raise
+        automaton.mapping = mapping
+        return automaton
+
+    @staticmethod
+    def _parse(buffer: memoryview, track) -> CompiledAutomaton:
+        """Compiled automaton over the contents of a .fab file; track is called with every view taken of the buffer"""
+        if len(buffer) < HEADER.size:
+            raise ValueError("Not a binary automaton file: the file is truncated" if len(buffer)
+                             else "Not a binary automaton file: the file is empty")
+        magic, version, flags, num_states, num_symbols, initial, num_targets, strings_size = \
+            HEADER.unpack_from(buffer)
+        if magic != MAGIC:
+            raise ValueError("Not a binary automaton file")
+        if version != VERSION:
+            raise ValueError(f"Unsupported binary automaton format version: {version}")
+        if not 0 <= initial < num_states:
+            raise ValueError("Initial state must be in states set")
+
+        num_strings = 1 + num_states + num_symbols
+        num_cells = num_states * num_symbols
+        sections = [('I', num_strings + 1), ('B', BinaryFormat._padded(num_states))]
+        if flags & FLAG_CSR:
+            sections += [('i', num_cells + 1), ('i', num_targets)]
+        else:
+            sections.append(('i', num_cells))
+        position, views = HEADER.size, []
+        for code, length in sections:
+            size = length * (1 if code == 'B' else 4)
+            if position + size > len(buffer):
+                raise ValueError("Binary automaton file is truncated")
+            views.append(BinaryFormat._view(track(buffer[position:position + size]), code, track))
+            position += size
+        if position + strings_size != len(buffer):
+            raise ValueError("Binary automaton file is truncated or has trailing data")
+        string_offsets, finals = views[0], views[1]
+        strings = track(buffer[position:])
+        if (string_offsets[0] != 0 or string_offsets[-1] != strings_size
+                or not BinaryFormat._non_decreasing(string_offsets)):
+            raise ValueError("Binary automaton file has a corrupt string table")
+
+        transitions = views[2:]
+        low, high = BinaryFormat._bounds(transitions[-1])
+        if low < (0 if flags & FLAG_CSR else -1) or high >= num_states:
+            raise ValueError("Binary automaton file has a transition to an unknown state")
+        common = dict(
+            state_names=StringTable(string_offsets, strings, 1, num_states),
+            symbols=StringTable(string_offsets, strings, 1 + num_states, num_symbols),
+            initial=initial,
+            finals=bytearray(finals[:num_states]),
+            name=StringTable(string_offsets, strings, 0, 1)[0],
+        )
+        if flags & FLAG_CSR:
+            offsets, targets = transitions
+            if offsets[0] != 0 or offsets[-1] != num_targets or not BinaryFormat._non_decreasing(offsets):
+                raise ValueError("Binary automaton file has corrupt transition offsets")
+            return CompiledAutomaton(offsets=offsets, targets=targets, **common)
+        return CompiledAutomaton(table=transitions[0], **common)
+
+    @staticmethod
+    def _bounds(values: Sequence[int]) -> tuple:
+        """Smallest and largest value, (0, -1) when empty; vectorized with NumPy when available"""
+        if not len(values):
+            return 0, -1
+        np = _numpy()
+        if np is not None:
+            data = np.frombuffer(values, dtype=np.int32)
+            return int(data.min()), int(data.max())
+        return min(values), max(values)
+
+    @staticmethod
+    def _non_decreasing(values: Sequence[int]) -> bool:
+        """Whether offsets never decrease, so that every slice they delimit is within bounds"""
+        np = _numpy()
+        if np is not None and isinstance(values, memoryview):
+            data = np.frombuffer(values, dtype=np.uint32 if values.format == 'I' else np.int32)
+            return bool((data[1:] >= data[:-1]).all())
+        return all(first <= second for first, second in zip(values, values[1:]))
+
+    @staticmethod
+    def _view(data: memoryview, code: str, track) -> Sequence[int]:
+        """Typed view of little-endian data, copied and byte-swapped only on big-endian hosts"""
+        if code == 'B' or sys.byteorder == 'little':
+            return track(data.cast(code))
+        values = array(code)
+        values.frombytes(data)
+        values.byteswap()
+        return values
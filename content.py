@@ -1,22 +1,60 @@
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QLabel, QStackedWidget, QTextEdit,
                             QFrame, QGraphicsDropShadowEffect, QGroupBox, QLineEdit,
                             QFormLayout, QHBoxLayout, QTextEdit, QMessageBox, QComboBox,
-                            QFileDialog, QInputDialog,QListWidget)
-from PyQt6.QtWebEngineWidgets import QWebEngineView
-from PyQt6.QtCore import Qt, QUrl
-from PyQt6.QtGui import QFont, QColor, QPixmap
-from custom_widgets import ModernButton 
-from automata_operations import AutomataManager, Visualizer, AutomataAnalyzer
+                            QFileDialog, QInputDialog,QListWidget, QGraphicsView)
+from PyQt6.QtCore import Qt, QUrl, QCoreApplication
+from PyQt6.QtGui import QFont, QColor, QPixmap, QPainter
+from custom_widgets import ModernButton, ModernSlider
+from automata_operations import BINARY_EXTENSION, AutomataManager, Visualizer, AutomataAnalyzer, CompiledAutomaton
+from background_jobs import JobManager
+from result_cache import ResultCache
+from svg_cache import SvgCache
+from render_service import RenderService, graphviz_available, pygraphviz_available
+from graph_scene import AutomatonScene
+from itertools import islice
 import os
+import sqlite3
 
 
 class ContentWidget(QWidget):
+    # Number of generated words rendered per page on the word generation pages
+    WORDS_PAGE_SIZE = 500
+    # Subset construction is aborted past this many DFA states instead of exhausting memory
+    MAX_DFA_STATES = 200000
+
     def __init__(self, user_manager=None, current_user=None):
         super().__init__()
         self.stacked_widget = QStackedWidget()
         self.automata_manager = AutomataManager()
+        # Derived automata (DFAs, minimal DFAs, unions, ...) are kept across sessions
+        # unless the directory is read-only
+        try:
+            AutomataAnalyzer.result_cache = ResultCache.for_directory(self.automata_manager.automata_dir)
+        except (OSError, sqlite3.Error):
+            AutomataAnalyzer.result_cache = None
+        try:
+            Visualizer.svg_cache = SvgCache.for_directory(self.automata_manager.automata_dir)
+        except OSError:
+            Visualizer.svg_cache = None
+        # With pygraphviz, layouts run in a long-lived worker keeping Graphviz loaded, which a
+        # runaway layout cannot hang or exhaust; without it each render is a dot process anyway
+        if pygraphviz_available():
+            Visualizer.render_service = RenderService()
+            app = QCoreApplication.instance()
+            if app is not None:
+                app.aboutToQuit.connect(lambda: Visualizer.render_service.shutdown(wait=False))
+        # Cache key of the DOT text shown by the visualization page, None when it shows something else
+        self._shown_visualization = None
+        # Focus state and radius of the summary drawn for large automata
+        self._visualization_focus = None
+        self._visualization_radius = 1
         self.user_manager = user_manager
         self.current_user = current_user
+        # Long-running operations run in the background, at most one per page
+        self.job_manager = JobManager(self)
+        self._page_jobs = {}
+        # catalog_stamp() of the automata directory when its catalog was last refreshed
+        self._catalog_stamp = None
         self.initUI()
         
     def initUI(self):
@@ -31,29 +69,144 @@ class ContentWidget(QWidget):
         self.title_label.setStyleSheet("color: white;")
         header_layout.addWidget(self.title_label)
         header_layout.addStretch(1)
-          # Create pages for different operations
+
+        # Status of background jobs, hidden while no job is running
+        self.job_status_label = QLabel()
+        self.job_status_label.setStyleSheet("color: #8A98AC; font-size: 13px;")
+        self.job_progress_bar = ModernSlider()
+        self.job_progress_bar.setRange(0, 0)
+        self.job_progress_bar.setFixedWidth(140)
+        self.cancel_job_btn = ModernButton("Cancel", accent_color="#FF4757")
+        self.cancel_job_btn.clicked.connect(self.cancel_jobs)
+        for widget in (self.job_status_label, self.job_progress_bar, self.cancel_job_btn):
+            widget.setVisible(False)
+            header_layout.addWidget(widget)
+        self.job_manager.job_started.connect(lambda job: self.update_job_status())
+        self.job_manager.job_done.connect(lambda job: self.update_job_status())
+        self.job_manager.job_progress.connect(self.show_job_progress)
+        # Only the welcome page is built up front; the page of each sidebar action is
+        # built on first navigation (see ensure_page), so startup does not pay for
+        # QtWebEngine unless the visualization is opened
         self.create_welcome_page()
-        self.create_automaton_creation_page()
-        self.create_determinism_check_page()
-        self.create_completeness_check_page()        
-        self.create_visualization_page()
-        self.create_load_automaton_page()
-        self.create_delete_automaton_page()
-        self.create_check_equivalence_page()
-        self.create_make_complete_page()
-        self.create_convert_nfa_to_dfa_page()
-        self.create_minimality_check_page()
-        self.create_minimize_automaton_page()
-        self.create_test_word_acceptance_page()
-        self.create_generate_accepted_words_page()
-        self.create_generate_rejected_words_page()
-        self.create_compute_union_page()
-        self.create_compute_intersection_page()
-        self.create_compute_complement_page()
+        self._pages = {}
+        self.page_builders = {
+            "Create New Automaton": self.create_automaton_creation_page,
+            "Check Determinism": self.create_determinism_check_page,
+            "Check Completeness": self.create_completeness_check_page,
+            "Visualize Current Automaton": self.create_visualization_page,
+            "Load Automaton from File": self.create_load_automaton_page,
+            "Delete Saved Automaton File": self.create_delete_automaton_page,
+            "Check Equivalence": self.create_check_equivalence_page,
+            "Make Automaton Complete": self.create_make_complete_page,
+            "Convert NFA to DFA": self.create_convert_nfa_to_dfa_page,
+            "Check Minimality": self.create_minimality_check_page,
+            "Minimize Automaton": self.create_minimize_automaton_page,
+            "Test Word Acceptance": self.create_test_word_acceptance_page,
+            "Generate Accepted Words": self.create_generate_accepted_words_page,
+            "Generate Rejected Words": self.create_generate_rejected_words_page,
+            "Compute Union": self.create_compute_union_page,
+            "Compute Intersection": self.create_compute_intersection_page,
+            "Compute Complement": self.create_compute_complement_page
+        }
+        # Pages showing the status of the current automaton, refreshed when it changes
+        self.automaton_page_refreshers = {
+            "Visualize Current Automaton": self.refresh_visualization,
+            "Check Determinism": self.update_determinism_status,
+            "Check Completeness": self.update_completeness_status,
+            "Make Automaton Complete": self.update_make_complete_status,
+            "Convert NFA to DFA": self.update_nfa_to_dfa_status,
+            "Check Minimality": self.update_minimality_status,
+            "Minimize Automaton": self.update_minimize_status
+        }
 
-        
         layout.addLayout(header_layout)
         layout.addWidget(self.stacked_widget, 1)
+
+    def ensure_page(self, action):
+        """Return the page of a sidebar action, building it on first use"""
+        page = self._pages.get(action)
+        if page is None:
+            index = self.stacked_widget.count()
+            self.page_builders[action]()
+            page = self._pages[action] = self.stacked_widget.widget(index)
+        return page
+
+    def refresh_page(self, action):
+        """Refresh the page of an action if it has been built; unbuilt pages are refreshed when first shown"""
+        if action in self._pages:
+            self.automaton_page_refreshers[action]()
+
+    def refresh_automaton_pages(self):
+        for action in self.automaton_page_refreshers:
+            self.refresh_page(action)
+
+    def run_job(self, page, description, fn, *args, **kwargs):
+        """Run fn in the background through the job manager, cancelling the job still running for the same page.
+        Keyword arguments are those of JobManager.submit."""
+        previous = self._page_jobs.get(page)
+        if previous is not None:
+            # The page is about to show the new job, not the cancellation of the old one
+            previous.on_cancel = None
+            self.job_manager.cancel(previous)
+        self._page_jobs[page] = self.job_manager.submit(description, fn, *args, **kwargs)
+
+    def saved_automata_files(self):
+        """Saved automaton files for the selection lists. The catalog is refreshed in the
+        background when the directory has changed, so that listing never waits for new
+        files to be analyzed."""
+        manager = self.automata_manager
+        stamp = self.catalog_stamp()
+        if stamp != self._catalog_stamp and self._page_jobs.get('catalog') not in self.job_manager.active_jobs:
+            self._catalog_stamp = stamp
+            self.run_job('catalog', "Indexing saved automata", lambda: manager.catalog.refresh())
+        return manager.list_saved_automata(refresh=False)
+
+    def catalog_stamp(self):
+        """Names, sizes and modification times of the automaton files. The caches kept in the
+        same directory are left out: their writes do not call for indexing again."""
+        try:
+            with os.scandir(self.automata_manager.automata_dir) as entries:
+                return frozenset((entry.name, entry.stat().st_size, entry.stat().st_mtime_ns) for entry in entries
+                                 if entry.name.endswith(('.json', BINARY_EXTENSION)) and entry.is_file())
+        except OSError:
+            return None
+
+    @staticmethod
+    def result_key(operation, automata, *params):
+        """Cache key of an operation result. Fingerprinting is deferred to the worker thread."""
+        def key():
+            parts = [operation]
+            for automaton in automata:
+                parts += [CompiledAutomaton.of(automaton).fingerprint(), automaton.name]
+            return tuple(parts) + params
+        return key
+
+    def update_job_status(self):
+        jobs = self.job_manager.active_jobs
+        if not jobs:
+            self._page_jobs = {}
+        text = jobs[-1].description + "..." if jobs else ""
+        if len(jobs) > 1:
+            text += f" (+{len(jobs) - 1} more)"
+        self.job_status_label.setText(text)
+        self.job_progress_bar.setRange(0, 0)
+        for widget in (self.job_status_label, self.job_progress_bar, self.cancel_job_btn):
+            widget.setVisible(bool(jobs))
+
+    def show_job_progress(self, job, done, pending):
+        if self.job_manager.active_jobs[-1:] != [job]:
+            return
+        if job.progress_format is None:
+            self.job_status_label.setText(f"{job.description}... {done:,} states explored, {pending:,} pending")
+            return
+        self.job_status_label.setText(
+            f"{job.description}... " + job.progress_format.format(done=done, pending=pending, total=done + pending))
+        self.job_progress_bar.setRange(0, done + pending)
+        self.job_progress_bar.setValue(done)
+
+    def cancel_jobs(self):
+        self.job_manager.cancel_all()
+        self.update_job_status()
         
     def create_welcome_page(self):
         page = QWidget()
@@ -348,10 +501,10 @@ class ContentWidget(QWidget):
                 QMessageBox.information(
                     self, 
                     "Success", 
-                    f"Automaton '{name}' has been created and saved to saved_automatas/{name}.json"
+                    f"Automaton '{name}' has been created and saved to {self.automata_manager.automata_dir}/{name}.json"
                 )
                 self.clear_automaton_form()
-                self.refresh_visualization()  # Add visualization refresh
+                self.refresh_page("Visualize Current Automaton")
             else:
                 QMessageBox.warning(
                     self, 
@@ -660,19 +813,66 @@ class ContentWidget(QWidget):
         info_layout.addWidget(info_text)
         content.addWidget(info_box)
         
-        # Visualization area
-        self.visualization_area = QWebEngineView()
-        self.visualization_area.setMinimumSize(550, 400)
-        self.visualization_area.setMaximumSize(16777215, 16777215)  # Allow it to grow if needed
-        self.visualization_area.setStyleSheet("""
-            QWebEngineView {
+        # Large automata are drawn as a summary around a focus state, shown only for them
+        self.visualization_focus_row = QWidget()
+        focus_layout = QHBoxLayout(self.visualization_focus_row)
+        focus_layout.setContentsMargins(0, 0, 0, 0)
+        focus_label = QLabel("Focus state:")
+        focus_label.setStyleSheet("color: #8A98AC;")
+        self.visualization_focus_input = QLineEdit()
+        self.visualization_focus_input.setPlaceholderText(
+            "State whose neighbourhood to expand, e.g. one named on a cluster")
+        self.visualization_focus_input.setStyleSheet("""
+            QLineEdit {
                 background-color: #121B2E;
                 border: 1px solid #2A3344;
                 border-radius: 5px;
-                padding: 10px;
+                padding: 8px;
+                color: white;
+            }
+            QLineEdit:focus {
+                border: 1px solid #00C2FF;
             }
         """)
-        self.visualization_area.setUrl(QUrl("about:blank"))
+        self.visualization_focus_input.returnPressed.connect(self.expand_visualization)
+        expand_btn = ModernButton("Expand Neighbourhood", accent_color="#00C2FF")
+        expand_btn.clicked.connect(self.expand_visualization)
+        overview_btn = ModernButton("Overview", accent_color="#8A98AC")
+        overview_btn.clicked.connect(self.show_visualization_overview)
+        focus_layout.addWidget(focus_label)
+        focus_layout.addWidget(self.visualization_focus_input, 1)
+        focus_layout.addWidget(expand_btn)
+        focus_layout.addWidget(overview_btn)
+        self.visualization_focus_row.setVisible(False)
+        content.addWidget(self.visualization_focus_row)
+        
+        # Visualization area: the built-in drawing shows at once and the Graphviz SVG
+        # replaces it once rendered. QtWebEngine is only loaded when an SVG is first shown.
+        self.visualization_stack = QStackedWidget()
+        self.visualization_stack.setMinimumSize(550, 400)
+        self.visualization_message = QLabel()
+        self.visualization_message.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.visualization_message.setWordWrap(True)
+        self.visualization_message.setOpenExternalLinks(True)
+        self.visualization_message.setStyleSheet("background: #fff; border-radius: 5px; padding: 20px;")
+        self.visualization_preview = QGraphicsView()
+        self.visualization_preview.setRenderHint(QPainter.RenderHint.Antialiasing)
+        self.visualization_preview.setDragMode(QGraphicsView.DragMode.ScrollHandDrag)
+        self.visualization_preview.setStyleSheet("""
+            QGraphicsView {
+                background-color: #fff;
+                border: 1px solid #2A3344;
+                border-radius: 5px;
+            }
+        """)
+        self._preview_zoom = 1.0
+        self.visualization_area = None
+        self.visualization_stack.addWidget(self.visualization_message)
+        self.visualization_stack.addWidget(self.visualization_preview)
+        self.visualization_status = QLabel()
+        self.visualization_status.setWordWrap(True)
+        self.visualization_status.setOpenExternalLinks(True)
+        self.visualization_status.setStyleSheet("color: #8A98AC; font-size: 12px;")
         
         # Button area
         button_layout = QHBoxLayout()
@@ -734,7 +934,7 @@ class ContentWidget(QWidget):
                 background-color: #1E8449;
             }
         """)
-        self.refresh_btn.clicked.connect(self.refresh_visualization)
+        self.refresh_btn.clicked.connect(lambda: self.refresh_visualization(force=True))
         
         self.export_btn = ModernButton("Export as PNG", accent_color="#7B42F6")
         self.export_btn.setFixedSize(120, 35)
@@ -768,7 +968,8 @@ class ContentWidget(QWidget):
         button_layout.addWidget(self.export_btn)
         
         # Add everything to the main layout
-        content.addWidget(self.visualization_area)
+        content.addWidget(self.visualization_stack, 1)
+        content.addWidget(self.visualization_status)
         content.addLayout(button_layout)
         group.setLayout(content)
         
@@ -776,89 +977,206 @@ class ContentWidget(QWidget):
         self.stacked_widget.addWidget(page)
         
     def set_graph_zoom(self, delta):
+        if self.visualization_stack.currentWidget() is self.visualization_preview:
+            new_zoom = max(0.2, min(3.0, self._preview_zoom + delta))
+            self.visualization_preview.scale(new_zoom / self._preview_zoom, new_zoom / self._preview_zoom)
+            self._preview_zoom = new_zoom
+            return
+        if self.visualization_area is None:
+            return
         current_zoom = self.visualization_area.zoomFactor()
         new_zoom = max(0.2, min(3.0, current_zoom + delta))  # Clamp between 0.2x and 3x
         self.visualization_area.setZoomFactor(new_zoom)
 
-    def refresh_visualization(self):
-        """Update the automaton visualization"""
-        if not self.automata_manager.current_automaton:
-            error_html = """
-                <div style='display: flex; justify-content: center; align-items: center; height: 100%; color: #8A98AC; text-align: center; background: #fff;'>
-                    <div>
-                        <h3 style='color: #00C2FF;'>No Automaton Loaded</h3>
-                        <p>Create a new automaton or load an existing one to see its visualization.</p>
-                    </div>
-                </div>
-            """
-            self.visualization_area.setHtml(error_html)
+    def visualization_web_view(self):
+        """The web view showing Graphviz SVGs, created on first use; None without QtWebEngine"""
+        if self.visualization_area is None:
+            try:
+                from PyQt6.QtWebEngineWidgets import QWebEngineView
+            except ImportError:
+                return None
+            self.visualization_area = QWebEngineView()
+            self.visualization_area.setMaximumSize(16777215, 16777215)  # Allow it to grow if needed
+            self.visualization_area.setStyleSheet("""
+                QWebEngineView {
+                    background-color: #121B2E;
+                    border: 1px solid #2A3344;
+                    border-radius: 5px;
+                    padding: 10px;
+                }
+            """)
+            self.visualization_area.setUrl(QUrl("about:blank"))
+            self.visualization_stack.addWidget(self.visualization_area)
+        return self.visualization_area
+
+    def show_visualization_message(self, title, text, color="#8A98AC", title_color="#00C2FF"):
+        self.visualization_message.setText(f"""
+            <div style='color: {color}; text-align: center;'>
+                <h3 style='color: {title_color};'>{title}</h3>
+                {text}
+            </div>
+        """)
+        self.visualization_stack.setCurrentWidget(self.visualization_message)
+
+    def show_visualization_preview(self, summary, layout):
+        """Draw a graph summary with its built-in layout"""
+        scene = AutomatonScene(summary, layout, parent=self.visualization_preview)
+        self.visualization_preview.setScene(scene)
+        self.visualization_preview.resetTransform()
+        self._preview_zoom = 1.0
+        viewport = self.visualization_preview.viewport().rect()
+        rect = scene.sceneRect()
+        if rect.width() > viewport.width() or rect.height() > viewport.height():
+            self.visualization_preview.fitInView(rect, Qt.AspectRatioMode.KeepAspectRatio)
+            self._preview_zoom = self.visualization_preview.transform().m11()
+        self.visualization_stack.setCurrentWidget(self.visualization_preview)
+
+    def show_visualization_svg(self, key, svg_content):
+        """Show the Graphviz rendering of the DOT text with the given key, if it is still the one wanted"""
+        if key != self._shown_visualization:
+            return
+        view = self.visualization_web_view()
+        if view is None:
+            self.visualization_status.setText("QtWebEngine is not installed; showing the built-in drawing.")
+            return
+        # Wrap SVG in HTML with proper styling
+        html_content = f"""
+            <html>
+            <head>
+                <style>
+                    body {{ 
+                        margin: 0;
+                        padding: 20px;
+                        display: flex;
+                        justify-content: flex-start;
+                        /* Removed align-items: center to pull SVG to top */
+                        background-color: #fff;
+                    }}
+                    svg {{
+                        width: 100%;
+                        height: 100%;
+                        max-width: 850px;
+                        max-height: 400px;
+                        display: block;
+                        margin-left: 140px; /* Pull SVG a bit to the left */
+                        margin-right: 150px;
+                        margin-top: 0px;      /* Add space above the SVG */
+                        margin-bottom: 150px;
+                    }}
+                </style>
+            </head>
+            <body>
+                {svg_content}
+            </body>
+            </html>
+        """
+        
+        # Display the wrapped SVG content
+        view.setHtml(html_content)
+        self.visualization_stack.setCurrentWidget(view)
+        self.visualization_status.clear()
+
+    def show_visualization_error(self, key, error):
+        """Keep the built-in drawing when Graphviz fails"""
+        if key == self._shown_visualization:
+            self.visualization_status.setText(f"Graphviz failed ({error}); showing the built-in drawing.")
+
+    def expand_visualization(self):
+        """Draw the neighbourhood of the focus state; expanding the same state again widens it"""
+        automaton = self.automata_manager.current_automaton
+        state = self.visualization_focus_input.text().strip()
+        if not automaton or not state:
+            return
+        if state not in automaton.states:
+            QMessageBox.warning(self, "Error", f"Unknown state: {state}")
+            return
+        if state == self._visualization_focus:
+            self._visualization_radius += 1
+        else:
+            self._visualization_focus, self._visualization_radius = state, 1
+        self.refresh_visualization()
+
+    def show_visualization_overview(self):
+        """Draw the summary around the initial state again"""
+        self._visualization_focus, self._visualization_radius = None, 1
+        self.visualization_focus_input.clear()
+        self.refresh_visualization()
+
+    def refresh_visualization(self, force=False):
+        """Update the automaton visualization. The page is left as it is when it already
+        shows the current automaton, unless force is set.
+
+        The summary and DOT text are built in the background. A cached Graphviz rendering
+        is then shown at once; otherwise the built-in drawing is shown while Graphviz renders
+        in the background, and stays when Graphviz is not installed."""
+        automaton = self.automata_manager.current_automaton
+        self.visualization_focus_row.setVisible(
+            bool(automaton) and len(automaton.states) > Visualizer.MAX_RENDERED_NODES)
+        if not automaton:
+            previous = self._page_jobs.pop("Visualize Current Automaton", None)
+            if previous is not None:
+                self.job_manager.cancel(previous)
+            self._shown_visualization = None
+            self.visualization_status.clear()
+            self.show_visualization_message(
+                "No Automaton Loaded",
+                "<p>Create a new automaton or load an existing one to see its visualization.</p>")
             self.export_btn.setEnabled(False)
             return
             
+        if self._visualization_focus not in automaton.states:
+            self._visualization_focus, self._visualization_radius = None, 1
+        self.run_job("Visualize Current Automaton", "Drawing the visualization", self.prepare_visualization,
+                     automaton, self._visualization_focus, self._visualization_radius,
+                     on_result=lambda prepared: self.show_prepared_visualization(prepared, force),
+                     on_error=self.show_visualization_failure)
+
+    @staticmethod
+    def prepare_visualization(automaton, focus, radius):
+        """Summary, DOT text, its cache key, cached SVG and, when there is no cached SVG, the
+        built-in layout of the drawing of an automaton (runs on a worker thread)"""
+        summary, dot_text = Visualizer.drawing(automaton, focus, radius)
+        key = SvgCache.key(dot_text)
+        cached = Visualizer.svg_cache.get(key) if Visualizer.svg_cache is not None else None
+        layout = AutomatonScene.layout_of(summary) if cached is None else None
+        return summary, dot_text, key, cached, layout
+
+    def show_prepared_visualization(self, prepared, force=False):
+        summary, dot_text, key, cached, layout = prepared
+        if key == self._shown_visualization and not force:
+            return
+        self._shown_visualization = key
+        self.export_btn.setEnabled(True)
+        if cached is not None:
+            self.visualization_status.clear()
+            self.show_visualization_svg(key, cached.decode('utf-8'))
+            return
         try:
-            # Get SVG content
-            svg_content = Visualizer.get_svg_content(self.automata_manager.current_automaton)
-            
-            # Wrap SVG in HTML with proper styling
-            html_content = f"""
-                <html>
-                <head>
-                    <style>
-                        body {{ 
-                            margin: 0;
-                            padding: 20px;
-                            display: flex;
-                            justify-content: flex-start;
-                            /* Removed align-items: center to pull SVG to top */
-                            background-color: #fff;
-                        }}
-                        svg {{
-                            width: 100%;
-                            height: 100%;
-                            max-width: 850px;
-                            max-height: 400px;
-                            display: block;
-                            margin-left: 140px; /* Pull SVG a bit to the left */
-                            margin-right: 150px;
-                            margin-top: 0px;      /* Add space above the SVG */
-                            margin-bottom: 150px;
-                        }}
-                    </style>
-                </head>
-                <body>
-                    {svg_content}
-                </body>
-                </html>
-            """
-            
-            # Display the wrapped SVG content
-            self.visualization_area.setHtml(html_content)
-            self.export_btn.setEnabled(True)
+            self.show_visualization_preview(summary, layout)
         except Exception as e:
-            error_message = str(e)
-            if "graphviz" in error_message.lower():
-                error_html = f"""
-                    <div style='display: flex; justify-content: center; align-items: center; height: 100%; color: #FF4757; text-align: center; background: #fff;'>
-                        <div>
-                            <h3>Graphviz Error</h3>
-                            <p>Please make sure Graphviz is installed on your system.</p>
-                            <p>You can install it from: <a href='https://graphviz.org/download/' style='color: #00C2FF;'>https://graphviz.org/download/</a></p>
-                            <p style='color: #8A98AC; font-size: 12px;'>Error details: {error_message}</p>
-                        </div>
-                    </div>
-                """
-            else:
-                error_html = f"""
-                    <div style='display: flex; justify-content: center; align-items: center; height: 100%; color: #FF4757; text-align: center; background: #fff;'>
-                        <div>
-                            <h3>Visualization Error</h3>
-                            <p>An error occurred while generating the visualization.</p>
-                            <p style='color: #8A98AC; font-size: 12px;'>Error details: {error_message}</p>
-                        </div>
-                    </div>
-                """
-            self.visualization_area.setHtml(error_html)
-            self.export_btn.setEnabled(False)
+            self.show_visualization_failure(e)
+            return
+        if graphviz_available():
+            self.visualization_status.setText("Rendering with Graphviz...")
+            # A page of its own, so that refreshing the drawing does not cancel a render still wanted
+            self.run_job("Visualize Current Automaton (Graphviz)", "Rendering the visualization",
+                         Visualizer.dot_to_svg, dot_text, on_result=lambda svg: self.show_visualization_svg(key, svg),
+                         on_error=lambda error: self.show_visualization_error(key, error))
+        else:
+            self.visualization_status.setText(
+                "Graphviz is not installed; showing the built-in drawing. For the Graphviz layout, "
+                "install it from <a href='https://graphviz.org/download/' style='color: #00C2FF;'>"
+                "https://graphviz.org/download/</a>.")
+
+    def show_visualization_failure(self, error):
+        self._shown_visualization = None
+        self.visualization_status.clear()
+        self.show_visualization_message(
+            "Visualization Error",
+            f"""<p>An error occurred while generating the visualization.</p>
+            <p style='color: #8A98AC; font-size: 12px;'>Error details: {error}</p>""",
+            color="#FF4757", title_color="#FF4757")
+        self.export_btn.setEnabled(False)
     
     def export_visualization(self):
         """Export the current visualization as a PNG file"""
@@ -883,24 +1201,48 @@ class ContentWidget(QWidget):
                 if not file_path.lower().endswith('.png'):
                     file_path += '.png'
                     
-                # Render the automaton
-                rendered_path = Visualizer.render_automaton(
-                    self.automata_manager.current_automaton,
-                    output_path=file_path[:-4],  # Remove .png extension
-                    format='png'
-                )
-                
-                QMessageBox.information(
-                    self,
-                    "Success",
-                    f"Visualization exported successfully to:\n{rendered_path}"
-                )
+                # Render the automaton in the background, with the built-in drawing when
+                # Graphviz is not installed
+                automaton = self.automata_manager.current_automaton
+                if graphviz_available():
+                    self.run_job("Export Visualization", "Exporting the visualization",
+                                 Visualizer.render_automaton, automaton,
+                                 output_path=file_path[:-4],  # Remove .png extension
+                                 format='png', on_result=self.show_export_success,
+                                 on_error=self.show_export_error)
+                else:
+                    self.run_job("Export Visualization", "Laying out the visualization", self.layout_overview,
+                                 automaton, on_result=lambda prepared: self.save_drawing(prepared, file_path),
+                                 on_error=self.show_export_error)
         except Exception as e:
-            QMessageBox.warning(
-                self,
-                "Error",
-                f"Failed to export visualization: {str(e)}"
-            )
+            self.show_export_error(e)
+
+    @staticmethod
+    def layout_overview(automaton):
+        """Summary of an automaton and its built-in layout (runs on a worker thread)"""
+        summary = Visualizer.summary(automaton)
+        return summary, AutomatonScene.layout_of(summary)
+
+    def save_drawing(self, prepared, file_path):
+        summary, layout = prepared
+        try:
+            self.show_export_success(AutomatonScene(summary, layout).save_image(file_path))
+        except Exception as e:
+            self.show_export_error(e)
+
+    def show_export_success(self, rendered_path):
+        QMessageBox.information(
+            self,
+            "Success",
+            f"Visualization exported successfully to:\n{rendered_path}"
+        )
+
+    def show_export_error(self, error):
+        QMessageBox.warning(
+            self,
+            "Error",
+            f"Failed to export visualization: {str(error)}"
+        )
 
     def create_load_automaton_page(self):
         page = QWidget()
@@ -1096,7 +1438,7 @@ class ContentWidget(QWidget):
     def refresh_automata_list(self):
         """Refresh the list of available automata files"""
         self.automata_files_combo.clear()
-        automata_files = self.automata_manager.list_saved_automata()
+        automata_files = self.saved_automata_files()
         self.automata_files_combo.addItems(automata_files)
     
     def load_selected_automaton(self):
@@ -1104,27 +1446,37 @@ class ContentWidget(QWidget):
         if not selected_file:
             QMessageBox.warning(self, "Error", "Please select an automaton file to load")
             return
+        filepath = os.path.join(self.automata_manager.automata_dir, selected_file)
+        if (selected_file.endswith('.json') and os.path.exists(filepath)
+                and os.path.getsize(filepath) >= AutomataManager.STREAMING_THRESHOLD):
+            # Large files are streamed in the background with the load progress in the header
+            self.run_job("Load Automaton from File", f"Loading {selected_file}", self.read_large_automaton,
+                         selected_file, with_progress=True, progress_format="{done:,} of {total:,} KiB read",
+                         on_result=lambda automaton: self.show_loaded_automaton(selected_file, automaton),
+                         on_error=self.show_load_error)
+            return
         try:
-            self.automata_manager.load_automaton(selected_file)
-            self.update_current_automaton_display()
-            self.edit_automaton_btn.setEnabled(True)
-            self.refresh_visualization()
-            self.update_determinism_status()
-            self.update_completeness_status()
-            self.update_make_complete_status()
-            self.update_nfa_to_dfa_status()
-            self.update_minimality_status()
-            self.update_minimize_status()  # <-- Add this line
-            QMessageBox.information(self, "Success", f"Successfully loaded automaton from {selected_file}")
+            self.show_loaded_automaton(selected_file, self.automata_manager.load_automaton(selected_file))
         except Exception as e:
-            QMessageBox.warning(self, "Error", f"Failed to load automaton: {str(e)}")
-            self.edit_automaton_btn.setEnabled(False)
-            self.update_determinism_status()
-            self.update_completeness_status()
-            self.update_make_complete_status()
-            self.update_nfa_to_dfa_status()
-            self.update_minimality_status()
-            self.update_minimize_status()  # <-- Add this line
+            self.show_load_error(e)
+
+    def read_large_automaton(self, filename, progress):
+        """Stream a large automaton file (runs on a worker thread)"""
+        with self.automata_manager.load_compiled(
+                filename, progress=lambda done, total: progress(done >> 10, (total - done) >> 10)) as compiled:
+            return compiled.to_automaton()
+
+    def show_loaded_automaton(self, filename, automaton):
+        self.automata_manager.current_automaton = automaton
+        self.update_current_automaton_display()
+        self.edit_automaton_btn.setEnabled(True)
+        self.refresh_automaton_pages()
+        QMessageBox.information(self, "Success", f"Successfully loaded automaton from {filename}")
+
+    def show_load_error(self, error):
+        QMessageBox.warning(self, "Error", f"Failed to load automaton: {str(error)}")
+        self.edit_automaton_btn.setEnabled(False)
+        self.refresh_automaton_pages()
     
     def edit_loaded_automaton(self):
         """Open the loaded automaton in the creation page for editing"""
@@ -1134,6 +1486,7 @@ class ContentWidget(QWidget):
             
         # Fill the creation form with current automaton data
         automaton = self.automata_manager.current_automaton
+        creation_page = self.ensure_page("Create New Automaton")
         self.name_input.setText(automaton.name)
         self.states_input.setText(", ".join(sorted(automaton.states)))
         self.alphabet_input.setText(", ".join(sorted(automaton.alphabet)))
@@ -1149,7 +1502,7 @@ class ContentWidget(QWidget):
         self.final_states.setText(", ".join(sorted(automaton.final_states)))
         
         # Switch to creation page for editing
-        self.stacked_widget.setCurrentIndex(1)  # Index 1 is the creation page
+        self.stacked_widget.setCurrentWidget(creation_page)
         self.title_label.setText("Edit Automaton")
         
         # Show information message
@@ -1407,13 +1760,13 @@ class ContentWidget(QWidget):
         self.refresh_delete_automata_list()
     def refresh_delete_automata_list(self):
         self.delete_automata_combo.clear()
-        automata_files = self.automata_manager.list_saved_automata()
+        automata_files = self.saved_automata_files()
         self.delete_automata_combo.addItems(automata_files)
         self.update_file_count_label()
     
     def filter_delete_automata_list(self):
         search_text = self.delete_search_input.text().strip().lower()
-        automata_files = self.automata_manager.list_saved_automata()
+        automata_files = self.saved_automata_files()
         filtered_files = [f for f in automata_files if search_text in f.lower()]
         self.delete_automata_combo.clear()
         self.delete_automata_combo.addItems(filtered_files)
@@ -1541,7 +1894,6 @@ class ContentWidget(QWidget):
         layout.addWidget(group)
         self.stacked_widget.addWidget(page)
         # Store index for navigation
-        self.make_complete_page_index = self.stacked_widget.count() - 1
         self.completed_automaton = None  # To store the new automaton
 
     def update_make_complete_status(self):
@@ -1640,9 +1992,10 @@ class ContentWidget(QWidget):
         try:
             success = self.automata_manager.save_automaton(f"{base_name}.json")
             if success:
-                QMessageBox.information(self, "Success", f"Completed automaton saved as saved_automatas/{base_name}.json")
+                QMessageBox.information(self, "Success", f"Completed automaton saved as {self.automata_manager.automata_dir}/{base_name}.json")
                 self.save_complete_btn.setVisible(False)
-                self.refresh_automata_list()
+                if "Load Automaton from File" in self._pages:
+                    self.refresh_automata_list()
             else:
                 QMessageBox.warning(self, "Error", f"Failed to save completed automaton: Unknown error.")
                 self.save_complete_btn.setVisible(True)
@@ -1736,7 +2089,6 @@ class ContentWidget(QWidget):
 
         layout.addWidget(group)
         self.stacked_widget.addWidget(page)
-        self.nfa_to_dfa_page_index = self.stacked_widget.count() - 1
         self.dfa_automaton = None
 
     def update_nfa_to_dfa_status(self):
@@ -1769,25 +2121,34 @@ class ContentWidget(QWidget):
             self.nfa_to_dfa_result.setText("No automaton loaded. Please create or load an automaton first.")
             self.save_dfa_btn.setVisible(False)
             return
-        try:
-            dfa = AutomataAnalyzer.nfa_to_dfa(automaton)
-            self.dfa_automaton = dfa
-            summary = f"""
-            <div style='color: white;'>
-                <h3 style='color:#7B42F6; margin-top:0;'>NFA to DFA Conversion Result</h3>
-                <p><b>Original Automaton:</b> {automaton.name}</p>
-                <p><b>DFA States:</b> {len(dfa.states)} &nbsp; <b>Alphabet Size:</b> {len(dfa.alphabet)}</p>
-                <p><b>Initial State:</b> {dfa.initial_state}</p>
-                <p><b>Final States:</b> {len(dfa.final_states)}</p>
-                <p><b>Transitions:</b> {len(dfa.transitions)}</p>
-                <div style='margin-top:15px; color:#2ED573; font-size:16px;'><b>✅ DFA is ready. Click 'Save DFA' to save it.</b></div>
-            </div>
-            """
-            self.nfa_to_dfa_result.setText(summary)
-            self.save_dfa_btn.setVisible(True)
-        except Exception as e:
-            self.nfa_to_dfa_result.setText(f"<span style='color:#FF4757;'>Error: {str(e)}</span>")
-            self.save_dfa_btn.setVisible(False)
+        self.save_dfa_btn.setVisible(False)
+        self.nfa_to_dfa_result.setText("<span style='color:#8A98AC;'>Converting NFA to DFA...</span>")
+        self.run_job('nfa_to_dfa', "Converting NFA to DFA", AutomataAnalyzer.nfa_to_dfa, automaton,
+                     max_states=self.MAX_DFA_STATES, with_progress=True,
+                     key=self.result_key('nfa_to_dfa', [automaton], self.MAX_DFA_STATES),
+                     on_result=lambda dfa: self.show_dfa_result(automaton, dfa),
+                     on_error=self.show_dfa_error,
+                     on_cancel=lambda: self.nfa_to_dfa_result.setText("Conversion cancelled."))
+
+    def show_dfa_result(self, automaton, dfa):
+        self.dfa_automaton = dfa
+        summary = f"""
+        <div style='color: white;'>
+            <h3 style='color:#7B42F6; margin-top:0;'>NFA to DFA Conversion Result</h3>
+            <p><b>Original Automaton:</b> {automaton.name}</p>
+            <p><b>DFA States:</b> {len(dfa.states)} &nbsp; <b>Alphabet Size:</b> {len(dfa.alphabet)}</p>
+            <p><b>Initial State:</b> {dfa.initial_state}</p>
+            <p><b>Final States:</b> {len(dfa.final_states)}</p>
+            <p><b>Transitions:</b> {len(dfa.transitions)}</p>
+            <div style='margin-top:15px; color:#2ED573; font-size:16px;'><b>✅ DFA is ready. Click 'Save DFA' to save it.</b></div>
+        </div>
+        """
+        self.nfa_to_dfa_result.setText(summary)
+        self.save_dfa_btn.setVisible(True)
+
+    def show_dfa_error(self, error):
+        self.nfa_to_dfa_result.setText(f"<span style='color:#FF4757;'>Error: {str(error)}</span>")
+        self.save_dfa_btn.setVisible(False)
 
     def save_dfa_automaton(self):
         if not self.dfa_automaton:
@@ -1805,9 +2166,10 @@ class ContentWidget(QWidget):
         try:
             success = self.automata_manager.save_automaton(f"{base_name}.json")
             if success:
-                QMessageBox.information(self, "Success", f"DFA saved as saved_automatas/{base_name}.json")
+                QMessageBox.information(self, "Success", f"DFA saved as {self.automata_manager.automata_dir}/{base_name}.json")
                 self.save_dfa_btn.setVisible(False)
-                self.refresh_automata_list()
+                if "Load Automaton from File" in self._pages:
+                    self.refresh_automata_list()
             else:
                 QMessageBox.warning(self, "Error", f"Failed to save DFA: Unknown error.")
                 self.save_dfa_btn.setVisible(True)
@@ -2038,7 +2400,6 @@ class ContentWidget(QWidget):
 
         layout.addWidget(group)
         self.stacked_widget.addWidget(page)
-        self.minimize_page_index = self.stacked_widget.count() - 1
         self.minimized_automaton = None
 
     def update_minimize_status(self):
@@ -2064,32 +2425,40 @@ class ContentWidget(QWidget):
             """)
             self.save_minimized_btn.setVisible(False)
             return
-        try:
-            minimized = AutomataAnalyzer.minimize_dfa(automaton)
-            self.minimized_automaton = minimized
-            if len(minimized.states) == len(automaton.states):
-                self.minimize_result.setText("""
-                    <div style='color:#2ED573; font-size:15px;'>
-                        <b>The DFA is already minimal. No further minimization possible.</b>
-                    </div>
-                """)
-                self.save_minimized_btn.setVisible(False)
-            else:
-                summary = f"""
-                    <div style='color:white;'>
-                        <h3 style='color:#FF4757; margin-top:0;'>DFA Minimization Result</h3>
-                        <p><b>Original DFA:</b> {automaton.name}</p>
-                        <p><b>States before:</b> {len(automaton.states)} &nbsp; <b>States after:</b> {len(minimized.states)}</p>
-                        <p><b>Minimized DFA name:</b> {minimized.name}</p>
-                        <div style='margin-top:15px; color:#2ED573; font-size:16px;'><b>✅ Successfully minimized the DFA.</b></div>
-                        <p style='color:#8A98AC; margin-top:10px;'>You can save the minimized DFA for further use.</p>
-                    </div>
-                """
-                self.minimize_result.setText(summary)
-                self.save_minimized_btn.setVisible(True)
-        except Exception as e:
-            self.minimize_result.setText(f"<div style='color:#FF4757;'>Error: {str(e)}</div>")
+        self.save_minimized_btn.setVisible(False)
+        self.minimize_result.setText("<span style='color:#8A98AC;'>Minimizing the DFA...</span>")
+        self.run_job('minimize', "Minimizing DFA", AutomataAnalyzer.minimize_dfa, automaton, with_progress=True,
+                     key=self.result_key('minimize', [automaton]),
+                     on_result=lambda minimized: self.show_minimize_result(automaton, minimized),
+                     on_error=self.show_minimize_error,
+                     on_cancel=lambda: self.minimize_result.setText("Minimization cancelled."))
+
+    def show_minimize_result(self, automaton, minimized):
+        self.minimized_automaton = minimized
+        if len(minimized.states) == len(automaton.states):
+            self.minimize_result.setText("""
+                <div style='color:#2ED573; font-size:15px;'>
+                    <b>The DFA is already minimal. No further minimization possible.</b>
+                </div>
+            """)
             self.save_minimized_btn.setVisible(False)
+        else:
+            summary = f"""
+                <div style='color:white;'>
+                    <h3 style='color:#FF4757; margin-top:0;'>DFA Minimization Result</h3>
+                    <p><b>Original DFA:</b> {automaton.name}</p>
+                    <p><b>States before:</b> {len(automaton.states)} &nbsp; <b>States after:</b> {len(minimized.states)}</p>
+                    <p><b>Minimized DFA name:</b> {minimized.name}</p>
+                    <div style='margin-top:15px; color:#2ED573; font-size:16px;'><b>✅ Successfully minimized the DFA.</b></div>
+                    <p style='color:#8A98AC; margin-top:10px;'>You can save the minimized DFA for further use.</p>
+                </div>
+            """
+            self.minimize_result.setText(summary)
+            self.save_minimized_btn.setVisible(True)
+
+    def show_minimize_error(self, error):
+        self.minimize_result.setText(f"<div style='color:#FF4757;'>Error: {str(error)}</div>")
+        self.save_minimized_btn.setVisible(False)
 
     def save_minimized_automaton(self):
         if not self.minimized_automaton:
@@ -2105,7 +2474,7 @@ class ContentWidget(QWidget):
             success = manager.save_automaton(filename)
             manager.current_automaton = prev
             if success:
-                QMessageBox.information(self, "Success", f"Minimized DFA saved as saved_automatas/{filename}")
+                QMessageBox.information(self, "Success", f"Minimized DFA saved as {self.automata_manager.automata_dir}/{filename}")
             else:
                 QMessageBox.warning(self, "Error", f"Failed to save minimized DFA to file.")
         
@@ -2215,6 +2584,29 @@ class ContentWidget(QWidget):
         """)
         self.test_btn.clicked.connect(self.test_word_acceptance)
 
+        # Batch test button
+        self.test_file_btn = ModernButton("Test Words from File", accent_color="#2ED573")
+        self.test_file_btn.setFixedWidth(200)
+        self.test_file_btn.setStyleSheet("""
+            QPushButton {
+                background-color: #2ED573;
+                color: white;
+                border: none;
+                border-radius: 8px;
+                padding: 8px 15px;
+                text-align: center;
+                font-weight: bold;
+                outline: none;
+            }
+            QPushButton:hover {
+                background-color: #26AE60;
+            }
+            QPushButton:pressed {
+                background-color: #1E8449;
+            }
+        """)
+        self.test_file_btn.clicked.connect(self.test_words_from_file)
+
         # Result label
         result_label = QLabel("Result:")
         result_label.setStyleSheet("QLabel { color: white; background: transparent; }")
@@ -2236,14 +2628,18 @@ class ContentWidget(QWidget):
         # Add widgets to layout
         content.addWidget(input_label)
         content.addWidget(self.word_input)
-        content.addWidget(self.test_btn, 0, Qt.AlignmentFlag.AlignCenter)
+        test_buttons = QHBoxLayout()
+        test_buttons.addStretch(1)
+        test_buttons.addWidget(self.test_btn)
+        test_buttons.addWidget(self.test_file_btn)
+        test_buttons.addStretch(1)
+        content.addLayout(test_buttons)
         content.addWidget(result_label)
         content.addWidget(self.test_result)
 
         group.setLayout(content)
         layout.addWidget(group)
         self.stacked_widget.addWidget(page)
-        self.test_word_acceptance_page_index = self.stacked_widget.count() - 1    
     def test_word_acceptance(self):
         """Test if a given word is accepted by the current automaton"""
         from automata_operations import WordProcessor
@@ -2289,6 +2685,50 @@ class ContentWidget(QWidget):
         self._last_acceptance_test = result
         self.test_result.setText(result)
 
+    def test_words_from_file(self):
+        """Test every line of a text file against the current automaton"""
+        from automata_operations import CompiledAutomaton, WordProcessor
+
+        automaton = self.automata_manager.current_automaton
+        if not automaton:
+            QMessageBox.warning(self, "Error", "No automaton loaded. Please create or load an automaton first.")
+            return
+        file_path, _ = QFileDialog.getOpenFileName(self, "Select Word List", "", "Text Files (*.txt);;All Files (*)")
+        if not file_path:
+            return
+        try:
+            compiled = CompiledAutomaton.of(automaton)
+            results = WordProcessor.accepts_words_from_file(compiled, file_path)
+            total = len(results)
+            accepted = int(sum(results))
+            # Show a few rejected lines as examples
+            samples = []
+            if accepted < total:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    for line, is_accepted in zip(f, results):
+                        if not is_accepted:
+                            samples.append(line.rstrip('\r\n'))
+                            if len(samples) == 5:
+                                break
+            result = f"""
+                <div style='color:white; font-size:14px;'>
+                    <b>Tested {total} word(s) from {os.path.basename(file_path)}</b><br>
+                    <span style='color:#2ED573;'>✅ Accepted: {accepted}</span> &nbsp;
+                    <span style='color:#FF4757;'>❌ Rejected: {total - accepted}</span>
+            """
+            if samples:
+                result += "<br><span style='color:#8A98AC;'>First rejected: " + ", ".join(
+                    f"<span style='font-family: monospace;'>\"{w}\"</span>" for w in samples) + "</span>"
+            result += "</div>"
+        except Exception as e:
+            result = f"""
+                <div style='color:#FF4757;'>
+                    Error: {str(e)}
+                </div>
+            """
+        self._last_acceptance_test = result
+        self.test_result.setText(result)
+
     def create_generate_accepted_words_page(self):
         page = QWidget()
         layout = QVBoxLayout(page)
@@ -2410,6 +2850,30 @@ class ContentWidget(QWidget):
         """)
         self.generated_words_result.setText("No words generated yet. Select a maximum length and click 'Generate Words'.")
 
+        # Button to fetch the next page of words
+        self.more_accepted_words_btn = ModernButton("Show More Words", accent_color="#2ED573")
+        self.more_accepted_words_btn.setFixedWidth(200)
+        self.more_accepted_words_btn.setStyleSheet("""
+            QPushButton {
+                background-color: #2ED573;
+                color: white;
+                border: none;
+                border-radius: 8px;
+                padding: 8px 15px;
+                text-align: center;
+                font-weight: bold;
+                outline: none;
+            }
+            QPushButton:hover {
+                background-color: #26AE60;
+            }
+            QPushButton:pressed {
+                background-color: #1E8449;
+            }
+        """)
+        self.more_accepted_words_btn.clicked.connect(self.show_more_accepted_words)
+        self.more_accepted_words_btn.setVisible(False)
+
         # Add widgets to layout
         input_layout = QHBoxLayout()
         input_layout.addWidget(input_label)
@@ -2419,17 +2883,16 @@ class ContentWidget(QWidget):
         content.addLayout(input_layout)
         content.addWidget(self.generate_btn, 0, Qt.AlignmentFlag.AlignCenter)
         content.addWidget(self.generated_words_result)
+        content.addWidget(self.more_accepted_words_btn, 0, Qt.AlignmentFlag.AlignCenter)
 
         group.setLayout(content)
         layout.addWidget(group)
         self.stacked_widget.addWidget(page)
-        self.generate_accepted_words_page_index = self.stacked_widget.count() - 1    
     def generate_accepted_words(self):
         """Generate words accepted by the current automaton"""
-        from automata_operations import WordProcessor
-        
         automaton = self.automata_manager.current_automaton
-        word = self.word_input.text().strip()
+        self._accepted_words_iter = None
+        self.more_accepted_words_btn.setVisible(False)
         
         if not automaton:
             result = """
@@ -2445,14 +2908,6 @@ class ContentWidget(QWidget):
             max_length = int(self.max_length_input.text().strip())
             if max_length <= 0:
                 raise ValueError("Maximum length must be positive")
-            if max_length > 10:
-                if QMessageBox.question(
-                    self, 
-                    "Warning", 
-                    "Generating words with length > 10 may take a long time. Continue?",
-                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
-                ) == QMessageBox.StandardButton.No:
-                    return
         except ValueError as e:
             result = """
                 <div style='color:#FF4757;'>
@@ -2463,47 +2918,117 @@ class ContentWidget(QWidget):
             self.generated_words_result.setHtml(result)
             return
 
-        try:
-            accepted_words = WordProcessor.generate_words(automaton, max_length)
-            if accepted_words:
-                words_by_length = {}
-                for word in accepted_words:
-                    length = len(word)
-                    if length not in words_by_length:
-                        words_by_length[length] = []
-                    words_by_length[length].append(word)
-                
-                result = f"""
-                    <div style='color:#2ED573; font-size:16px;'>
-                        <b>✅ Found {len(accepted_words)} accepted word(s):</b>
-                    </div>
-                    <div style='color:#8A98AC; margin-top:10px;'>
-                """
-                
-                for length in sorted(words_by_length.keys()):
-                    words = sorted(words_by_length[length])
-                    result += f"""
-                        <p><b>Length {length}:</b></p>
-                        <div style='color:white; font-family:monospace; margin-left:20px;'>
-                            {', '.join(f'"{w}"' for w in words)}
-                        </div>
-                    """
-                result += "</div>"
-            else:
-                result = """
-                    <div style='color:#FF4757; font-size:16px;'>
-                        <b>No words are accepted by this automaton up to the specified length.</b>
-                    </div>
-                """
-        except Exception as e:
-            result = f"""
-                <div style='color:#FF4757;'>
-                    Error: {str(e)}
+        # Words are streamed in shortlex order and rendered one page at a time
+        self.generated_words_result.setHtml("<span style='color:#8A98AC;'>Generating words...</span>")
+        self.run_job('accepted_words', "Generating accepted words", self.first_words_page, automaton, max_length,
+                     on_result=lambda page: self.show_accepted_words(*page),
+                     on_error=self.show_accepted_words_error,
+                     on_cancel=lambda: self.generated_words_result.setHtml("Word generation cancelled."))
+
+    @classmethod
+    def first_words_page(cls, automaton, max_length, rejected=False):
+        """Count the accepted (or rejected) words up to max_length and generate the first page of them.
+        Returns (total, word iterator, first page); called on a worker thread. An NFA is
+        determinized once, for both the count and the enumeration."""
+        from automata_operations import WordProcessor
+        dfa = CompiledAutomaton.of(automaton)
+        if dfa.table is None:
+            dfa = AutomataAnalyzer.nfa_to_dfa(dfa)
+        accepted = AutomataAnalyzer.count_words(dfa, max_length)
+        if rejected:
+            total = sum(dfa.num_symbols ** length - accepted[length] for length in range(max_length + 1))
+            words = WordProcessor.generate_rejected_words(dfa, max_length)
+        else:
+            total = sum(accepted)
+            words = WordProcessor.iter_words(dfa, max_length)
+        return total, words, cls.next_words_page(words)
+
+    @classmethod
+    def next_words_page(cls, words):
+        """The next page of a word iterator; called on a worker thread, as sparse languages
+        can take long to yield a page"""
+        return list(islice(words, cls.WORDS_PAGE_SIZE))
+
+    def show_accepted_words(self, total, words, first_page):
+        self._accepted_words_iter = words
+        self._accepted_words_shown = 0
+        self._accepted_words_length = None
+        self.generated_words_result.setHtml(f"""
+            <div style='color:#2ED573; font-size:16px;'>
+                <b>✅ Found {total} accepted word(s) (shortest first):</b>
+            </div>
+        """)
+        self.append_accepted_words(first_page)
+        if not self._accepted_words_shown:
+            result = """
+                <div style='color:#FF4757; font-size:16px;'>
+                    <b>No words are accepted by this automaton up to the specified length.</b>
                 </div>
             """
+            self.generated_words_result.setHtml(result)
         # Store result for persistence
-        self._last_accepted_words = result
+        self._last_accepted_words = self.generated_words_result.toHtml()
+
+    def show_accepted_words_error(self, error):
+        self._accepted_words_iter = None
+        self.more_accepted_words_btn.setVisible(False)
+        result = f"""
+            <div style='color:#FF4757;'>
+                Error: {str(error)}
+            </div>
+        """
         self.generated_words_result.setHtml(result)
+        self._last_accepted_words = self.generated_words_result.toHtml()
+
+    def show_more_accepted_words(self):
+        """Append the next page of accepted words to the result display"""
+        words = getattr(self, '_accepted_words_iter', None)
+        if not words:
+            return
+        # The iterator is only advanced by one job at a time
+        self._accepted_words_iter = None
+        self.more_accepted_words_btn.setVisible(False)
+
+        def append(page):
+            self._accepted_words_iter = words
+            self.append_accepted_words(page)
+
+        self.run_job('accepted_words', "Generating more accepted words", self.next_words_page, words,
+                     on_result=append, on_error=self.show_accepted_words_error)
+
+    def append_accepted_words(self, words):
+        html, self._accepted_words_length = self._format_words_page(words, self._accepted_words_length)
+        if words:
+            self.generated_words_result.append(html)
+        self._accepted_words_shown += len(words)
+        has_more = len(words) == self.WORDS_PAGE_SIZE
+        if not has_more:
+            self._accepted_words_iter = None
+        self.more_accepted_words_btn.setText(f"Show More Words ({self._accepted_words_shown} shown)")
+        self.more_accepted_words_btn.setVisible(has_more)
+        self._last_accepted_words = self.generated_words_result.toHtml()
+
+    @staticmethod
+    def _format_words_page(words, current_length):
+        """Render a page of shortlex-ordered words, starting a new heading whenever the length changes.
+        Returns the HTML and the length of the last word rendered."""
+        html = ""
+        group = []
+        for word in words + [None]:
+            if word is not None and len(word) == current_length:
+                group.append(word)
+                continue
+            if group:
+                html += f"""
+                    <div style='color:white; font-family:monospace; margin-left:20px;'>
+                        {', '.join(f'"{w}"' for w in group)}
+                    </div>
+                """
+            if word is not None:
+                current_length = len(word)
+                group = [word]
+                html += f"<p style='color:#8A98AC;'><b>Length {current_length}:</b></p>"
+        return html, current_length
 
     def create_generate_rejected_words_page(self):
         page = QWidget()
@@ -2625,6 +3150,30 @@ class ContentWidget(QWidget):
         """)
         self.rejected_words_result.setHtml("""<div style='color:#8A98AC;'>No words generated yet. Select a maximum length and click 'Generate Words'.</div>""")
 
+        # Button to fetch the next page of words
+        self.more_rejected_words_btn = ModernButton("Show More Words", accent_color="#FF4757")
+        self.more_rejected_words_btn.setFixedWidth(200)
+        self.more_rejected_words_btn.setStyleSheet("""
+            QPushButton {
+                background-color: #FF4757;
+                color: white;
+                border: none;
+                border-radius: 8px;
+                padding: 8px 15px;
+                text-align: center;
+                font-weight: bold;
+                outline: none;
+            }
+            QPushButton:hover {
+                background-color: #E03E4D;
+            }
+            QPushButton:pressed {
+                background-color: #C23543;
+            }
+        """)
+        self.more_rejected_words_btn.clicked.connect(self.show_more_rejected_words)
+        self.more_rejected_words_btn.setVisible(False)
+
         # Add widgets to layout
         input_layout = QHBoxLayout()
         input_layout.addWidget(input_label)
@@ -2634,16 +3183,16 @@ class ContentWidget(QWidget):
         content.addLayout(input_layout)
         content.addWidget(self.generate_rejected_btn, 0, Qt.AlignmentFlag.AlignCenter)
         content.addWidget(self.rejected_words_result)
+        content.addWidget(self.more_rejected_words_btn, 0, Qt.AlignmentFlag.AlignCenter)
 
         group.setLayout(content)
         layout.addWidget(group)
         self.stacked_widget.addWidget(page)
-        self.generate_rejected_words_page_index = self.stacked_widget.count() - 1    
     def generate_rejected_words(self):
         """Generate words rejected by the current automaton"""
-        from automata_operations import WordProcessor
-        
         automaton = self.automata_manager.current_automaton
+        self._rejected_words_iter = None
+        self.more_rejected_words_btn.setVisible(False)
         if not automaton:
             result = """
                 <div style='color:#FF4757;'>
@@ -2658,14 +3207,6 @@ class ContentWidget(QWidget):
             max_length = int(self.rejected_max_length_input.text().strip())
             if max_length <= 0:
                 raise ValueError("Maximum length must be positive")
-            if max_length > 10:
-                if QMessageBox.question(
-                    self, 
-                    "Warning", 
-                    "Generating words with length > 10 may take a long time. Continue?",
-                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
-                ) == QMessageBox.StandardButton.No:
-                    return
         except ValueError as e:
             result = """
                 <div style='color:#FF4757;'>
@@ -2676,58 +3217,73 @@ class ContentWidget(QWidget):
             self.rejected_words_result.setHtml(result)
             return
 
-        try:
-            # Generate all possible words up to max_length
-            all_words = set()
-            for length in range(max_length + 1):
-                for word in WordProcessor.generate_all_words(automaton.alphabet, length):
-                    all_words.add(word)
-            
-            # Get accepted words and convert to set
-            accepted_words = set(WordProcessor.generate_words(automaton, max_length))
-            
-            # Find rejected words by set difference
-            rejected_words = all_words - accepted_words
-            
-            if rejected_words:
-                words_by_length = {}
-                for word in rejected_words:
-                    length = len(word)
-                    if length not in words_by_length:
-                        words_by_length[length] = []
-                    words_by_length[length].append(word)
-                
-                result = f"""
-                    <div style='color:#FF4757; font-size:16px;'>
-                        <b>✅ Found {len(rejected_words)} rejected word(s):</b>
-                    </div>
-                    <div style='color:#8A98AC; margin-top:10px;'>
-                """
-                
-                for length in sorted(words_by_length.keys()):
-                    words = sorted(words_by_length[length])
-                    result += f"""
-                        <p><b>Length {length}:</b></p>
-                        <div style='color:white; font-family:monospace; margin-left:20px;'>
-                            {', '.join(f'"{w}"' for w in words)}
-                        </div>
-                    """
-                result += "</div>"
-            else:
-                result = """
-                    <div style='color:#FF4757; font-size:16px;'>
-                        <b>No words are rejected by this automaton up to the specified length.</b>
-                    </div>
-                """
-        except Exception as e:
-            result = f"""
-                <div style='color:#FF4757;'>
-                    Error: {str(e)}
+        # Words are streamed in shortlex order from a walk of the completed DFA
+        self.rejected_words_result.setHtml("<span style='color:#8A98AC;'>Generating words...</span>")
+        self.run_job('rejected_words', "Generating rejected words", self.first_words_page, automaton, max_length,
+                     rejected=True,
+                     on_result=lambda page: self.show_rejected_words(*page),
+                     on_error=self.show_rejected_words_error,
+                     on_cancel=lambda: self.rejected_words_result.setHtml("Word generation cancelled."))
+
+    def show_rejected_words(self, total, words, first_page):
+        self._rejected_words_iter = words
+        self._rejected_words_shown = 0
+        self._rejected_words_length = None
+        self.rejected_words_result.setHtml(f"""
+            <div style='color:#FF4757; font-size:16px;'>
+                <b>✅ Found {total} rejected word(s) (shortest first):</b>
+            </div>
+        """)
+        self.append_rejected_words(first_page)
+        if not self._rejected_words_shown:
+            result = """
+                <div style='color:#FF4757; font-size:16px;'>
+                    <b>No words are rejected by this automaton up to the specified length.</b>
                 </div>
             """
+            self.rejected_words_result.setHtml(result)
         # Store result for persistence
-        self._last_rejected_words = result
-        self.rejected_words_result.setHtml(result)    
+        self._last_rejected_words = self.rejected_words_result.toHtml()
+
+    def show_rejected_words_error(self, error):
+        self._rejected_words_iter = None
+        self.more_rejected_words_btn.setVisible(False)
+        result = f"""
+            <div style='color:#FF4757;'>
+                Error: {str(error)}
+            </div>
+        """
+        self.rejected_words_result.setHtml(result)
+        self._last_rejected_words = self.rejected_words_result.toHtml()
+
+    def show_more_rejected_words(self):
+        """Append the next page of rejected words to the result display"""
+        words = getattr(self, '_rejected_words_iter', None)
+        if not words:
+            return
+        # The iterator is only advanced by one job at a time
+        self._rejected_words_iter = None
+        self.more_rejected_words_btn.setVisible(False)
+
+        def append(page):
+            self._rejected_words_iter = words
+            self.append_rejected_words(page)
+
+        self.run_job('rejected_words', "Generating more rejected words", self.next_words_page, words,
+                     on_result=append, on_error=self.show_rejected_words_error)
+
+    def append_rejected_words(self, words):
+        html, self._rejected_words_length = self._format_words_page(words, self._rejected_words_length)
+        if words:
+            self.rejected_words_result.append(html)
+        self._rejected_words_shown += len(words)
+        has_more = len(words) == self.WORDS_PAGE_SIZE
+        if not has_more:
+            self._rejected_words_iter = None
+        self.more_rejected_words_btn.setText(f"Show More Words ({self._rejected_words_shown} shown)")
+        self.more_rejected_words_btn.setVisible(has_more)
+        self._last_rejected_words = self.rejected_words_result.toHtml()
+
     def create_check_equivalence_page(self):
         page = QWidget()
         layout = QVBoxLayout(page)
@@ -2841,8 +3397,8 @@ class ContentWidget(QWidget):
                 border-radius: 5px;
                 padding: 5px;
                 margin: 0px;             
-                min-height: 35px;
-                max-height: 35px;
+                min-height: 60px;
+                max-height: 60px;
             }
         """)
         self.equivalence_result.setHtml("Select an automaton to compare with and click 'Check Equivalence'.")
@@ -2856,18 +3412,12 @@ class ContentWidget(QWidget):
         group.setLayout(content)
         layout.addWidget(group)
         self.stacked_widget.addWidget(page)
-        self.check_equivalence_page_index = self.stacked_widget.count() - 1
 
     def update_equivalence_automata_list(self):
         """Update the list of automata available for equivalence checking"""
         self.equivalence_automaton_list.clear()
-        automata_files = []
-        saved_automata_dir = os.path.join(os.getcwd(), "saved_automatas")
-        if os.path.exists(saved_automata_dir):
-            for file in os.listdir(saved_automata_dir):
-                if file.endswith(".json"):
-                    automata_files.append(file)
-        self.equivalence_automaton_list.addItems(sorted(automata_files))
+        automata_files = self.saved_automata_files()
+        self.equivalence_automaton_list.addItems(automata_files)
 
     def check_equivalence(self):
         """Check if the current automaton is equivalent to the selected automaton"""
@@ -2898,61 +3448,51 @@ class ContentWidget(QWidget):
             return
 
         try:
-            # Load the second automaton
+            # Load the second automaton without replacing the current one
             filename = selected_items[0].text()
-            automaton2 = self.automata_manager.load_automaton(filename)            # Convert and minimize both automata
-            if not AutomataAnalyzer.is_deterministic(automaton1):
-                automaton1 = AutomataAnalyzer.nfa_to_dfa(automaton1)
-            if not AutomataAnalyzer.is_deterministic(automaton2):
-                automaton2 = AutomataAnalyzer.nfa_to_dfa(automaton2)
-            min1 = AutomataAnalyzer.minimize_dfa(automaton1)
-            min2 = AutomataAnalyzer.minimize_dfa(automaton2)
-            
-            # Compare number of states
-            if len(min1.states) != len(min2.states):                result = """
-                    <div style='margin-top:15px; color:#FF4757; font-size:16px;'>
-                        <b>❌ The automata are not equivalent</b>
-                    </div>
-                """
-            else:
-                # Compare transitions
-                transitions_match = True
-                for state in min1.states:
-                    for symbol in min1.alphabet:                        
-                        trans1 = min1.transitions.get((state, symbol), set())
-                        trans2 = min2.transitions.get((state, symbol), set())
-                        if trans1 != trans2:
-                            transitions_match = False
-                            break
-                    if not transitions_match:
-                        break
-
-                # Compare final states
-                final_states_match = set(min1.final_states) == set(min2.final_states)               
-                if transitions_match and final_states_match:
-                    result = """
-                        <div style='margin-top:15px; color:#2ED573; font-size:16px;'>
-                            <b>✅ The automata are equivalent</b>
-                        </div>
-                    """
-                else:
-                    result = """
-                        <div style='margin-top:15px; color:#FF4757; font-size:16px;'>
-                            <b>❌ The automata are not equivalent</b>
-                        </div>
-                    """
-
+            automaton2 = self.automata_manager.load_automaton(filename, preview=True)
         except Exception as e:
+            self.show_equivalence_error(e)
+            return
+
+        self.equivalence_result.setHtml("<span style='color:#8A98AC;'>Checking equivalence...</span>")
+        self.run_job('equivalence', "Checking equivalence", AutomataAnalyzer.are_equivalent,
+                     automaton1, automaton2, with_progress=True,
+                     key=self.result_key('equivalence', [automaton1, automaton2]),
+                     on_result=lambda outcome: self.show_equivalence_result(automaton1, automaton2, *outcome),
+                     on_error=self.show_equivalence_error,
+                     on_cancel=lambda: self.equivalence_result.setHtml("Equivalence check cancelled."))
+
+    def show_equivalence_result(self, automaton1, automaton2, equivalent, counterexample):
+        from automata_operations import WordProcessor
+        if equivalent:
+            result = """
+                <div style='margin-top:15px; color:#2ED573; font-size:16px;'>
+                    <b>✅ The automata are equivalent</b>
+                </div>
+            """
+        else:
+            word = f'"{counterexample}"' if counterexample else "ε (empty word)"
+            accepted_by = automaton1.name if WordProcessor.accepts_word(automaton1, counterexample) else automaton2.name
             result = f"""
-                <div style='color:#FF4757;'>
-                    Error checking equivalence: {str(e)}
+                <div style='margin-top:15px; color:#FF4757; font-size:16px;'>
+                    <b>❌ The automata are not equivalent</b>
+                    <span style='color:#8A98AC; font-size:13px;'>&nbsp;Counterexample: <span style='font-family: monospace;'>{word}</span> is accepted only by {accepted_by}</span>
                 </div>
             """
-
         # Store result for persistence
         self._last_equivalence_check = result
         self.equivalence_result.setHtml(result)
 
+    def show_equivalence_error(self, error):
+        result = f"""
+            <div style='color:#FF4757;'>
+                Error checking equivalence: {str(error)}
+            </div>
+        """
+        self._last_equivalence_check = result
+        self.equivalence_result.setHtml(result)
+
     def create_compute_union_page(self):
         """Create the page for computing union of automata"""
         page = QWidget()
@@ -3127,20 +3667,14 @@ class ContentWidget(QWidget):
         group.setLayout(content)
         layout.addWidget(group)
         self.stacked_widget.addWidget(page)
-        self.compute_union_page_index = self.stacked_widget.count() - 1
         self.union_automaton = None
 
     
     def update_union_automata_list(self):
         """Update the list of automata available for union computation"""
         self.union_automaton_list.clear()
-        automata_files = []
-        saved_automata_dir = os.path.join(os.getcwd(), "saved_automatas")
-        if os.path.exists(saved_automata_dir):
-            for file in os.listdir(saved_automata_dir):
-                if file.endswith(".json"):
-                    automata_files.append(file)
-        self.union_automaton_list.addItems(sorted(automata_files))
+        automata_files = self.saved_automata_files()
+        self.union_automaton_list.addItems(automata_files)
 
 
     
@@ -3178,20 +3712,32 @@ class ContentWidget(QWidget):
                 self.save_union_btn.setEnabled(False)
                 return
             
-            # Compute the union using AutomataAnalyzer
-            from automata_operations import AutomataAnalyzer
-            self.union_automaton = AutomataAnalyzer.compute_union(first_automaton, second_automaton)
-            
-            # Give the union automaton a descriptive name
-            self.union_automaton.name = f"union_{first_automaton.name}_{second_automaton.name}"
-            success_message = f'Union computed successfully with "{selected_name}"'
-            self.union_result.setHtml(f'<span style="color: #2ED573;">{success_message}</span>')
-            self.save_union_btn.setEnabled(True)  # Enable save button on successful computation
-    
         except Exception as e:
-            error_message = f'Error computing union: {str(e)}'
-            self.union_result.setHtml(f'<span style="color: #FF3E3E;">{error_message}</span>')
-            self.save_union_btn.setEnabled(False)  # Disable save button on error
+            self.show_union_error(e)
+            return
+
+        # Compute the union in the background using AutomataAnalyzer
+        from automata_operations import AutomataAnalyzer
+        self.save_union_btn.setEnabled(False)
+        self.union_result.setHtml('<span style="color: #8A98AC;">Computing union...</span>')
+        self.run_job('union', "Computing union", AutomataAnalyzer.compute_union, first_automaton, second_automaton,
+                     with_progress=True, key=self.result_key('union', [first_automaton, second_automaton]),
+                     on_result=lambda result: self.show_union_result(result, first_automaton, second_automaton, selected_name),
+                     on_error=self.show_union_error,
+                     on_cancel=lambda: self.union_result.setHtml('<span style="color: #8A98AC;">Union computation cancelled.</span>'))
+
+    def show_union_result(self, union_automaton, first_automaton, second_automaton, selected_name):
+        self.union_automaton = union_automaton
+        # Give the union automaton a descriptive name
+        self.union_automaton.name = f"union_{first_automaton.name}_{second_automaton.name}"
+        success_message = f'Union computed successfully with "{selected_name}"'
+        self.union_result.setHtml(f'<span style="color: #2ED573;">{success_message}</span>')
+        self.save_union_btn.setEnabled(True)  # Enable save button on successful computation
+
+    def show_union_error(self, error):
+        error_message = f'Error computing union: {str(error)}'
+        self.union_result.setHtml(f'<span style="color: #FF3E3E;">{error_message}</span>')
+        self.save_union_btn.setEnabled(False)  # Disable save button on error
 
     def save_union_automaton(self):
         """Save the computed union automaton"""
@@ -3402,7 +3948,6 @@ class ContentWidget(QWidget):
         group.setLayout(content)
         layout.addWidget(group)
         self.stacked_widget.addWidget(page)
-        self.compute_intersection_page_index = self.stacked_widget.count() - 1
         self.intersection_automaton = None
 
     def compute_intersection(self):
@@ -3439,20 +3984,32 @@ class ContentWidget(QWidget):
                 self.save_intersection_btn.setEnabled(False)
                 return
             
-            # Compute the intersection using AutomataAnalyzer
-            from automata_operations import AutomataAnalyzer
-            self.intersection_automaton = AutomataAnalyzer.compute_intersection(first_automaton, second_automaton)
-            
-            # Give the intersection automaton a descriptive name
-            self.intersection_automaton.name = f"intersection_{first_automaton.name}_{second_automaton.name}"
-            success_message = f'Intersection computed successfully with "{selected_name}"'
-            self.intersection_result.setHtml(f'<span style="color: #2ED573;">{success_message}</span>')
-            self.save_intersection_btn.setEnabled(True)  # Enable save button on successful computation
-    
         except Exception as e:
-            error_message = f'Error computing intersection: {str(e)}'
-            self.intersection_result.setHtml(f'<span style="color: #FF3E3E;">{error_message}</span>')
-            self.save_intersection_btn.setEnabled(False)  # Disable save button on error
+            self.show_intersection_error(e)
+            return
+
+        # Compute the intersection in the background using AutomataAnalyzer
+        from automata_operations import AutomataAnalyzer
+        self.save_intersection_btn.setEnabled(False)
+        self.intersection_result.setHtml('<span style="color: #8A98AC;">Computing intersection...</span>')
+        self.run_job('intersection', "Computing intersection", AutomataAnalyzer.compute_intersection, first_automaton, second_automaton,
+                     with_progress=True, key=self.result_key('intersection', [first_automaton, second_automaton]),
+                     on_result=lambda result: self.show_intersection_result(result, first_automaton, second_automaton, selected_name),
+                     on_error=self.show_intersection_error,
+                     on_cancel=lambda: self.intersection_result.setHtml('<span style="color: #8A98AC;">Intersection computation cancelled.</span>'))
+
+    def show_intersection_result(self, intersection_automaton, first_automaton, second_automaton, selected_name):
+        self.intersection_automaton = intersection_automaton
+        # Give the intersection automaton a descriptive name
+        self.intersection_automaton.name = f"intersection_{first_automaton.name}_{second_automaton.name}"
+        success_message = f'Intersection computed successfully with "{selected_name}"'
+        self.intersection_result.setHtml(f'<span style="color: #2ED573;">{success_message}</span>')
+        self.save_intersection_btn.setEnabled(True)  # Enable save button on successful computation
+
+    def show_intersection_error(self, error):
+        error_message = f'Error computing intersection: {str(error)}'
+        self.intersection_result.setHtml(f'<span style="color: #FF3E3E;">{error_message}</span>')
+        self.save_intersection_btn.setEnabled(False)  # Disable save button on error
 
     def save_intersection_automaton(self):
         """Save the computed intersection automaton"""
@@ -3638,7 +4195,6 @@ class ContentWidget(QWidget):
         group.setLayout(content)
         layout.addWidget(group)
         self.stacked_widget.addWidget(page)
-        self.compute_complement_page_index = self.stacked_widget.count() - 1
         self.complement_automaton = None
 
     def compute_complement(self):
@@ -3715,49 +4271,22 @@ class ContentWidget(QWidget):
         
     def update_complement_automata_list(self):
         """Update the list of automata available for complement computation"""
-        automata_files = []
-        saved_automata_dir = os.path.join(os.getcwd(), "saved_automatas")
-        if os.path.exists(saved_automata_dir):
-            for file in os.listdir(saved_automata_dir):
-                if file.endswith(".json"):
-                    automata_files.append(file)
+        automata_files = self.saved_automata_files()
 
     def update_intersection_automata_list(self):
         """Update the list of automata available for intersection computation"""
         self.intersection_automaton_list.clear()
-        automata_files = []
-        saved_automata_dir = os.path.join(os.getcwd(), "saved_automatas")
-        if os.path.exists(saved_automata_dir):
-            for file in os.listdir(saved_automata_dir):
-                if file.endswith(".json"):
-                    automata_files.append(file)
-        self.intersection_automaton_list.addItems(sorted(automata_files))
+        automata_files = self.saved_automata_files()
+        self.intersection_automaton_list.addItems(automata_files)
 
     def update_content(self, category, action):        
-        page_map = {
-            "Create New Automaton": 1,
-            "Check Determinism": 2,
-            "Check Completeness": 3,
-            "Visualize Current Automaton": 4,
-            "Load Automaton from File": 5,
-            "Delete Saved Automaton File": 6,
-            "Check Equivalence": 7,
-            "Make Automaton Complete": self.make_complete_page_index,
-            "Convert NFA to DFA": self.nfa_to_dfa_page_index,
-            "Check Minimality": self.stacked_widget.count() - 8,
-            "Minimize Automaton": self.stacked_widget.count() - 7,
-            "Test Word Acceptance": self.test_word_acceptance_page_index,
-            "Generate Accepted Words": self.generate_accepted_words_page_index,
-            "Generate Rejected Words": self.generate_rejected_words_page_index,
-            "Compute Union": self.compute_union_page_index,
-            "Compute Intersection": self.compute_intersection_page_index,
-            "Compute Complement": self.compute_complement_page_index
-        }
-        
-        if action in page_map:
-            self.stacked_widget.setCurrentIndex(page_map[action])
+        if action in self.page_builders:
+            first_visit = action not in self._pages
+            self.stacked_widget.setCurrentWidget(self.ensure_page(action))
             self.title_label.setText(action)
-            if action == "Delete Saved Automaton File":
+            if action in ("Check Determinism", "Check Completeness") and first_visit:
+                self.refresh_page(action)
+            elif action == "Delete Saved Automaton File":
                 self.refresh_delete_automata_list()
             elif action == "Visualize Current Automaton":
                 self.refresh_visualization()
@@ -0,0 +1,270 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+import math
+import random
+
+Point = Tuple[float, float]
+Edge = Tuple[int, int]
+
+
+@dataclass
+class Layout:
+    """Node positions of a drawn graph and the bend points of its edges (endpoints excluded)"""
+    positions: List[Point]
+    bends: Dict[Edge, List[Point]] = field(default_factory=dict)
+
+
+class _QuadTree:
+    """Barnes–Hut quadtree over points of unit mass"""
+    __slots__ = ('x0', 'y0', 'size', 'mass', 'cx', 'cy', 'point', 'children')
+
+    def __init__(self, x0: float, y0: float, size: float):
+        self.x0, self.y0, self.size = x0, y0, size
+        self.mass = 0
+        self.cx = self.cy = 0.0
+        self.point: Optional[Point] = None
+        self.children: Optional[List["_QuadTree"]] = None
+
+    def insert(self, x: float, y: float, depth: int = 0):
+        node = self
+        while True:
+            node.cx = (node.cx * node.mass + x) / (node.mass + 1)
+            node.cy = (node.cy * node.mass + y) / (node.mass + 1)
+            node.mass += 1
+            if node.mass == 1:
+                node.point = (x, y)
+                return
+            if node.children is None:
+                if depth > 32:
+                    # Coincident points stay together in one leaf
+                    return
+                half = node.size / 2
+                node.children = [_QuadTree(node.x0 + dx * half, node.y0 + dy * half, half)
+                                 for dy in (0, 1) for dx in (0, 1)]
+                px, py = node.point
+                node.point = None
+                node._child(px, py)._insert_leaf(px, py)
+            node = node._child(x, y)
+            depth += 1
+
+    def _insert_leaf(self, x: float, y: float):
+        self.cx, self.cy, self.mass, self.point = x, y, 1, (x, y)
+
+    def _child(self, x: float, y: float) -> "_QuadTree":
+        half = self.size / 2
+        return self.children[(2 if y >= self.y0 + half else 0) + (1 if x >= self.x0 + half else 0)]
+
+    def repulsion(self, x: float, y: float, strength: float, theta: float) -> Point:
+        """Sum of the repulsive forces strength * mass / distance on a point, approximating
+        cells seen under an angle below theta by their centre of mass"""
+        fx = fy = 0.0
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if node.mass == 0:
+                continue
+            dx, dy = x - node.cx, y - node.cy
+            distance2 = dx * dx + dy * dy
+            if node.children is None or node.size * node.size < theta * theta * distance2:
+                if distance2 < 1e-9:
+                    # The point itself (or one on top of it)
+                    continue
+                factor = strength * node.mass / distance2
+                fx += dx * factor
+                fy += dy * factor
+            else:
+                stack.extend(node.children)
+        return fx, fy
+
+
+class GraphLayout:
+    """Pure-Python graph layouts, for drawing automata without Graphviz.
+
+    layered() is a Sugiyama-style layout for small graphs (left to right, like dot with
+    rankdir=LR); force_directed() is a Fruchterman–Reingold layout whose repulsion is
+    approximated with a Barnes–Hut quadtree, for larger ones. Nodes are 0..num_nodes-1
+    and edges (source, target) pairs; self-loops are ignored.
+    """
+    # Graphs with more nodes get the force-directed layout
+    LAYERED_MAX_NODES = 60
+
+    @staticmethod
+    def layout(num_nodes: int, edges: Sequence[Edge], root: int = 0) -> Layout:
+        """The layered layout for small graphs, unless their edges need more bends than
+        there are nodes (dense graphs, whose long edges would wind around the drawing),
+        and the force-directed layout otherwise"""
+        if not num_nodes:
+            return Layout([])
+        if num_nodes <= GraphLayout.LAYERED_MAX_NODES:
+            layered = GraphLayout.layered(num_nodes, edges, root)
+            if sum(len(bends) for bends in layered.bends.values()) <= num_nodes:
+                return layered
+        return GraphLayout.force_directed(num_nodes, edges, root)
+
+    @staticmethod
+    def _acyclic(num_nodes: int, edges: Sequence[Edge], root: int) -> List[Tuple[int, int, Edge]]:
+        """(source, target, edge) for the distinct edges that are not self-loops, with the
+        edges closing a cycle in a depth-first search from root (then from the unvisited
+        nodes) reversed"""
+        distinct = [(source, target) for source, target in dict.fromkeys(edges) if source != target]
+        successors = [[] for _ in range(num_nodes)]
+        for source, target in distinct:
+            successors[source].append(target)
+        state = [0] * num_nodes  # 0 unvisited, 1 on the stack, 2 done
+        back = set()
+        for start in [root] + list(range(num_nodes)):
+            if state[start]:
+                continue
+            state[start] = 1
+            work = [(start, 0)]
+            while work:
+                node, child = work.pop()
+                if child < len(successors[node]):
+                    work.append((node, child + 1))
+                    target = successors[node][child]
+                    if state[target] == 1:
+                        back.add((node, target))
+                    elif state[target] == 0:
+                        state[target] = 1
+                        work.append((target, 0))
+                else:
+                    state[node] = 2
+        return [(edge[1], edge[0], edge) if edge in back else (edge[0], edge[1], edge) for edge in distinct]
+
+    @staticmethod
+    def layered(num_nodes: int, edges: Sequence[Edge], root: int = 0, layer_gap: float = 150.0,
+                node_gap: float = 80.0, sweeps: int = 8) -> Layout:
+        """Sugiyama layout: cycles broken, longest-path layers, dummy nodes on long edges,
+        barycenter ordering sweeps, then positions pulled towards their neighbours"""
+        dag = GraphLayout._acyclic(num_nodes, edges, root)
+        indegree = [0] * num_nodes
+        successors = [[] for _ in range(num_nodes)]
+        for source, target, _ in dag:
+            successors[source].append(target)
+            indegree[target] += 1
+        layer = [0] * num_nodes
+        queue = [node for node in range(num_nodes) if not indegree[node]]
+        for node in queue:
+            for target in successors[node]:
+                layer[target] = max(layer[target], layer[node] + 1)
+                indegree[target] -= 1
+                if not indegree[target]:
+                    queue.append(target)
+
+        # Long edges are split by dummy nodes, one per layer crossed
+        layer_of = list(layer)
+        chains: Dict[Edge, List[int]] = {}
+        neighbours: List[List[int]] = [[] for _ in range(num_nodes)]
+        for source, target, edge in dag:
+            chain = [source]
+            for level in range(layer[source] + 1, layer[target]):
+                layer_of.append(level)
+                neighbours.append([])
+                chain.append(len(layer_of) - 1)
+            chain.append(target)
+            for first, second in zip(chain, chain[1:]):
+                neighbours[first].append(second)
+                neighbours[second].append(first)
+            # Chains run along the edge they stand for
+            chains[edge] = chain if edge == (source, target) else chain[::-1]
+
+        layers: List[List[int]] = [[] for _ in range(max(layer_of, default=0) + 1)]
+        # Initial order: breadth-first from the root, so that the drawing reads from it
+        seen = [False] * len(layer_of)
+        for start in [root] + list(range(len(layer_of))):
+            if start >= len(layer_of) or seen[start]:
+                continue
+            seen[start] = True
+            queue = [start]
+            for node in queue:
+                layers[layer_of[node]].append(node)
+                for neighbour in neighbours[node]:
+                    if not seen[neighbour]:
+                        seen[neighbour] = True
+                        queue.append(neighbour)
+
+        position = [0.0] * len(layer_of)
+        for nodes in layers:
+            for index, node in enumerate(nodes):
+                position[node] = index
+        for sweep in range(sweeps):
+            order = range(1, len(layers)) if sweep % 2 == 0 else range(len(layers) - 2, -1, -1)
+            reference = -1 if sweep % 2 == 0 else 1
+            for level in order:
+                def barycenter(node):
+                    adjacent = [position[n] for n in neighbours[node] if layer_of[n] == level + reference]
+                    return sum(adjacent) / len(adjacent) if adjacent else position[node]
+                layers[level].sort(key=barycenter)
+                for index, node in enumerate(layers[level]):
+                    position[node] = index
+
+        # Coordinates: each node moves towards its neighbours, keeping order and spacing
+        y = [0.0] * len(layer_of)
+        for nodes in layers:
+            for index, node in enumerate(nodes):
+                y[node] = (index - (len(nodes) - 1) / 2) * node_gap
+        for _ in range(sweeps):
+            for nodes in layers:
+                wanted = []
+                for node in nodes:
+                    adjacent = [y[n] for n in neighbours[node]]
+                    wanted.append((y[node] + sum(adjacent) / len(adjacent)) / 2 if adjacent else y[node])
+                for index in range(1, len(wanted)):
+                    wanted[index] = max(wanted[index], wanted[index - 1] + node_gap)
+                shift = (sum(wanted) - sum(y[node] for node in nodes)) / len(nodes) if nodes else 0.0
+                for node, value in zip(nodes, wanted):
+                    y[node] = value - shift
+
+        positions = [(layer_of[node] * layer_gap, y[node]) for node in range(len(layer_of))]
+        bends = {edge: [positions[node] for node in chain[1:-1]] for edge, chain in chains.items()}
+        return Layout(positions[:num_nodes], bends)
+
+    @staticmethod
+    def force_directed(num_nodes: int, edges: Sequence[Edge], root: int = 0, iterations: int = 80,
+                       ideal_length: float = 110.0, theta: float = 1.0, gravity: float = 1.0,
+                       seed: int = 0) -> Layout:
+        """Fruchterman–Reingold layout with Barnes–Hut repulsion, O(n log n) per iteration,
+        and a slight pull towards the centre that keeps disconnected parts together.
+        The same graph always gets the same layout."""
+        rng = random.Random(seed)
+        span = ideal_length * math.sqrt(num_nodes)
+        x = [rng.uniform(0, span) for _ in range(num_nodes)]
+        y = [rng.uniform(0, span) for _ in range(num_nodes)]
+        if num_nodes:
+            x[root], y[root] = 0.0, span / 2
+        pairs = [(source, target) for source, target in dict.fromkeys(edges) if source != target]
+        strength = ideal_length * ideal_length
+        temperature = span / 10
+        for iteration in range(iterations):
+            low_x, low_y = min(x, default=0.0), min(y, default=0.0)
+            size = max(max(x, default=0.0) - low_x, max(y, default=0.0) - low_y) + 1.0
+            tree = _QuadTree(low_x, low_y, size)
+            for node in range(num_nodes):
+                tree.insert(x[node], y[node])
+            dx = [0.0] * num_nodes
+            dy = [0.0] * num_nodes
+            for node in range(num_nodes):
+                dx[node], dy[node] = tree.repulsion(x[node], y[node], strength, theta)
+            centre_x, centre_y = sum(x) / num_nodes, sum(y) / num_nodes
+            for node in range(num_nodes):
+                dx[node] -= (x[node] - centre_x) * gravity
+                dy[node] -= (y[node] - centre_y) * gravity
+            for source, target in pairs:
+                ex, ey = x[source] - x[target], y[source] - y[target]
+                distance = math.hypot(ex, ey) or 0.01
+                force = distance / ideal_length
+                dx[source] -= ex * force
+                dy[source] -= ey * force
+                dx[target] += ex * force
+                dy[target] += ey * force
+            for node in range(num_nodes):
+                length = math.hypot(dx[node], dy[node])
+                if length > 0:
+                    step = min(length, temperature) / length
+                    x[node] += dx[node] * step
+                    y[node] += dy[node] * step
+            temperature *= 1 - 1 / (iterations - iteration + 1)
+        # The root is placed leftmost, like the start of a dot drawing
+        if num_nodes and x[root] > sum(x) / num_nodes:
+            x = [-value for value in x]
+        return Layout(list(zip(x, y)))
@@ -0,0 +1,162 @@
+from typing import List, Optional, Tuple
+import math
+
+from PyQt6.QtCore import Qt, QPointF, QRectF
+from PyQt6.QtGui import QBrush, QColor, QFont, QFontMetricsF, QImage, QPainter, QPainterPath, QPen, QPolygonF
+from PyQt6.QtWidgets import QGraphicsScene
+
+from graph_layout import GraphLayout, Layout
+from graph_summary import GraphSummary, edge_label
+
+STATE_RADIUS = 22.0
+BOX_HEIGHT = 34.0
+ARROW_SIZE = 9.0
+
+
+class AutomatonScene(QGraphicsScene):
+    """Drawing of a GraphSummary laid out by GraphLayout, in the style of the Graphviz
+    rendering but without Graphviz or QtWebEngine. Laying out and drawing the few hundred
+    nodes of a summary takes well under a second, so it serves as a preview while
+    Graphviz runs and as the visualization when Graphviz is not installed.
+
+    The layout is computed by layout_of() when not given; only building the scene needs
+    the GUI thread, so callers compute the layout on a worker thread first."""
+    def __init__(self, summary: GraphSummary, layout: Optional[Layout] = None, parent=None):
+        super().__init__(parent)
+        self.summary = summary
+        self.font = QFont("Arial", 10)
+        self.metrics = QFontMetricsF(self.font)
+        self.pen = QPen(QColor('#000000'), 1.2)
+        edges = summary.edges()
+        initial = summary.node_of[summary.automaton.initial]
+        self.layout = layout if layout is not None else AutomatonScene.layout_of(summary)
+        self.styles = [summary.node_style(node) for node in range(len(summary.units))]
+        self.sizes = [self._node_size(style) for style in self.styles]
+        self.setBackgroundBrush(QColor('#FFFFFF'))
+        for (source, target), symbols in edges.items():
+            self._draw_edge(source, target, edge_label(symbols), (target, source) in edges)
+        for node in range(len(summary.units)):
+            self._draw_node(node)
+        self._draw_start(initial)
+        self.setSceneRect(self.itemsBoundingRect().adjusted(-20, -20, 20, 20))
+
+    @staticmethod
+    def layout_of(summary: GraphSummary) -> Layout:
+        """Positions of the nodes and edge bends of a summary as drawn by the scene"""
+        return GraphLayout.layout(len(summary.units), list(summary.edges()),
+                                  summary.node_of[summary.automaton.initial])
+
+    def _node_size(self, style: dict) -> Tuple[float, float]:
+        """Half width and half height of a node"""
+        width = self.metrics.horizontalAdvance(style['label'])
+        if style['shape'] == 'circle':
+            radius = max(STATE_RADIUS, width / 2 + 8)
+            return radius, radius
+        return width / 2 + 12, BOX_HEIGHT / 2
+
+    def _center(self, node: int) -> QPointF:
+        x, y = self.layout.positions[node]
+        return QPointF(x, y)
+
+    def _boundary(self, node: int, towards: QPointF) -> QPointF:
+        """Point where the segment from the centre of a node towards a point leaves the node"""
+        center = self._center(node)
+        dx, dy = towards.x() - center.x(), towards.y() - center.y()
+        length = math.hypot(dx, dy)
+        if length < 1e-6:
+            return center
+        half_width, half_height = self.sizes[node]
+        if self.styles[node]['shape'] == 'circle':
+            scale = half_width / length
+        else:
+            scale = min(half_width / abs(dx) if dx else math.inf, half_height / abs(dy) if dy else math.inf)
+        return QPointF(center.x() + dx * scale, center.y() + dy * scale)
+
+    def _draw_node(self, node: int):
+        style, center = self.styles[node], self._center(node)
+        half_width, half_height = self.sizes[node]
+        brush = QBrush(QColor(style['fillcolor'] or '#FFFFFF'))
+        rect = QRectF(center.x() - half_width, center.y() - half_height, 2 * half_width, 2 * half_height)
+        if style['shape'] == 'circle':
+            self.addEllipse(rect, self.pen, brush)
+            if style['peripheries'] == 2:
+                self.addEllipse(rect.adjusted(4, 4, -4, -4), self.pen)
+        else:
+            path = QPainterPath()
+            radius = 6 if style['shape'] == 'box' else 0
+            path.addRoundedRect(rect, radius, radius)
+            self.addPath(path, self.pen, brush)
+            if style['peripheries'] == 2:
+                inner = QPainterPath()
+                inner.addRoundedRect(rect.adjusted(3, 3, -3, -3), radius, radius)
+                self.addPath(inner, self.pen)
+        self._add_text(style['label'], center)
+
+    def _add_text(self, text: str, center: QPointF):
+        item = self.addSimpleText(text, self.font)
+        bounds = item.boundingRect()
+        item.setPos(center.x() - bounds.width() / 2, center.y() - bounds.height() / 2)
+
+    def _draw_arrow(self, tip: QPointF, origin: QPointF):
+        angle = math.atan2(tip.y() - origin.y(), tip.x() - origin.x())
+        points = [tip] + [QPointF(tip.x() - ARROW_SIZE * math.cos(angle + spread),
+                                  tip.y() - ARROW_SIZE * math.sin(angle + spread)) for spread in (0.4, -0.4)]
+        self.addPolygon(QPolygonF(points), self.pen, QBrush(self.pen.color()))
+
+    def _draw_edge(self, source: int, target: int, label: str, has_reverse: bool):
+        path = QPainterPath()
+        if source == target:
+            # Loop above the node
+            center, (_, half_height) = self._center(source), self.sizes[source]
+            start = QPointF(center.x() - 10, center.y() - half_height + 2)
+            end = QPointF(center.x() + 10, center.y() - half_height + 2)
+            control_y = center.y() - half_height - 45
+            path.moveTo(start)
+            path.cubicTo(QPointF(center.x() - 35, control_y), QPointF(center.x() + 35, control_y), end)
+            arrow_origin = QPointF(center.x() + 20, center.y() - half_height - 20)
+        else:
+            bends: List[QPointF] = [QPointF(x, y) for x, y in self.layout.bends.get((source, target), [])]
+            if not bends and has_reverse:
+                # Edges in both directions bend away from each other
+                a, b = self._center(source), self._center(target)
+                dx, dy = b.x() - a.x(), b.y() - a.y()
+                length = math.hypot(dx, dy) or 1.0
+                middle = QPointF((a.x() + b.x()) / 2 - dy / length * 30, (a.y() + b.y()) / 2 + dx / length * 30)
+                start, end = self._boundary(source, middle), self._boundary(target, middle)
+                path.moveTo(start)
+                path.quadTo(middle, end)
+                arrow_origin = middle
+            else:
+                start = self._boundary(source, bends[0] if bends else self._center(target))
+                end = self._boundary(target, bends[-1] if bends else self._center(source))
+                path.moveTo(start)
+                for bend in bends:
+                    path.lineTo(bend)
+                path.lineTo(end)
+                arrow_origin = bends[-1] if bends else start
+        self.addPath(path, self.pen)
+        self._draw_arrow(end, arrow_origin)
+        if label:
+            anchor = path.pointAtPercent(0.5)
+            self._add_text(label, QPointF(anchor.x(), anchor.y() - 9))
+
+    def _draw_start(self, initial: int):
+        center, (half_width, _) = self._center(initial), self.sizes[initial]
+        tip = QPointF(center.x() - half_width, center.y())
+        origin = QPointF(tip.x() - 35, tip.y())
+        self.addLine(origin.x(), origin.y(), tip.x(), tip.y(), self.pen)
+        self._draw_arrow(tip, origin)
+
+    def save_image(self, path: str, scale: float = 2.0) -> str:
+        """Save the drawing as an image file, in the format given by its extension"""
+        rect = self.sceneRect()
+        image = QImage(max(1, int(rect.width() * scale)), max(1, int(rect.height() * scale)),
+                       QImage.Format.Format_ARGB32)
+        image.fill(Qt.GlobalColor.white)
+        painter = QPainter(image)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        self.render(painter)
+        painter.end()
+        if not image.save(path):
+            raise ValueError(f"Could not save the image to {path}")
+        return path
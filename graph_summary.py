@@ -0,0 +1,200 @@
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+from automata_operations import AutomataAnalyzer, AutomatonLike, CompiledAutomaton
+
+# Edges between two nodes list at most this many symbols
+MAX_LABEL_SYMBOLS = 6
+
+
+def dot_id(name: str) -> str:
+    """A name as a quoted DOT identifier"""
+    return '"' + name.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+
+def edge_label(symbols: List[str]) -> str:
+    """Label of an edge standing for the transitions on symbols, e.g. "a,b" """
+    if len(symbols) > MAX_LABEL_SYMBOLS:
+        shown = symbols[:MAX_LABEL_SYMBOLS - 1]
+        return ','.join(shown) + f',… (+{len(symbols) - len(shown)})'
+    return ','.join(symbols)
+
+
+class GraphSummary:
+    """Level-of-detail drawing of an automaton too large to be drawn state by state.
+
+    States within radius steps of the focus state (the initial state by default),
+    following transitions in either direction, are drawn individually. Every other
+    state is folded into a cluster node: one node for all the trap states (from which
+    no final state can be reached), one per remaining strongly connected component of
+    several states, while single states stay themselves. Nodes are allotted in order
+    of distance to the focus, and once max_nodes - 1 nodes are used the remaining
+    states share one "more states" node. Parallel transitions become a single edge
+    labelled with all their symbols, and edges inside a cluster are left out.
+
+    Moving the focus to a state named on a cluster expands that neighbourhood. With
+    max_nodes None every state is drawn individually.
+    """
+    TRAP, COMPONENT, STATE, OVERFLOW = 'trap', 'component', 'state', 'overflow'
+
+    def __init__(self, automaton: AutomatonLike, max_nodes: Optional[int] = 200, focus: Optional[str] = None,
+                 radius: int = 1):
+        if max_nodes is not None and max_nodes < 2:
+            raise ValueError("A graph summary needs at least 2 nodes")
+        self.automaton = CompiledAutomaton.of(automaton)
+        if focus is not None and focus not in self.automaton.state_index:
+            raise ValueError(f"Unknown state: {focus}")
+        self.max_nodes = max_nodes
+        self.focus = self.automaton.initial if focus is None else self.automaton.state_index[focus]
+        self.focused = focus is not None
+        self.radius = radius
+        self._successors, self._predecessors = self._adjacency()
+        # units[i] = (kind, member states) of node i; node_of[state] = i
+        self.units: List[Tuple[str, List[int]]] = []
+        self.node_of: List[int] = [-1] * self.automaton.num_states
+        self._build()
+        self._edges: Optional[Dict[Tuple[int, int], List[str]]] = None
+
+    def _adjacency(self) -> Tuple[List[List[int]], List[List[int]]]:
+        """Distinct successors and predecessors of every state"""
+        compiled, k = self.automaton, self.automaton.num_symbols
+        offsets, targets = compiled.offsets, compiled.targets
+        successors = [sorted(set(targets[offsets[state * k]:offsets[(state + 1) * k]]))
+                      for state in range(compiled.num_states)]
+        predecessors = [[] for _ in range(compiled.num_states)]
+        for state, state_successors in enumerate(successors):
+            for target in state_successors:
+                predecessors[target].append(state)
+        return successors, predecessors
+
+    def _groups(self) -> List[Tuple[str, int]]:
+        """(kind, group id) per state for states outside the neighbourhood"""
+        successors, predecessors, n = self._successors, self._predecessors, self.automaton.num_states
+        useful = bytearray(self.automaton.finals[:n])
+        stack = [state for state in range(n) if useful[state]]
+        while stack:
+            for source in predecessors[stack.pop()]:
+                if not useful[source]:
+                    useful[source] = 1
+                    stack.append(source)
+        groups = [(self.STATE, state) for state in range(n)]
+        for component_id, component in enumerate(AutomataAnalyzer._strongly_connected_components(successors)):
+            if len(component) > 1:
+                for state in component:
+                    groups[state] = (self.COMPONENT, component_id)
+        for state in range(n):
+            if not useful[state]:
+                groups[state] = (self.TRAP, 0)
+        return groups
+
+    def _by_distance(self) -> Tuple[List[int], List[int]]:
+        """States ordered by undirected distance to the focus (unconnected states last), and the distances"""
+        n = self.automaton.num_states
+        distance = [-1] * n
+        distance[self.focus] = 0
+        order, queue = [self.focus], deque([self.focus])
+        while queue:
+            state = queue.popleft()
+            for neighbour in self._successors[state] + self._predecessors[state]:
+                if distance[neighbour] < 0:
+                    distance[neighbour] = distance[state] + 1
+                    order.append(neighbour)
+                    queue.append(neighbour)
+        order.extend(state for state in range(n) if distance[state] < 0)
+        return order, distance
+
+    def _build(self):
+        if self.max_nodes is None:
+            self.units = [(self.STATE, [state]) for state in range(self.automaton.num_states)]
+            self.node_of = list(range(self.automaton.num_states))
+            return
+        groups = self._groups()
+        order, distance = self._by_distance()
+        node_of_group: Dict[Tuple[str, int], int] = {}
+        overflow = None
+        for state in order:
+            if 0 <= distance[state] <= self.radius:
+                group = (self.STATE, state)
+            else:
+                group = groups[state]
+            node = node_of_group.get(group)
+            if node is None:
+                if len(self.units) < self.max_nodes - 1:
+                    node = node_of_group[group] = len(self.units)
+                    self.units.append((group[0], []))
+                else:
+                    if overflow is None:
+                        overflow = len(self.units)
+                        self.units.append((self.OVERFLOW, []))
+                    node = node_of_group[group] = overflow
+            self.units[node][1].append(state)
+            self.node_of[state] = node
+
+    def edges(self) -> Dict[Tuple[int, int], List[str]]:
+        """Symbols per (source node, target node), leaving out edges inside clusters"""
+        if self._edges is not None:
+            return self._edges
+        compiled, k = self.automaton, self.automaton.num_symbols
+        offsets, targets, node_of = compiled.offsets, compiled.targets, self.node_of
+        labels: Dict[Tuple[int, int], set] = {}
+        for state in range(compiled.num_states):
+            source = node_of[state]
+            for symbol in range(k):
+                cell = state * k + symbol
+                for target in targets[offsets[cell]:offsets[cell + 1]]:
+                    edge = (source, node_of[target])
+                    if edge[0] == edge[1] and self.units[source][0] != self.STATE:
+                        continue
+                    labels.setdefault(edge, set()).add(symbol)
+        self._edges = {edge: [compiled.symbols[symbol] for symbol in sorted(symbols)]
+                       for edge, symbols in sorted(labels.items())}
+        return self._edges
+
+    def node_style(self, node: int) -> dict:
+        """How a node is drawn: label, shape (circle, box or note), peripheries (2 for nodes
+        with final states) and fillcolor (None when not filled)"""
+        kind, members = self.units[node]
+        names, finals = self.automaton.state_names, self.automaton.finals
+        if kind == self.STATE:
+            state = members[0]
+            return dict(label=names[state], shape='circle', peripheries=2 if finals[state] else 1,
+                        fillcolor='#FFF3C4' if self.focused and state == self.focus else None)
+        count = f"{len(members):,} states"
+        if kind == self.TRAP:
+            return dict(label="trap: " + count, shape='box', peripheries=1, fillcolor='#F5DDDD')
+        if kind == self.OVERFLOW:
+            return dict(label=count + " more", shape='note', peripheries=1, fillcolor='#E8E8E8')
+        # A component is named after its state closest to the focus, which can be expanded
+        return dict(label=f"{names[members[0]]} …: {count}", shape='box',
+                    peripheries=2 if any(finals[state] for state in members) else 1, fillcolor='#DDE6F5')
+
+    def _node_attributes(self, node: int) -> str:
+        style = self.node_style(node)
+        attributes = f'label={dot_id(style["label"])}'
+        if style['shape'] == 'circle':
+            attributes += ' shape=doublecircle' if style['peripheries'] == 2 else ' shape=circle'
+        else:
+            attributes += f' shape={style["shape"]}'
+        if style['fillcolor'] is not None:
+            filled = '"rounded,filled"' if style['shape'] == 'box' else 'filled'
+            attributes += f' style={filled} fillcolor="{style["fillcolor"]}"'
+        if style['shape'] != 'circle' and style['peripheries'] == 2:
+            attributes += ' peripheries=2'
+        return attributes
+
+    def to_dot(self, sfdp_threshold: int = 100) -> str:
+        """DOT text of the summary, laid out with sfdp when it has more than sfdp_threshold nodes"""
+        dot = ["digraph {",
+               "  rankdir=LR;",
+               "  node [shape=circle fontname=\"Arial\" fontsize=12];",
+               "  edge [fontname=\"Arial\" fontsize=10];"]
+        if len(self.units) > sfdp_threshold:
+            dot.append("  layout=sfdp; overlap=prism; outputorder=edgesfirst;")
+        dot.append("  start [shape=none label=\"\"];")
+        for node in range(len(self.units)):
+            dot.append(f'  n{node} [{self._node_attributes(node)}];')
+        dot.append(f'  start -> n{self.node_of[self.automaton.initial]};')
+        for (source, target), symbols in self.edges().items():
+            dot.append(f'  n{source} -> n{target} [label={dot_id(edge_label(symbols))}];')
+        dot.append("}")
+        return "\n".join(dot)
@@ -0,0 +1,265 @@
+from array import array
+from concurrent.futures import Future, ProcessPoolExecutor, wait
+from multiprocessing import resource_tracker, shared_memory
+from typing import Iterable, Iterator, List, Optional, Tuple
+import os
+
+from automata_operations import BINARY_EXTENSION, Automaton, AutomatonLike, AutomataAnalyzer, AutomataManager, CompiledAutomaton
+
+# Operations that work on compiled automata; the others receive an Automaton in the worker
+COMPILED_OPERATIONS = {
+    'is_deterministic', 'is_complete', 'nfa_to_dfa', 'is_minimal_dfa', 'minimize_dfa',
+    'compute_union', 'compute_intersection', 'compute_complement', 'are_equivalent', 'count_words',
+    'growth_summary', 'canonicalize', 'canonical_hash',
+}
+AUTOMATON_OPERATIONS = {'make_complete'}
+
+
+def _pack(compiled: CompiledAutomaton, shared_memory_threshold: Optional[int] = None) -> Tuple[dict, Optional[shared_memory.SharedMemory]]:
+    """Compact picklable form of a compiled automaton.
+
+    The transition arrays are concatenated into one buffer of native ints. Buffers of at
+    least shared_memory_threshold bytes are placed in a shared memory block instead of
+    being pickled; the block is returned so that the caller can release it.
+    """
+    if compiled.table is not None:
+        parts = [array('i', compiled.table)]
+    else:
+        parts = [array('i', compiled.offsets), array('i', compiled.targets)]
+    packed = {
+        'name': compiled.name,
+        'states': list(compiled.state_names),
+        'symbols': list(compiled.symbols),
+        'initial': compiled.initial,
+        'finals': bytes(compiled.finals),
+        'lengths': [len(part) for part in parts],
+        'data': None,
+        'shm': None,
+    }
+    size = sum(len(part) for part in parts) * array('i').itemsize
+    if shared_memory_threshold is None or size < shared_memory_threshold:
+        packed['data'] = b''.join(part.tobytes() for part in parts)
+        return packed, None
+    block = shared_memory.SharedMemory(create=True, size=max(size, 1))
+    position = 0
+    for part in parts:
+        raw = part.tobytes()
+        block.buf[position:position + len(raw)] = raw
+        position += len(raw)
+    packed['shm'] = block.name
+    return packed, block
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """Open a shared memory block created by the parent process without taking ownership of it.
+    Only the parent registers the block with the resource tracker and unlinks it."""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)  # Python 3.13+
+    except TypeError:
+        pass
+    # Before 3.13 attaching registers the block, and spawned workers share the parent's
+    # tracker, whose registration a later unregister would remove
+    register = resource_tracker.register
+    resource_tracker.register = lambda *args: None
+    try:
+        return shared_memory.SharedMemory(name=name)
+    finally:
+        resource_tracker.register = register
+
+
+def _unpack(packed: dict) -> CompiledAutomaton:
+    """Rebuild a compiled automaton from its packed form"""
+    itemsize = array('i').itemsize
+    size = sum(packed['lengths']) * itemsize
+    if packed['shm'] is not None:
+        block = _attach(packed['shm'])
+        try:
+            raw = bytes(block.buf[:size])
+        finally:
+            block.close()
+    else:
+        raw = packed['data']
+    parts, position = [], 0
+    for length in packed['lengths']:
+        part = array('i')
+        part.frombytes(raw[position:position + length * itemsize])
+        parts.append(part)
+        position += length * itemsize
+    common = dict(state_names=packed['states'], symbols=packed['symbols'], initial=packed['initial'],
+                  finals=bytearray(packed['finals']), name=packed['name'])
+    if len(parts) == 1:
+        return CompiledAutomaton(table=parts[0], **common)
+    return CompiledAutomaton(offsets=parts[0], targets=parts[1], **common)
+
+
+def _pack_result(result):
+    """Results that are automata travel back in packed form, anything else is pickled as is"""
+    if isinstance(result, Automaton):
+        result = CompiledAutomaton.from_automaton(result)
+    if isinstance(result, CompiledAutomaton):
+        return 'automaton', _pack(result)[0]
+    return 'value', result
+
+
+def _run_operation(operation: str, packed_args: List[tuple], kwargs: dict):
+    """Worker entry point: unpack the arguments, run the AutomataAnalyzer operation, pack the result"""
+    args = []
+    for kind, value in packed_args:
+        if kind == 'automaton':
+            value = _unpack(value)
+            if operation in AUTOMATON_OPERATIONS:
+                value = value.to_automaton()
+        args.append(value)
+    return _pack_result(getattr(AutomataAnalyzer, operation)(*args, **kwargs))
+
+
+def _run_on_file(operation, path: str, kwargs: dict):
+    """Worker entry point for batch jobs: load the automaton file in the worker itself.
+    Binary (.fab) and large JSON files are passed to callables in compiled form."""
+    directory, filename = os.path.split(os.path.abspath(path))
+    manager = AutomataManager(automata_dir=directory)
+    if (filename.endswith(BINARY_EXTENSION) or os.path.getsize(path) >= AutomataManager.STREAMING_THRESHOLD
+            or (not callable(operation) and operation not in AUTOMATON_OPERATIONS)):
+        automaton = manager.load_compiled(filename)
+    else:
+        automaton = manager.load_automaton(filename, preview=True)
+    try:
+        if callable(operation):
+            return _pack_result(operation(automaton, **kwargs))
+        if operation in AUTOMATON_OPERATIONS and isinstance(automaton, CompiledAutomaton):
+            return _pack_result(getattr(AutomataAnalyzer, operation)(automaton.to_automaton(), **kwargs))
+        return _pack_result(getattr(AutomataAnalyzer, operation)(automaton, **kwargs))
+    finally:
+        # The packed result is a copy, so a memory-mapped input can be released
+        if isinstance(automaton, CompiledAutomaton):
+            automaton.close()
+
+
+def _unpack_result(packed_result, compiled: bool):
+    kind, value = packed_result
+    if kind != 'automaton':
+        return value
+    result = _unpack(value)
+    return result if compiled else result.to_automaton()
+
+
+class ParallelAnalyzer:
+    """Runs AutomataAnalyzer operations in a pool of worker processes.
+
+    The pure-Python engines hold the GIL, so CPU-bound work only scales across cores in
+    separate processes. Automata are shipped as compact packed arrays rather than pickled
+    dataclasses; transition tables of at least shared_memory_threshold bytes are passed
+    through shared memory. Results come back in the representation of the first input.
+
+        with ParallelAnalyzer() as analyzer:
+            minimized = list(analyzer.map('minimize_dfa', dfas))
+    """
+    SHARED_MEMORY_THRESHOLD = 1 << 16
+
+    def __init__(self, max_workers: Optional[int] = None,
+                 shared_memory_threshold: Optional[int] = SHARED_MEMORY_THRESHOLD):
+        self.shared_memory_threshold = shared_memory_threshold
+        self.pool = ProcessPoolExecutor(max_workers=max_workers)
+
+    def __enter__(self) -> "ParallelAnalyzer":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+
+    def shutdown(self, wait: bool = True):
+        self.pool.shutdown(wait=wait, cancel_futures=not wait)
+
+    @staticmethod
+    def _check_operation(operation: str):
+        if operation not in COMPILED_OPERATIONS and operation not in AUTOMATON_OPERATIONS:
+            raise ValueError(f"Unsupported operation: {operation}")
+
+    def _pack_args(self, args: Iterable) -> Tuple[List[tuple], List[shared_memory.SharedMemory]]:
+        """Pack the automata among the positional arguments; other arguments are pickled as is"""
+        packed, blocks = [], []
+        for arg in args:
+            if isinstance(arg, (Automaton, CompiledAutomaton)):
+                item, block = _pack(CompiledAutomaton.of(arg), self.shared_memory_threshold)
+                packed.append(('automaton', item))
+                if block is not None:
+                    blocks.append(block)
+            else:
+                packed.append(('value', arg))
+        return packed, blocks
+
+    def _submit_packed(self, operation: str, packed: List[tuple], compiled: bool, kwargs: dict,
+                       blocks: List[shared_memory.SharedMemory]) -> Tuple[Future, Future]:
+        """Submit a packed call; returns the pool future and the Future of the unpacked result.
+        The blocks are released once the worker is done with them."""
+        inner = self.pool.submit(_run_operation, operation, packed, kwargs)
+        outer = Future()
+
+        def done(future):
+            if blocks:
+                self._release(blocks)
+            if future.cancelled():
+                outer.cancel()
+            elif not outer.done():
+                try:
+                    outer.set_result(_unpack_result(future.result(), compiled))
+                except BaseException as e:
+                    outer.set_exception(e)
+
+        inner.add_done_callback(done)
+        outer.add_done_callback(lambda future: future.cancelled() and inner.cancel())
+        return inner, outer
+
+    def submit(self, operation: str, *args, **kwargs) -> Future:
+        """Schedule AutomataAnalyzer.<operation>(*args, **kwargs) and return a Future of its result"""
+        self._check_operation(operation)
+        if not args or not isinstance(args[0], (Automaton, CompiledAutomaton)):
+            raise TypeError(f"{operation} takes the automaton as its first positional argument")
+        packed, blocks = self._pack_args(args)
+        return self._submit_packed(operation, packed, isinstance(args[0], CompiledAutomaton), kwargs, blocks)[1]
+
+    def map(self, operation: str, automata: Iterable[AutomatonLike], *shared, **kwargs) -> Iterator:
+        """Apply the operation to each automaton, passing the shared arguments after it
+        (for example map('are_equivalent', candidates, reference)). Shared automata are packed
+        only once. Results are yielded in input order."""
+        self._check_operation(operation)
+        shared_packed, blocks = self._pack_args(shared)
+        jobs = []
+        try:
+            for automaton in automata:
+                packed, own_blocks = self._pack_args([automaton])
+                jobs.append(self._submit_packed(operation, packed + shared_packed,
+                                                isinstance(automaton, CompiledAutomaton), kwargs, own_blocks))
+            for _, future in jobs:
+                yield future.result()
+        finally:
+            for inner, _ in jobs:
+                inner.cancel()
+            # The shared blocks stay mapped until no worker can still be reading them
+            wait([inner for inner, _ in jobs])
+            self._release(blocks)
+
+    def map_files(self, operation, paths: Iterable[str], compiled: bool = False,
+                  **kwargs) -> Iterator[Tuple[str, object, Optional[str]]]:
+        """Run a single-automaton operation on saved automaton files, each loaded by the worker.
+        The operation is an AutomataAnalyzer operation name or a module-level function taking
+        an Automaton (a CompiledAutomaton for binary and large JSON files). Yields (path, result, error) in input order; error is None on success
+        and the message of the failure otherwise, so one bad file does not stop the batch."""
+        if not callable(operation):
+            self._check_operation(operation)
+        jobs = [(path, self.pool.submit(_run_on_file, operation, path, kwargs)) for path in paths]
+        for path, future in jobs:
+            try:
+                yield path, _unpack_result(future.result(), compiled), None
+            except Exception as e:
+                yield path, None, str(e)
+
+    @staticmethod
+    def _release(blocks: List[shared_memory.SharedMemory]):
+        for block in blocks:
+            try:
+                block.close()
+                block.unlink()
+            except FileNotFoundError:
+                pass
+        blocks.clear()
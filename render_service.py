@@ -0,0 +1,199 @@
+from concurrent.futures import Future
+from typing import List, Optional
+import multiprocessing
+import os
+import queue
+import shutil
+import signal
+import threading
+
+
+class RenderError(Exception):
+    """Raised when a layout fails, times out or exceeds its memory limit"""
+
+
+def render_dot(dot_text: str, format: str = 'svg') -> bytes:
+    """Lay out and render DOT text. Uses the Graphviz C library through pygraphviz when it
+    is installed, otherwise the graphviz package, which runs one dot process per call.
+    The layout engine is the graph's layout attribute (dot when unset)."""
+    try:
+        import pygraphviz
+    except ImportError:
+        import graphviz
+        return graphviz.Source(dot_text).pipe(format=format)
+    graph = pygraphviz.AGraph(string=dot_text)
+    return graph.draw(format=format, prog=graph.graph_attr.get('layout') or 'dot')
+
+
+def pygraphviz_available() -> bool:
+    """Whether the Graphviz C library can be loaded through pygraphviz. Only then does a
+    RenderService save anything: without it each render still runs a dot process."""
+    try:
+        import pygraphviz
+        return True
+    except ImportError:
+        return False
+
+
+def graphviz_available() -> bool:
+    """Whether render_dot can run: pygraphviz, or the graphviz package with dot on the PATH"""
+    if pygraphviz_available():
+        return True
+    try:
+        import graphviz
+    except ImportError:
+        return False
+    return shutil.which('dot') is not None
+
+
+def _serve(connection, memory_limit: Optional[int]):
+    """Worker process loop: render the (dot_text, format) requests received on the
+    connection, answering (True, data) or (False, error message), until it is closed"""
+    if hasattr(os, 'setpgrp'):
+        # Own process group, so that killing the worker also kills its dot processes
+        os.setpgrp()
+    if memory_limit:
+        try:
+            import resource
+            resource.setrlimit(resource.RLIMIT_AS, (memory_limit, memory_limit))
+        except (ImportError, ValueError, OSError):
+            # Not enforceable on this platform; the timeout still applies
+            pass
+    while True:
+        try:
+            dot_text, format = connection.recv()
+        except (EOFError, OSError):
+            return
+        try:
+            reply = (True, render_dot(dot_text, format))
+        except MemoryError:
+            reply = (False, "Layout exceeded the memory limit")
+        except Exception as e:
+            reply = (False, str(e))
+        connection.send(reply)
+
+
+class RenderService:
+    """Renders DOT text in long-lived worker processes.
+
+    Each of the worker processes keeps the Graphviz C library loaded through pygraphviz
+    and takes renders from a shared job queue, so a batch of renders does not pay for
+    starting a process per graph. Without pygraphviz the workers run one dot process per
+    render (see pygraphviz_available()) and only the isolation below remains. A render running longer than timeout
+    seconds is abandoned and its worker restarted; workers run with their address space
+    limited to memory_limit bytes, so a runaway layout fails with a RenderError instead
+    of exhausting the machine. Workers are started on first use.
+
+    Enable it for Visualizer with
+        if pygraphviz_available():
+            Visualizer.render_service = RenderService()
+    """
+    def __init__(self, workers: int = 1, timeout: Optional[float] = 60.0, memory_limit: Optional[int] = 2 << 30):
+        if workers < 1:
+            raise ValueError("A render service needs at least one worker")
+        self.workers = workers
+        self.timeout = timeout
+        self.memory_limit = memory_limit
+        # A fresh interpreter per worker: a forked GUI process could not be limited in memory
+        self._context = multiprocessing.get_context('spawn')
+        self._jobs: "queue.Queue" = queue.Queue()
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def __enter__(self) -> "RenderService":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+
+    def submit(self, dot_text: str, format: str = 'svg', timeout: Optional[float] = None) -> Future:
+        """Queue a render and return a Future of the rendered bytes.
+        timeout overrides the service timeout for this render."""
+        future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("The render service has been shut down")
+            if not self._threads:
+                for _ in range(self.workers):
+                    thread = threading.Thread(target=self._dispatch, name="RenderService", daemon=True)
+                    thread.start()
+                    self._threads.append(thread)
+            self._jobs.put((future, dot_text, format, self.timeout if timeout is None else timeout))
+        return future
+
+    def render(self, dot_text: str, format: str = 'svg', timeout: Optional[float] = None) -> bytes:
+        """Render DOT text and wait for the result. Raises RenderError if the render fails."""
+        return self.submit(dot_text, format, timeout).result()
+
+    def shutdown(self, wait: bool = True):
+        """Stop the workers once the queued renders are done, or cancel them unless wait"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            if not wait:
+                while True:
+                    try:
+                        job = self._jobs.get_nowait()
+                    except queue.Empty:
+                        break
+                    job[0].cancel()
+            for _ in self._threads:
+                self._jobs.put(None)
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+    def _start_worker(self):
+        parent, child = self._context.Pipe()
+        process = self._context.Process(target=_serve, args=(child, self.memory_limit), daemon=True)
+        process.start()
+        child.close()
+        return process, parent
+
+    @staticmethod
+    def _stop_worker(process, connection, kill: bool = False):
+        connection.close()
+        if not kill:
+            process.join(1)
+        if process.is_alive():
+            try:
+                os.killpg(process.pid, signal.SIGKILL)
+            except (AttributeError, OSError):
+                process.kill()
+        process.join()
+
+    def _dispatch(self):
+        """Feed queued renders to one worker, restarting it after a timeout or a crash"""
+        process = connection = None
+        try:
+            while True:
+                job = self._jobs.get()
+                if job is None:
+                    return
+                future, dot_text, format, timeout = job
+                if not future.set_running_or_notify_cancel():
+                    continue
+                if process is None:
+                    process, connection = self._start_worker()
+                try:
+                    connection.send((dot_text, format))
+                    if connection.poll(timeout):
+                        ok, value = connection.recv()
+                    else:
+                        self._stop_worker(process, connection, kill=True)
+                        process = None
+                        ok, value = False, f"Layout timed out after {timeout:g} s"
+                except (EOFError, OSError):
+                    self._stop_worker(process, connection)
+                    ok, value = False, (f"Layout worker exited with code {process.exitcode} "
+                                        "(out of memory or a Graphviz crash)")
+                    process = None
+                if ok:
+                    future.set_result(value)
+                else:
+                    future.set_exception(RenderError(value))
+        finally:
+            if process is not None:
+                self._stop_worker(process, connection)
@@ -0,0 +1,123 @@
+from array import array
+from typing import Optional, Sequence
+import hashlib
+import json
+import os
+import sqlite3
+import struct
+import time
+
+from automata_operations import CompiledAutomaton
+
+RESULT_CACHE_FILENAME = ".results.sqlite"
+
+
+class ResultCache:
+    """Persistent, size-bounded LRU cache of automata derived by AutomataAnalyzer.
+
+    Entries are keyed by the operation, the fingerprints of the input automata and the
+    operation parameters, so a result is found again whatever the automaton is called or
+    where it was loaded from; the caller renames hits after its own conventions. When the
+    stored results exceed max_bytes the least recently used ones are evicted.
+
+    Enable it for every analyzer operation with
+        AutomataAnalyzer.result_cache = ResultCache(path)
+    """
+    def __init__(self, db_path: str, max_bytes: int = 256 << 20):
+        self.db_path = db_path
+        self.max_bytes = max_bytes
+        self._init_db()
+
+    def _init_db(self):
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute('''CREATE TABLE IF NOT EXISTS results
+                         (key TEXT PRIMARY KEY,
+                          operation TEXT NOT NULL,
+                          data BLOB NOT NULL,
+                          size INTEGER NOT NULL,
+                          last_used REAL NOT NULL)''')
+            conn.execute('CREATE INDEX IF NOT EXISTS results_by_use ON results (last_used)')
+            conn.commit()
+
+    @staticmethod
+    def key(operation: str, inputs: Sequence[CompiledAutomaton], params: tuple = ()) -> str:
+        """Cache key of an operation applied to compiled automata with the given parameters"""
+        description = json.dumps([operation, [automaton.fingerprint() for automaton in inputs], list(params)])
+        return hashlib.sha256(description.encode()).hexdigest()
+
+    @staticmethod
+    def encode(automaton: CompiledAutomaton) -> bytes:
+        """Length-prefixed JSON header followed by the finals and the transition arrays"""
+        if automaton.table is not None:
+            parts = [array('i', automaton.table)]
+        else:
+            parts = [array('i', automaton.offsets), array('i', automaton.targets)]
+        header = json.dumps({
+            'name': automaton.name,
+            'states': list(automaton.state_names),
+            'symbols': list(automaton.symbols),
+            'initial': automaton.initial,
+            'lengths': [len(part) for part in parts],
+        }).encode()
+        return b''.join([struct.pack('<I', len(header)), header, bytes(automaton.finals)]
+                        + [part.tobytes() for part in parts])
+
+    @staticmethod
+    def decode(data: bytes) -> CompiledAutomaton:
+        (header_size,) = struct.unpack_from('<I', data)
+        header = json.loads(data[4:4 + header_size])
+        position = 4 + header_size
+        finals = bytearray(data[position:position + len(header['states'])])
+        position += len(finals)
+        parts = []
+        for length in header['lengths']:
+            part = array('i')
+            part.frombytes(data[position:position + length * part.itemsize])
+            parts.append(part)
+            position += length * part.itemsize
+        common = dict(state_names=header['states'], symbols=header['symbols'], initial=header['initial'],
+                      finals=finals, name=header['name'])
+        if len(parts) == 1:
+            return CompiledAutomaton(table=parts[0], **common)
+        return CompiledAutomaton(offsets=parts[0], targets=parts[1], **common)
+
+    def get(self, key: str) -> Optional[CompiledAutomaton]:
+        """The cached result for a key, or None; a hit marks the entry as recently used"""
+        with sqlite3.connect(self.db_path) as conn:
+            row = conn.execute('SELECT data FROM results WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                return None
+            conn.execute('UPDATE results SET last_used = ? WHERE key = ?', (time.time(), key))
+            conn.commit()
+        return self.decode(row[0])
+
+    def put(self, key: str, operation: str, automaton: CompiledAutomaton):
+        """Store a result, evicting least recently used entries beyond max_bytes.
+        Results larger than the whole cache are not stored."""
+        data = self.encode(automaton)
+        if len(data) > self.max_bytes:
+            return
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute('INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)',
+                         (key, operation, data, len(data), time.time()))
+            total = conn.execute('SELECT COALESCE(SUM(size), 0) FROM results').fetchone()[0]
+            if total > self.max_bytes:
+                evicted = []
+                for old_key, size in conn.execute('SELECT key, size FROM results ORDER BY last_used'):
+                    if total <= self.max_bytes:
+                        break
+                    if old_key != key:
+                        evicted.append((old_key,))
+                        total -= size
+                conn.executemany('DELETE FROM results WHERE key = ?', evicted)
+            conn.commit()
+
+    def clear(self):
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute('DELETE FROM results')
+            conn.commit()
+
+    @staticmethod
+    def for_directory(automata_dir: str, max_bytes: int = 256 << 20) -> "ResultCache":
+        """The cache kept alongside the automata of a directory"""
+        return ResultCache(os.path.join(automata_dir, RESULT_CACHE_FILENAME), max_bytes=max_bytes)
@@ -0,0 +1,352 @@
+from array import array
+from typing import Callable, Dict, Iterator, List, Optional
+import codecs
+import json
+import os
+import re
+
+from automata_operations import CompiledAutomaton
+
+_STRING_BODY = r'[^"\\]*(?:\\.[^"\\]*)*'
+_STRING = re.compile(rf'\s*"({_STRING_BODY})"', re.S)
+# A string item of an array, followed by the separator or the closing bracket
+_ITEM = re.compile(rf'\s*"({_STRING_BODY})"\s*([,\]])', re.S)
+# A whole transitions entry "state,symbol": ["target", ...] followed by its separator
+_ENTRY = re.compile(rf'\s*"({_STRING_BODY})"\s*:\s*\[\s*((?:"{_STRING_BODY}"(?:\s*,\s*"{_STRING_BODY}")*)?)\s*\]\s*([,}}])',
+                    re.S)
+_QUOTED = re.compile(rf'"({_STRING_BODY})"', re.S)
+_WHITESPACE = re.compile(r'\s*')
+
+REQUIRED_FIELDS = ['name', 'states', 'alphabet', 'transitions', 'initial_state', 'final_states']
+
+
+class _JsonReader:
+    """Pull tokens from a UTF-8 JSON file read in chunks.
+    Strings in arrays and field names are limited to MAX_TOKEN characters."""
+    MAX_TOKEN = 1 << 20
+
+    def __init__(self, f, total_size: int, progress: Optional[Callable], chunk_size: int):
+        self.f = f
+        self.total_size = total_size
+        self.progress = progress
+        self.chunk_size = chunk_size
+        self.decoder = codecs.getincrementaldecoder('utf-8')()
+        self.buffer = ''
+        self.pos = 0
+        self.bytes_read = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        """Append the next chunk to the buffer. Returns False at the end of the file."""
+        if self.eof:
+            return False
+        data = self.f.read(self.chunk_size)
+        self.bytes_read += len(data)
+        self.eof = not data
+        self.buffer = self.buffer[self.pos:] + self.decoder.decode(data, final=self.eof)
+        self.pos = 0
+        if self.progress is not None:
+            self.progress(self.bytes_read, self.total_size)
+        return True
+
+    def error(self, message: str) -> ValueError:
+        return ValueError(f"{message} (near byte {max(self.bytes_read - len(self.buffer) + self.pos, 0):,})")
+
+    def peek(self) -> str:
+        """Next non-whitespace character, or '' at the end of the file"""
+        while True:
+            self.pos = _WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer) or not self.fill():
+                return self.buffer[self.pos:self.pos + 1]
+
+    def expect(self, char: str, message: Optional[str] = None):
+        if self.peek() != char:
+            raise self.error(message or f"Expected '{char}'")
+        self.pos += 1
+
+    def _match(self, pattern):
+        """Match pattern at the current position, reading more of the file if the token may be cut"""
+        match = pattern.match(self.buffer, self.pos)
+        if match is not None:
+            return match
+        # Whitespace does not count towards the token size limit
+        self.peek()
+        while True:
+            match = pattern.match(self.buffer, self.pos)
+            if match is not None or len(self.buffer) - self.pos >= self.MAX_TOKEN or not self.fill():
+                return match
+
+    @staticmethod
+    def _unescape(raw: str) -> str:
+        return json.loads(f'"{raw}"') if '\\' in raw else raw
+
+    def string(self, message: str = "Expected a string") -> str:
+        match = self._match(_STRING)
+        if match is None:
+            raise self.error(message)
+        self.pos = match.end()
+        return self._unescape(match.group(1))
+
+    def strings(self, message: str) -> Iterator[str]:
+        """Iterate over an array of strings"""
+        self.expect('[', message)
+        if self.peek() == ']':
+            self.pos += 1
+            return
+        while True:
+            match = self._match(_ITEM)
+            if match is not None:
+                self.pos = match.end()
+                yield self._unescape(match.group(1))
+                separator = match.group(2)
+            else:
+                yield self.string(message)
+                separator = self.peek()
+                self.pos += 1
+                if separator not in (',', ']'):
+                    raise self.error(message)
+            if separator == ']':
+                return
+
+    def value(self):
+        """Any JSON value, decoded whole"""
+        decoder = json.JSONDecoder()
+        while True:
+            self.peek()
+            try:
+                value, end = decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                value, end = None, None
+            # A value ending with the buffer may continue in the next chunk (numbers)
+            if end is not None and (end < len(self.buffer) or self.eof):
+                self.pos = end
+                return value
+            if not self.fill():
+                raise self.error("Invalid JSON value")
+
+
+class _Interner:
+    """Dense ids for names in first-seen order, with the names declared by the file flagged"""
+    def __init__(self):
+        self.index: Dict[str, int] = {}
+        self.names: List[str] = []
+        self.declared = bytearray()
+
+    def __call__(self, name: str) -> int:
+        idx = self.index.get(name)
+        if idx is None:
+            idx = self.index[name] = len(self.names)
+            self.names.append(name)
+            self.declared.append(0)
+        return idx
+
+    def declare(self, name: str):
+        self.declared[self(name)] = 1
+
+    def sorted_ranks(self) -> array:
+        """Position of every id in sorted name order"""
+        ranks = array('i', [0]) * len(self.names)
+        for rank, idx in enumerate(sorted(range(len(self.names)), key=self.names.__getitem__)):
+            ranks[idx] = rank
+        return ranks
+
+
+class StreamingLoader:
+    """Load an automaton JSON file without holding the document in memory.
+
+    The file is read in chunks and tokenized incrementally; state names and symbols are
+    interned to ints as they appear and transitions are collected in flat int arrays,
+    so memory stays close to the size of the compiled automaton rather than several
+    times the size of the file. The fields are validated as they are read (states and
+    symbols are checked on the spot once their declaring list has been read, at the end
+    otherwise). The result is identical to compiling what AutomataManager.load_automaton
+    returns; in particular a transition key repeated in the file keeps its last entry,
+    as with json.load.
+
+        automaton = StreamingLoader.load(path, progress=lambda done, total: ...)
+
+    progress(bytes_read, total_bytes) is called after each chunk and may raise to cancel.
+    """
+    CHUNK_SIZE = 1 << 20
+
+    @staticmethod
+    def load(path: str, progress: Optional[Callable] = None, chunk_size: int = CHUNK_SIZE) -> CompiledAutomaton:
+        with open(path, 'rb') as f:
+            reader = _JsonReader(f, os.fstat(f.fileno()).st_size, progress, chunk_size)
+            return StreamingLoader._read(reader)
+
+    @staticmethod
+    def _read(reader: _JsonReader) -> CompiledAutomaton:
+        states, symbols = _Interner(), _Interner()
+        sources, labels, targets = array('i'), array('i'), array('i')
+        # Flags the first transition of each entry, so that a repeated key replaces the earlier ones
+        firsts = bytearray()
+        finals: List[int] = []
+        fields = {}
+
+        def check_state(name: str, message: str) -> int:
+            idx = states(name)
+            if 'states' in fields and not states.declared[idx]:
+                raise ValueError(message)
+            return idx
+
+        reader.expect('{', "The file does not contain a JSON object")
+        if reader.peek() == '}':
+            reader.pos += 1
+        else:
+            while True:
+                field = reader.string("Expected a field name")
+                reader.expect(':')
+                if field == 'states':
+                    for name in reader.strings("States must be a list"):
+                        states.declare(name)
+                elif field == 'alphabet':
+                    for name in reader.strings("Alphabet must be a list"):
+                        symbols.declare(name)
+                elif field == 'final_states':
+                    for name in reader.strings("Final states must be a list"):
+                        finals.append(check_state(name, "Final states must be a subset of states"))
+                elif field == 'initial_state':
+                    fields['initial'] = check_state(reader.string("Initial state must be a string"),
+                                                    "Initial state must be in states set")
+                elif field == 'transitions':
+                    StreamingLoader._read_transitions(reader, fields, states, symbols, sources, labels, targets, firsts)
+                else:
+                    fields[field] = reader.value()
+                fields.setdefault(field, None)
+                separator = reader.peek()
+                reader.pos += 1
+                if separator == '}':
+                    break
+                if separator != ',':
+                    raise reader.error("Expected ',' or '}'")
+        if reader.peek():
+            raise reader.error("Unexpected data after the automaton")
+
+        for field in REQUIRED_FIELDS:
+            if field not in fields:
+                raise ValueError(f"Missing required field: {field}")
+        if not all(states.declared):
+            undeclared = states.names[states.declared.index(0)]
+            if undeclared == states.names[fields['initial']]:
+                raise ValueError("Initial state must be in states set")
+            if states.index[undeclared] in finals:
+                raise ValueError("Final states must be a subset of states")
+            raise ValueError(f"Invalid state in transition: {undeclared}")
+        if not all(symbols.declared):
+            raise ValueError(f"Invalid symbol in transition: {symbols.names[symbols.declared.index(0)]}")
+        return StreamingLoader._compile(fields['name'], states, symbols, fields['initial'], finals,
+                                        sources, labels, targets, firsts)
+
+    @staticmethod
+    def _read_transitions(reader: _JsonReader, fields: dict, states: _Interner, symbols: _Interner,
+                          sources: array, labels: array, targets: array, firsts: bytearray):
+        """Read the transitions object into parallel source / symbol / target arrays.
+        An entry with no targets is recorded as one transition to -1."""
+        reader.expect('{', "Transitions must be a dictionary")
+        if reader.peek() == '}':
+            reader.pos += 1
+            return
+        check_states, check_symbols = 'states' in fields, 'alphabet' in fields
+        unescape = reader._unescape
+        while True:
+            # Fast path: the whole entry in one match; entries cut by the end of the buffer
+            # or malformed ones go through the token-by-token path for precise errors
+            match = reader._match(_ENTRY)
+            if match is not None:
+                reader.pos = match.end()
+                key = unescape(match.group(1))
+                names = [unescape(name) for name in _QUOTED.findall(match.group(2))]
+                separator = match.group(3)
+            else:
+                key = reader.string("Expected a transition key")
+                reader.expect(':')
+                names = reader.strings(f"Invalid transition format: {key}. Targets must be a list")
+                separator = None
+            if ',' not in key:
+                raise ValueError(f"Invalid transition format: {key}")
+            # Split from the right once to handle states that contain commas
+            state, symbol = key.rsplit(',', 1)
+            source, label = states(state), symbols(symbol)
+            if check_states and not states.declared[source]:
+                raise ValueError(f"Invalid transition format: {key}. Invalid source state in transition: {state}")
+            if check_symbols and not symbols.declared[label]:
+                raise ValueError(f"Invalid transition format: {key}. Invalid symbol in transition: {symbol}")
+            first = 1
+            for name in names:
+                target = states(name)
+                if check_states and not states.declared[target]:
+                    raise ValueError(f"Invalid transition format: {key}. "
+                                     f"Invalid target state(s) in transition from {state} on {symbol}")
+                sources.append(source)
+                labels.append(label)
+                targets.append(target)
+                firsts.append(first)
+                first = 0
+            if first:
+                sources.append(source)
+                labels.append(label)
+                targets.append(-1)
+                firsts.append(1)
+            if separator is None:
+                separator = reader.peek()
+                reader.pos += 1
+            if separator == '}':
+                return
+            if separator != ',':
+                raise reader.error("Expected ',' or '}' in transitions")
+
+    @staticmethod
+    def _compile(name, states: _Interner, symbols: _Interner, initial: int, finals: List[int],
+                 sources: array, labels: array, targets: array, firsts: bytearray) -> CompiledAutomaton:
+        """Renumber states and symbols in sorted name order and pack the transitions"""
+        state_ranks, symbol_ranks = states.sorted_ranks(), symbols.sorted_ranks()
+        k = len(symbols.names)
+        num_cells = len(states.names) * k
+
+        # Counting sort of the transitions by cell
+        cells = array('i', [state_ranks[source] * k + symbol_ranks[label] for source, label in zip(sources, labels)])
+        starts = array('i', [0]) * (num_cells + 1)
+        for cell in cells:
+            starts[cell + 1] += 1
+        for cell in range(num_cells):
+            starts[cell + 1] += starts[cell]
+        placed = array('i', [0]) * len(cells)
+        placed_firsts = bytearray(len(cells))
+        fill = starts[:-1]
+        for cell, target, first in zip(cells, targets, firsts):
+            placed[fill[cell]] = state_ranks[target] if target >= 0 else -1
+            placed_firsts[fill[cell]] = first
+            fill[cell] += 1
+        del cells, fill
+
+        # Sort and deduplicate the targets of each cell
+        offsets = array('i', [0]) * (num_cells + 1)
+        flat = array('i')
+        deterministic = True
+        for cell in range(num_cells):
+            start, end = starts[cell], starts[cell + 1]
+            if end - start > 1:
+                # The sort is stable, so the entries of a repeated key are in file order: keep the last
+                start = placed_firsts.rindex(1, start, end)
+            if end - start == 1:
+                if placed[start] >= 0:
+                    flat.append(placed[start])
+            elif end > start:
+                cell_targets = sorted(set(placed[start:end]))
+                deterministic = deterministic and len(cell_targets) == 1
+                flat.extend(cell_targets)
+            offsets[cell + 1] = len(flat)
+
+        final_flags = bytearray(len(states.names))
+        for state in finals:
+            final_flags[state_ranks[state]] = 1
+        common = dict(state_names=sorted(states.names), symbols=sorted(symbols.names),
+                      initial=state_ranks[initial], finals=final_flags, name=name)
+        if not deterministic:
+            return CompiledAutomaton(offsets=offsets, targets=flat, **common)
+        table = array('i', [-1]) * num_cells
+        for cell in range(num_cells):
+            if offsets[cell] < offsets[cell + 1]:
+                table[cell] = flat[offsets[cell]]
+        return CompiledAutomaton(table=table, **common)
@@ -0,0 +1,101 @@
+from collections import OrderedDict
+from typing import Optional
+import hashlib
+import os
+import threading
+
+SVG_CACHE_DIRNAME = ".svg_cache"
+
+
+class SvgCache:
+    """Cache of Graphviz renderings keyed by the hash of their DOT text.
+
+    The most recently used renderings are kept in memory (max_entries of them); every
+    rendering is also written to cache_dir, which is trimmed to max_bytes by evicting the
+    files least recently used. Since the key is the DOT text itself, an unchanged
+    automaton is never laid out twice, even across sessions.
+
+    Enable it for Visualizer with
+        Visualizer.svg_cache = SvgCache(path)
+    """
+    def __init__(self, cache_dir: str, max_entries: int = 32, max_bytes: int = 64 << 20):
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(dot: str, format: str = 'svg', engine: str = 'dot') -> str:
+        """Cache key of the rendering of DOT text in a format with a layout engine"""
+        return hashlib.sha256(f"{engine}\0{format}\0{dot}".encode('utf-8')).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key)
+
+    def get(self, key: str) -> Optional[bytes]:
+        """The cached rendering for a key, or None"""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+        try:
+            with open(self._path(key), 'rb') as f:
+                data = f.read()
+            # The modification time orders the files for eviction
+            os.utime(self._path(key))
+        except OSError:
+            return None
+        self._remember(key, data)
+        return data
+
+    def put(self, key: str, data: bytes):
+        """Store a rendering. Renderings larger than the whole cache are only kept in memory."""
+        self._remember(key, data)
+        if len(data) > self.max_bytes:
+            return
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            temporary = f"{self._path(key)}.{os.getpid()}.tmp"
+            with open(temporary, 'wb') as f:
+                f.write(data)
+            os.replace(temporary, self._path(key))
+            self._trim()
+        except OSError:
+            # A read-only or full disk only costs the persistence
+            pass
+
+    def _remember(self, key: str, data: bytes):
+        with self._lock:
+            self._entries[key] = data
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _trim(self):
+        with os.scandir(self.cache_dir) as entries:
+            files = [(entry.stat().st_mtime_ns, entry.stat().st_size, entry.path)
+                     for entry in entries if entry.is_file() and not entry.name.endswith('.tmp')]
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            total -= size
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+        if os.path.isdir(self.cache_dir):
+            with os.scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        os.remove(entry.path)
+
+    @staticmethod
+    def for_directory(automata_dir: str, max_bytes: int = 64 << 20) -> "SvgCache":
+        """The cache kept alongside the automata of a directory"""
+        return SvgCache(os.path.join(automata_dir, SVG_CACHE_DIRNAME), max_bytes=max_bytes)
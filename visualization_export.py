@@ -0,0 +1,184 @@
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+import hashlib
+import json
+import os
+
+from automata_operations import AutomataManager, AutomatonLike, CompiledAutomaton, Visualizer
+
+EXPORT_FORMATS = ('svg', 'png', 'pdf')
+MANIFEST_FILENAME = ".exports.json"
+
+
+def export_dot(automaton: AutomatonLike) -> str:
+    """DOT text of an exported automaton. Module-level so that it can run in ParallelAnalyzer workers."""
+    return Visualizer.to_dot(automaton)
+
+
+class VisualizationExporter:
+    """Renders automaton files to image files in output_dir, each named after its source
+    file (EvenZeros.json -> EvenZeros.svg).
+
+    Files are loaded and converted to DOT in ParallelAnalyzer workers, and the layouts run
+    in a RenderService with as many workers. The manifest of output_dir records the
+    content hash of the source of every export; files whose hash matches their existing
+    exports are skipped, so exporting a whole library again only renders what changed.
+
+        VisualizationExporter("figures", formats=('svg', 'pdf')).export(paths)
+    """
+    def __init__(self, output_dir: str, formats: Iterable[str] = ('svg',), max_workers: Optional[int] = None,
+                 timeout: Optional[float] = 60.0):
+        self.formats = list(dict.fromkeys(formats))
+        for format in self.formats:
+            if format not in EXPORT_FORMATS:
+                raise ValueError(f"Unsupported export format: {format}")
+        self.output_dir = output_dir
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.manifest_path = os.path.join(output_dir, MANIFEST_FILENAME)
+
+    @staticmethod
+    def content_hash(path: str) -> str:
+        """Hash of a source file together with the drawing settings its exports depend on"""
+        digest = hashlib.sha256(b'visualization-export-1')
+        digest.update(json.dumps([Visualizer.MAX_RENDERED_NODES, Visualizer.SFDP_THRESHOLD]).encode())
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _load_manifest(self) -> Dict[str, str]:
+        try:
+            with open(self.manifest_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_manifest(self, manifest: Dict[str, str]):
+        temporary = self.manifest_path + '.tmp'
+        with open(temporary, 'w') as f:
+            json.dump(manifest, f, indent=1, sort_keys=True)
+        os.replace(temporary, self.manifest_path)
+
+    def export(self, paths: Iterable[str], force: bool = False,
+               progress=None) -> List[Tuple[str, List[str], Optional[str]]]:
+        """Export automaton files, rendering only the outputs that are missing or whose source
+        content hash differs from the one recorded in the manifest, unless force. Returns
+        (path, outputs written, error) per file in input order; error is None on success and
+        the message of the failure otherwise. Each output is written as soon as its render
+        completes; progress(done, pending) is called after each file and may raise to stop,
+        and the exports done so far are kept."""
+        paths = list(paths)
+        os.makedirs(self.output_dir, exist_ok=True)
+        manifest = self._load_manifest()
+        results = {path: ([], None) for path in paths}
+        stale: Dict[str, Tuple[str, List[str]]] = {}
+        claimed = {}
+        for path in paths:
+            stem = os.path.splitext(os.path.basename(path))[0]
+            if claimed.setdefault(stem, path) != path:
+                results[path] = ([], f"Another input is exported as {stem}")
+                continue
+            try:
+                digest = self.content_hash(path)
+            except OSError as e:
+                results[path] = ([], str(e))
+                continue
+            outputs = [f"{stem}.{format}" for format in self.formats]
+            missing = [output for output in outputs if force or manifest.get(output) != digest
+                       or not os.path.exists(os.path.join(self.output_dir, output))]
+            if missing:
+                stale[path] = (digest, missing)
+
+        done, total = len(paths) - len(stale), len(paths)
+        if progress is not None and done:
+            progress(done, total - done)
+        from render_service import RenderService
+        workers = self.max_workers or os.cpu_count() or 1
+        service = RenderService(workers=workers, timeout=self.timeout)
+        # Renders queued at once: enough to keep every worker busy without holding the
+        # DOT text and output of the whole batch in memory
+        max_in_flight = 2 * workers
+        in_flight: Dict[Future, Tuple[str, str]] = {}
+        unfinished: Dict[str, int] = {}
+        dots = self._dots(list(stale))
+
+        def file_done():
+            nonlocal done
+            done += 1
+            if progress is not None:
+                progress(done, total - done)
+
+        try:
+            dots_left = True
+            while dots_left or in_flight:
+                while dots_left and len(in_flight) < max_in_flight:
+                    entry = next(dots, None)
+                    if entry is None:
+                        dots_left = False
+                        break
+                    path, dot_text, error = entry
+                    if error is not None:
+                        results[path] = ([], error)
+                        file_done()
+                        continue
+                    unfinished[path] = len(stale[path][1])
+                    for output in stale[path][1]:
+                        in_flight[service.submit(dot_text, output.rsplit('.', 1)[1])] = (path, output)
+                if not in_flight:
+                    continue
+                finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    path, output = in_flight.pop(future)
+                    written, error = results[path]
+                    try:
+                        self._write(output, future.result())
+                    except Exception as e:
+                        # The other outputs of the file are still written; the first failure is reported
+                        results[path] = (written, error or f"{output}: {e}")
+                    else:
+                        manifest[output] = stale[path][0]
+                        written.append(os.path.join(self.output_dir, output))
+                    unfinished[path] -= 1
+                    if not unfinished[path]:
+                        del unfinished[path]
+                        file_done()
+        finally:
+            dots.close()
+            service.shutdown(wait=False)
+            self._save_manifest(manifest)
+        return [(path, *results[path]) for path in paths]
+
+    def _write(self, output: str, data: bytes):
+        path = os.path.join(self.output_dir, output)
+        with open(path + '.tmp', 'wb') as f:
+            f.write(data)
+        os.replace(path + '.tmp', path)
+
+    def _dots(self, paths: List[str]) -> Iterator[Tuple[str, Optional[str], Optional[str]]]:
+        """Yield (path, DOT text, error) for each file"""
+        if len(paths) > 1 and self.max_workers != 1:
+            from parallel_analyzer import ParallelAnalyzer
+            analyzer = ParallelAnalyzer(max_workers=self.max_workers)
+            try:
+                yield from analyzer.map_files(export_dot, paths)
+            finally:
+                analyzer.shutdown(wait=False)
+            return
+        for path in paths:
+            directory, filename = os.path.split(os.path.abspath(path))
+            manager = AutomataManager(automata_dir=directory)
+            try:
+                if os.path.getsize(path) >= AutomataManager.STREAMING_THRESHOLD or not filename.endswith('.json'):
+                    automaton = manager.load_compiled(filename)
+                else:
+                    automaton = manager.load_automaton(filename, preview=True)
+                try:
+                    dot = export_dot(automaton)
+                finally:
+                    if isinstance(automaton, CompiledAutomaton):
+                        automaton.close()
+            except Exception as e:
+                yield path, None, str(e)
+                continue
+            yield path, dot, None